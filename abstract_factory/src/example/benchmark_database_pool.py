@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.example.cloud_service import AWSFactory, AZUREFactory, GCPFactory
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+QUERIES = 600           # per provider
+CONCURRENCY = 30        # callers per provider
+QUERY_LATENCY = 0.002   # round trip of one query
+# Seconds for a full connect (TCP + TLS + auth) to each provider's database
+CONNECT_LATENCY = {"AWS": 0.020, "GCP": 0.015, "Azure": 0.025}
+
+
+async def query(database):
+    await asyncio.sleep(QUERY_LATENCY)
+    return database.execute("SELECT 1")
+
+
+# Today's path: every caller gets a fresh database from the factory and connects it
+async def connect_per_query(factory):
+    loop = asyncio.get_running_loop()
+
+    async def caller(n):
+        for _ in range(n):
+            database = factory.get_database(connect_latency=CONNECT_LATENCY[factory.name])
+            await loop.run_in_executor(None, database.connect_to_db)
+            await query(database)
+            database.close()
+
+    await asyncio.gather(*(caller(QUERIES // CONCURRENCY) for _ in range(CONCURRENCY)))
+    return QUERIES, None
+
+
+async def pooled(factory, **options):
+    pool = factory.database_pool(database_options={"connect_latency": CONNECT_LATENCY[factory.name]}, **options)
+
+    async def caller(n):
+        for _ in range(n):
+            try:
+                async with pool.connection() as database:
+                    await query(database)
+            except asyncio.TimeoutError:
+                pass
+
+    await asyncio.gather(*(caller(QUERIES // CONCURRENCY) for _ in range(CONCURRENCY)))
+    await pool.close()
+    return pool.stats.created, pool.stats
+
+
+async def run(label, strategy, **options):
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=64))
+    factories = [AWSFactory(), GCPFactory(), AZUREFactory()]
+    start = time.perf_counter()
+    # Each provider has its own pool; all three are driven at once
+    results = await asyncio.gather(*(strategy(factory, **options) for factory in factories))
+    elapsed = time.perf_counter() - start
+    connects = sum(created for created, _ in results)
+    stats = [s for _, s in results if s is not None]
+    served = 3 * QUERIES - sum(s.timeouts for s in stats)
+    line = f"{label:<34} | {elapsed:5.2f}s | {served / elapsed:6.0f} queries/s | {connects:5d} connects"
+    if stats:
+        reuse = sum(s.reused for s in stats) / sum(s.acquired for s in stats)
+        line += f" | reuse {reuse:6.1%} | {sum(s.waited for s in stats):4d} waited | " \
+                f"{sum(s.timeouts for s in stats):3d} timed out"
+    logger.info(line)
+
+
+if __name__ == '__main__':
+    for name in ("cloud_service", "providers", "database", "database_pool"):
+        logging.getLogger(f"src.example.{name}").setLevel(logging.WARNING)
+    logger.info(f"=== Abstract Factory — Database Pool Benchmark "
+                f"({QUERIES} queries × 3 providers, {CONCURRENCY} callers each) ===")
+    asyncio.run(run("connect per query", connect_per_query))
+    asyncio.run(run("pool, min 2 max 10", pooled, min_size=2, max_size=10))
+    asyncio.run(run("pool, min 2 max 30", pooled, min_size=2, max_size=30))
+    asyncio.run(run("pool, max 2, 10 ms acquire timeout", pooled, min_size=2, max_size=2, acquire_timeout=0.01))
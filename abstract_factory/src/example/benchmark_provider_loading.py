@@ -0,0 +1,88 @@
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+PLUGINS = 12                # third-party providers "installed" next to the built-in three
+SDK_IMPORT_TIME = 0.04      # seconds to import one provider's SDK
+RUNS = 3                    # fresh interpreters per scenario; the fastest counts
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# A plugin provider: a module whose import pays for an SDK, plus the dist-info that advertises it
+PLUGIN_MODULE = '''import time
+
+from src.example.cloud_service import CloudServiceFactory
+from src.example.providers.aws import AWSFactory
+
+time.sleep({sdk_import_time})   # stands in for importing the provider's SDK
+
+
+class {name}Factory(AWSFactory):
+    def __init__(self):
+        CloudServiceFactory.__init__(self, "{name}")
+'''
+ENTRY_POINTS = '''[cloud_service.providers]
+{name} = {package}.factory:{name}Factory
+'''
+
+# Runs in a fresh interpreter: times the registry import plus the scenario's provider lookups
+CHILD = '''
+import json, sys, time
+start = time.perf_counter()
+from src.example.registry import registry
+for name in json.loads(sys.argv[1]):
+    registry.get(name) if name != "*" else registry.load_all()
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, registry.loaded(), len(sys.modules)]))
+'''
+
+
+def install_plugins(site):
+    for i in range(1, PLUGINS + 1):
+        name, package = f"Cloud{i:02d}", f"cloud_plugin_{i:02d}"
+        os.makedirs(os.path.join(site, package))
+        with open(os.path.join(site, package, "factory.py"), "w") as f:
+            f.write(PLUGIN_MODULE.format(name=name, sdk_import_time=SDK_IMPORT_TIME))
+        dist_info = os.path.join(site, f"{package}-1.0.dist-info")
+        os.makedirs(dist_info)
+        with open(os.path.join(dist_info, "METADATA"), "w") as f:
+            f.write(f"Metadata-Version: 2.1\nName: {package}\nVersion: 1.0\n")
+        with open(os.path.join(dist_info, "entry_points.txt"), "w") as f:
+            f.write(ENTRY_POINTS.format(name=name, package=package))
+
+
+def measure(site, label, providers):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([PACKAGE_ROOT, site]))
+    runs = []
+    for _ in range(RUNS):
+        output = subprocess.run([sys.executable, "-c", CHILD, json.dumps(providers)], env=env, cwd=PACKAGE_ROOT,
+                                check=True, capture_output=True, text=True).stdout
+        runs.append(json.loads(output))
+    elapsed, loaded, modules = min(runs)
+    logger.info(f"{label:<34} | {elapsed * 1000:7.1f} ms | {len(loaded):2d} providers loaded | {modules:4d} modules")
+
+
+if __name__ == '__main__':
+    logger.info(f"=== Abstract Factory — Provider Loading Benchmark (3 built-in + {PLUGINS} plugin providers, "
+                f"{SDK_IMPORT_TIME * 1000:.0f} ms SDK import per plugin) ===")
+    site = tempfile.mkdtemp(prefix="cloud-plugins-")
+    try:
+        install_plugins(site)
+        measure(site, "registry only", [])
+        measure(site, "eager: every installed provider", ["*"])
+        measure(site, "lazy: AWS", ["AWS"])
+        measure(site, "lazy: AWS, GCP, Azure", ["AWS", "GCP", "Azure"])
+        measure(site, "lazy: 1 plugin", ["Cloud01"])
+        measure(site, "lazy: AWS + 3 plugins", ["AWS", "Cloud01", "Cloud02", "Cloud03"])
+    finally:
+        shutil.rmtree(site)
@@ -0,0 +1,142 @@
+import logging
+import random
+
+from src.example.cloud_service import CloudServiceFactory
+from src.example.provider_selector import LatencyAwareSelector
+from src.example.provisioning import DATABASE, PRODUCTS, STORAGE, VIRTUAL_MACHINE
+from src.example.simulated_backend import DEFAULT_LATENCIES, ProvisioningError
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+REQUESTS_PER_PHASE = 3000   # get_* + bring-up calls, product kinds mixed at random
+JITTER = 0.3                # log-normal spread of each call around its provider's mean
+# Each phase scales DEFAULT_LATENCIES: (provider, kind) -> (latency multiplier, error rate)
+PHASES = [
+    ("steady", {}),
+    ("GCP VMs slow, GCP DB errors", {("GCP", VIRTUAL_MACHINE): (3.0, 0.0), ("GCP", DATABASE): (1.0, 0.3)}),
+    ("GCP recovers, AWS storage slow", {("AWS", STORAGE): (4.0, 0.0)}),
+    ("Azure twice as fast", {("Azure", VIRTUAL_MACHINE): (0.5, 0.0), ("Azure", DATABASE): (0.5, 0.0),
+                             ("Azure", STORAGE): (0.4, 0.0)}),
+]
+
+
+# The simulated clouds: a virtual clock that every bring-up advances by a sampled latency,
+# so a run takes milliseconds and is repeatable
+class SimulatedClouds():
+
+    def __init__(self, seed: int):
+        self.now = 0.0
+        self.phase = {}
+        self._rng = random.Random(seed)
+
+    # (mean seconds, error rate) of a provider's product kind in the current phase
+    def profile(self, provider, kind):
+        multiplier, error_rate = self.phase.get((provider, kind), (1.0, 0.0))
+        return DEFAULT_LATENCIES[provider][kind] * multiplier, error_rate
+
+    # The provider a perfectly informed router would pick
+    def fastest(self, kind):
+        return min(DEFAULT_LATENCIES, key=lambda provider: self.profile(provider, kind)[0] /
+                   (1.0 - self.profile(provider, kind)[1]))
+
+    def bring_up(self, provider, kind):
+        mean, error_rate = self.profile(provider, kind)
+        self.now += mean * self._rng.lognormvariate(0.0, JITTER)
+        if self._rng.random() < error_rate:
+            raise ProvisioningError(f"{provider} {kind} failed (simulated)")
+
+
+class SimulatedProduct():
+
+    def __init__(self, clouds, provider, kind):
+        self.clouds = clouds
+        self.provider = provider
+        self.kind = kind
+
+    def start_machine(self):
+        self.clouds.bring_up(self.provider, self.kind)
+
+    connect_to_db = connect_to_storage = start_machine
+
+
+class SimulatedFactory(CloudServiceFactory):
+
+    def __init__(self, clouds, name):
+        super().__init__(name)
+        self.clouds = clouds
+
+    def get_virtual_machine(self, **options):
+        return SimulatedProduct(self.clouds, self.name, VIRTUAL_MACHINE)
+
+    def get_database(self, **options):
+        return SimulatedProduct(self.clouds, self.name, DATABASE)
+
+    def get_storage(self, **options):
+        return SimulatedProduct(self.clouds, self.name, STORAGE)
+
+
+# strategy(factories, clouds) returns the factory to ask for a product kind
+def simulate(label, strategy, seed=7):
+    clouds = SimulatedClouds(seed)
+    workload = random.Random(seed)
+    factories = {name: SimulatedFactory(clouds, name) for name in DEFAULT_LATENCIES}
+    route = strategy(factories, clouds)
+    phases, errors, on_fastest = [], 0, 0
+    for _, phase in PHASES:
+        clouds.phase = phase
+        start = clouds.now
+        for _ in range(REQUESTS_PER_PHASE):
+            kind = workload.choice(list(PRODUCTS))
+            create, bring_up = PRODUCTS[kind]
+            product = getattr(route(kind), create)()
+            on_fastest += product.provider == clouds.fastest(kind)
+            try:
+                getattr(product, bring_up)()
+            except ProvisioningError:
+                errors += 1
+        phases.append((clouds.now - start) / REQUESTS_PER_PHASE)
+    total = REQUESTS_PER_PHASE * len(PHASES)
+    logger.info(f"{label:<16} | " + " | ".join(f"{mean * 1000:5.1f}" for mean in phases) +
+                f" | {clouds.now / total * 1000:5.1f} ms | {errors:4d} errors | {on_fastest / total:4.0%} on fastest")
+
+
+def fixed(name):
+    return lambda factories, clouds: lambda kind: factories[name]
+
+
+def at_random(factories, clouds):
+    rng = random.Random(1)
+    return lambda kind: rng.choice(list(factories.values()))
+
+
+def oracle(factories, clouds):
+    return lambda kind: factories[clouds.fastest(kind)]
+
+
+def selector(exploration):
+    def strategy(factories, clouds):
+        auto = LatencyAwareSelector(list(factories.values()), exploration=exploration, seed=1,
+                                    clock=lambda: clouds.now)
+        return lambda kind: auto
+    return strategy
+
+
+if __name__ == '__main__':
+    logging.getLogger("src.example.provider_selector").setLevel(logging.WARNING)
+    logger.info(f"=== Abstract Factory — Provider Selection Benchmark ({REQUESTS_PER_PHASE} calls per phase, "
+                f"virtual clock) ===")
+    for i, (label, _) in enumerate(PHASES, 1):
+        logger.info(f"phase {i}: {label}")
+    logger.info(f"{'strategy':<16} | " + " | ".join(f"ph {i} " for i in range(1, len(PHASES) + 1)) +
+                f" | {'mean':>8} | mean ms per call, failed calls included")
+    simulate("fixed AWS", fixed("AWS"))
+    simulate("fixed GCP", fixed("GCP"))
+    simulate("random", at_random)
+    for exploration in (0.0, 0.05, 0.2):
+        simulate(f"selector ε={exploration:g}", selector(exploration))
+    simulate("oracle", oracle)
@@ -0,0 +1,50 @@
+import asyncio
+import logging
+import time
+
+from src.example.cloud_service import AWSFactory, AZUREFactory, GCPFactory
+from src.example.provisioning import PRODUCTS, ProvisioningOrchestrator, ProvisioningPlan
+from src.example.simulated_backend import SimulatedBackend
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+STACKS = 4      # independent VM + database + storage sets per provider
+
+
+# Today's main.py: one step after another, in dependency order
+async def sequential(plan: ProvisioningPlan, backend: SimulatedBackend) -> float:
+    start = time.perf_counter()
+    for step in plan.topological_order():
+        create, bring_up = PRODUCTS[step.kind]
+        product = getattr(step.factory, create)()
+        await backend.execute(step.factory.name, step.kind, getattr(product, bring_up))
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    # The factories and products log every call at INFO — keep them quiet while timing
+    for name in ("cloud_service", "providers", "virtual_machine", "database", "storage", "provisioning"):
+        logging.getLogger(f"src.example.{name}").setLevel(logging.WARNING)
+    plan = ProvisioningPlan.for_factories([AWSFactory(), GCPFactory(), AZUREFactory()], stacks=STACKS)
+    logger.info("=== Abstract Factory — Provisioning Benchmark (%d steps, VM depends on storage) ===",
+                len(plan.steps))
+
+    baseline = asyncio.run(sequential(plan, SimulatedBackend(seed=1)))
+    logger.info("%-36s | %5.2fs | speedup %5.1fx", "sequential", baseline, 1.0)
+    for limit in (1, 2, 4, None):
+        orchestrator = ProvisioningOrchestrator(SimulatedBackend(seed=1), per_provider_limit=limit)
+        report = orchestrator.run_sync(plan)
+        assert report.ok
+        label = f"orchestrated, {limit if limit is not None else 'unlimited'} per provider"
+        logger.info("%-36s | %5.2fs | speedup %5.1fx", label, report.seconds, baseline / report.seconds)
+
+    # Failures only take down the steps that depend on them
+    report = ProvisioningOrchestrator(SimulatedBackend(failure_rate=0.1, seed=1)).run_sync(plan)
+    logger.info("%-36s | %5.2fs | %d failed, %d skipped, %d up", "orchestrated, 10% failures",
+                report.seconds, len(report.failed), len(report.skipped),
+                len(plan.steps) - len(report.failed) - len(report.skipped))
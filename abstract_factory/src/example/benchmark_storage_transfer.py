@@ -0,0 +1,76 @@
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from src.example.cloud_service import AWSFactory, AZUREFactory, GCPFactory
+from src.example.storage import MiB
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+OBJECT_SIZE = 128 * MiB
+REQUEST_LATENCY = 0.03      # round trip of one request
+BANDWIDTH = 100 * MiB       # bytes/s one request (one connection) can move
+
+
+# A source file written in chunks, so the benchmark itself never holds the object in memory
+def make_source(directory):
+    path = os.path.join(directory, "source.bin")
+    with open(path, "wb") as f:
+        for _ in range(OBJECT_SIZE // MiB):
+            f.write(os.urandom(MiB))
+    return path
+
+
+def transfer(factory, root, source, label, part_size, max_workers):
+    storage = factory.get_storage(root=root, part_size=part_size, max_workers=max_workers,
+                                  request_latency=REQUEST_LATENCY, bandwidth=BANDWIDTH)
+    key = f"backups/{part_size}-{max_workers}.bin"
+    start = time.perf_counter()
+    with open(source, "rb") as f:
+        info = storage.put_object(key, f)
+    upload = time.perf_counter() - start
+
+    target = os.path.join(root, "download.bin")
+    start = time.perf_counter()
+    with open(target, "wb") as out:
+        storage.download_object(key, out)
+    download = time.perf_counter() - start
+    assert os.path.getsize(target) == info.size
+
+    # A 1 MiB ranged read from the middle of the object
+    start = time.perf_counter()
+    storage.get_object(key, OBJECT_SIZE // 2, OBJECT_SIZE // 2 + MiB)
+    ranged = time.perf_counter() - start
+    storage.delete_object(key)
+    storage.close()
+
+    logger.info(f"{factory.name:<5} | {label:<28} | {info.parts:3d} parts | "
+                f"upload {OBJECT_SIZE / MiB / upload:6.0f} MiB/s | download {OBJECT_SIZE / MiB / download:6.0f} MiB/s | "
+                f"1 MiB range {ranged * 1000:5.1f} ms")
+
+
+if __name__ == '__main__':
+    for name in ("cloud_service", "providers", "storage"):
+        logging.getLogger(f"src.example.{name}").setLevel(logging.WARNING)
+    logger.info(f"=== Abstract Factory — Storage Transfer Benchmark ({OBJECT_SIZE // MiB} MiB object, "
+                f"{REQUEST_LATENCY * 1000:.0f} ms per request, {BANDWIDTH // MiB} MiB/s per connection) ===")
+    root = tempfile.mkdtemp(prefix="cloud-storage-")
+    try:
+        source = make_source(root)
+        aws = AWSFactory()
+        transfer(aws, root, source, "single stream", OBJECT_SIZE, 1)
+        transfer(aws, root, source, "8 MiB parts, 1 worker", 8 * MiB, 1)
+        for workers in (4, 8, 16):
+            transfer(aws, root, source, f"8 MiB parts, {workers} workers", 8 * MiB, workers)
+        # Same API and the same numbers for every provider
+        for factory in (GCPFactory(), AZUREFactory()):
+            transfer(factory, root, source, "8 MiB parts, 8 workers", 8 * MiB, 8)
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,85 @@
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.example.cloud_service import AWSFactory
+from src.example.warm_pool import WarmPoolFactory
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+BOOT_LATENCY = 0.2      # seconds for a cold VM start
+# (requests per second, seconds) — quiet, a spike, silence, steady
+PHASES = [(5, 2.0), (40, 2.0), (0, 2.0), (10, 2.0)]
+
+
+def percentile(latencies, p):
+    latencies = sorted(latencies)
+    return latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1000 if latencies else 0.0
+
+
+# Sends Poisson arrivals phase by phase; returns checkout latencies per phase and the mean idle warm VMs
+def drive(get_vm, pool=None):
+    rng = random.Random(42)
+    latencies = [[] for _ in PHASES]
+    samples = []
+    stop = threading.Event()
+
+    def sample():
+        while not stop.wait(0.05):
+            samples.append(pool.warm if pool is not None else 0)
+
+    def request(phase):
+        start = time.perf_counter()
+        get_vm().start_machine()    # a no-op for a VM that is already running
+        latencies[phase].append(time.perf_counter() - start)
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    with ThreadPoolExecutor(max_workers=64) as callers:
+        for phase, (rate, seconds) in enumerate(PHASES):
+            end = time.monotonic() + seconds
+            while rate:
+                time.sleep(rng.expovariate(rate))
+                if time.monotonic() >= end:
+                    break
+                callers.submit(request, phase)
+            time.sleep(max(0.0, end - time.monotonic()))
+    stop.set()
+    sampler.join()
+    return latencies, sum(samples) / len(samples)
+
+
+def report(label, latencies, idle):
+    # A checkout well under one boot was served warm
+    phases = " | ".join(f"{rate:2d}/s: {sum(t < BOOT_LATENCY / 2 for t in lat) / len(lat):4.0%} warm, "
+                        f"p50 {percentile(lat, 50):5.1f} ms"
+                        for (rate, _), lat in zip(PHASES, latencies) if rate)
+    logger.info(f"{label:<22} | {phases} | {idle:4.1f} idle VMs on average")
+
+
+if __name__ == '__main__':
+    for name in ("cloud_service", "providers", "virtual_machine", "warm_pool"):
+        logging.getLogger(f"src.example.{name}").setLevel(logging.ERROR)
+    logger.info(f"=== Abstract Factory — Warm VM Pool Benchmark (boot {BOOT_LATENCY * 1000:.0f} ms, "
+                f"phases {', '.join(f'{r}/s for {s:.0f}s' for r, s in PHASES)}) ===")
+
+    aws = AWSFactory()
+    latencies, idle = drive(lambda: aws.get_virtual_machine(start_latency=BOOT_LATENCY))
+    report("cold start every time", latencies, idle)
+
+    for label, options in (("fixed pool of 3", dict(min_size=3, max_size=3, initial_size=3)),
+                           ("adaptive pool 1..16", dict(min_size=1, max_size=16, initial_size=2,
+                                                        window=1.0, drain_after=0.5))):
+        factory = WarmPoolFactory(AWSFactory(), vm_options={"start_latency": BOOT_LATENCY}, **options)
+        time.sleep(BOOT_LATENCY * 2)    # let the initial VMs boot
+        latencies, idle = drive(factory.get_virtual_machine, factory.pool)
+        report(label, latencies, idle)
+        logger.info(f"{'':<22} | {factory.pool.stats} | hit rate {factory.pool.stats.hit_rate:.1%}")
+        factory.close()
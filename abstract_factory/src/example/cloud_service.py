@@ -1,9 +1,10 @@
 import logging
 from abc import ABC, abstractmethod
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from src.example.database import AWS_Database, AZURE_Database, GCP_Database
-from src.example.storage import AWS_Storage, AZURE_Storage, GCP_Storage
-from src.example.virtual_machine import AWS_VM, AZURE_VM, GCP_VM
+if TYPE_CHECKING:
+    from src.example.database_pool import DatabasePool
 
 logger = logging.getLogger(__name__)
 
@@ -13,70 +14,48 @@ class CloudServiceFactory(ABC):
 
     def __init__(self,name: str):
         self.name=name
+        self._database_pool = None
 
-    # Creates a VM instance for this provider
+    # Creates a VM instance for this provider (options: start_latency)
     @abstractmethod
-    def get_virtual_machine(self):
+    def get_virtual_machine(self, **options):
         pass
 
-    # Creates a database instance for this provider
+    # Creates a database instance for this provider (options: dsn, connect_latency)
     @abstractmethod
-    def get_database(self):
+    def get_database(self, **options):
         pass
 
-    # Creates a storage instance for this provider
+    # This provider's connection pool — hands out connected databases instead of fresh ones.
+    # Created on first call, and again once the previous pool was closed or belongs to another
+    # event loop (e.g. an earlier asyncio.run); options (min_size, max_size, idle_timeout...)
+    # only apply when a pool is created.
+    def database_pool(self, **options) -> "DatabasePool":
+        if self._database_pool is None or not self._database_pool.usable:
+            # Imported here — asyncio is a noticeable share of startup for callers that never pool
+            from src.example.database_pool import DatabasePool
+            self._database_pool = DatabasePool(self, **options)
+        return self._database_pool
+
+    # Creates a storage instance for this provider (options: root, part_size, max_workers,
+    # request_latency, bandwidth)
     @abstractmethod
-    def get_storage(self):
+    def get_storage(self, **options):
         pass
 
 
-# Concrete Factory — produces AWS services as a matched set
-class AWSFactory(CloudServiceFactory):
-    def __init__(self):
-        super().__init__("AWS")
+# The concrete factories live in src.example.providers, one module per provider, and are
+# loaded on first use — importing this module costs nothing per provider.
+# `from src.example.cloud_service import AWSFactory` keeps working; new code should go
+# through src.example.registry, which also finds third-party providers.
+_CONCRETE_FACTORIES = {
+    "AWSFactory": "src.example.providers.aws",
+    "GCPFactory": "src.example.providers.gcp",
+    "AZUREFactory": "src.example.providers.azure",
+}
 
-    def get_virtual_machine(self):
-        logger.info(f"[{self.name}] creating Virtual Machine")
-        return AWS_VM()
 
-    def get_database(self):
-        logger.info(f"[{self.name}] creating Database")
-        return AWS_Database()
-
-    def get_storage(self):
-        logger.info(f"[{self.name}] creating Storage")
-        return AWS_Storage()
-
-# Concrete Factory — produces GCP services as a matched set
-class GCPFactory(CloudServiceFactory):
-    def __init__(self):
-        super().__init__("GCP")
-
-    def get_virtual_machine(self):
-        logger.info(f"[{self.name}] creating Virtual Machine")
-        return GCP_VM()
-
-    def get_database(self):
-        logger.info(f"[{self.name}] creating Database")
-        return GCP_Database()
-
-    def get_storage(self):
-        logger.info(f"[{self.name}] creating Storage")
-        return GCP_Storage()
-
-# Concrete Factory — produces Azure services as a matched set
-class AZUREFactory(CloudServiceFactory):
-    def __init__(self):
-        super().__init__("Azure")
-
-    def get_virtual_machine(self):
-        logger.info(f"[{self.name}] creating Virtual Machine")
-        return AZURE_VM()
-
-    def get_database(self):
-        logger.info(f"[{self.name}] creating Database")
-        return AZURE_Database()
-
-    def get_storage(self):
-        logger.info(f"[{self.name}] creating Storage")
-        return AZURE_Storage()
\ No newline at end of file
+def __getattr__(name: str):
+    if name in _CONCRETE_FACTORIES:
+        return getattr(import_module(_CONCRETE_FACTORIES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,73 @@
 import logging
+import sqlite3
+import time
 from abc import ABC, abstractmethod
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
-# Abstract Product — interface for all cloud database types
+# Abstract Product — interface for all cloud database types.
+# Every provider's database is backed by a local sqlite stand-in so examples run offline:
+# by default an in-memory database shared by all of that provider's connections.
+# connect_latency simulates the network round trips and auth handshake of a real connect.
 class Database(ABC):
+
+    DEFAULT_DSN = "file::memory:?cache=shared"
+
+    def __init__(self, dsn: Optional[str] = None, connect_latency: float = 0.0):
+        self.dsn = dsn or self.DEFAULT_DSN
+        self.connect_latency = connect_latency
+        self.connection: Optional[sqlite3.Connection] = None
+
     @abstractmethod
     def connect_to_db(self):
         pass
 
+    # Runs one statement on the open connection and returns its rows
+    def execute(self, sql: str, params=()) -> list:
+        return self.connection.execute(sql, params).fetchall()
+
+    # Cheap liveness probe — False if never connected or the connection broke
+    def is_healthy(self) -> bool:
+        if self.connection is None:
+            return False
+        try:
+            self.connection.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    # Opens the stand-in connection (pools may hand it between threads)
+    def _open(self) -> sqlite3.Connection:
+        time.sleep(self.connect_latency)
+        return sqlite3.connect(self.dsn, uri=True, check_same_thread=False)
+
 
 # Concrete Product — AWS RDS instance
 class AWS_Database(Database):
+    DEFAULT_DSN = "file:aws-rds?mode=memory&cache=shared"
+
     def connect_to_db(self):
         logger.info("Connecting to AWS Database")
+        self.connection = self._open()
 
 # Concrete Product — GCP Cloud SQL instance
 class GCP_Database(Database):
+    DEFAULT_DSN = "file:gcp-cloud-sql?mode=memory&cache=shared"
+
     def connect_to_db(self):
         logger.info("Connecting to GCP Database")
+        self.connection = self._open()
 
 # Concrete Product — Azure SQL instance
 class AZURE_Database(Database):
+    DEFAULT_DSN = "file:azure-sql?mode=memory&cache=shared"
+
     def connect_to_db(self):
-        logger.info("Connecting to AZURE Database")
\ No newline at end of file
+        logger.info("Connecting to AZURE Database")
+        self.connection = self._open()
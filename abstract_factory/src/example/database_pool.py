@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Mapping, Optional, Tuple
+
+from src.example.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+# Counters exposed by the pool
+@dataclass
+class PoolStats():
+    acquired: int = 0
+    created: int = 0            # full connects
+    reused: int = 0             # acquires served by an idle connection
+    waited: int = 0             # acquires that had to wait for a release
+    timeouts: int = 0           # acquires that gave up
+    evicted_idle: int = 0       # closed after sitting idle past idle_timeout
+    evicted_unhealthy: int = 0  # failed a health check
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reused / self.acquired if self.acquired else 0.0
+
+
+# --- Database Pool ---
+# A bounded pool of connected databases for one provider's factory.
+#   - keeps at least min_size connections open and never more than max_size
+#   - acquire() reuses the most recently released connection, connects a new one while below
+#     max_size, and otherwise waits — up to `timeout` seconds, then raises asyncio.TimeoutError
+#   - a connection idle for longer than health_check_interval is probed before being handed out
+#   - a background reaper closes connections idle past idle_timeout, down to min_size
+# Connects and health checks are blocking driver calls, so they run on worker threads.
+class DatabasePool():
+
+    def __init__(self, factory, min_size: int = 1, max_size: int = 10, idle_timeout: float = 60.0,
+                 health_check_interval: float = 30.0, acquire_timeout: float = 5.0,
+                 database_options: Optional[Mapping[str, Any]] = None):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("need 0 <= min_size <= max_size and max_size >= 1")
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+        # Passed to factory.get_database() for each new connection
+        self.database_options = dict(database_options or {})
+        self.stats = PoolStats()
+        # Most recently released last; each entry remembers when it was released
+        self._idle: Deque[Tuple[Database, float]] = deque()
+        self._size = 0              # open connections plus ones being opened
+        self._cond: Optional[asyncio.Condition] = None
+        self._reaper: Optional[asyncio.Task] = None
+        self._starting: Optional[asyncio.Future] = None     # the start in progress or done
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    # False once closed, or once the event loop it started on has closed or isn't the one running
+    # (e.g. a shared factory used again by a later asyncio.run) — callers should make a new pool
+    @property
+    def usable(self) -> bool:
+        if self._closed:
+            return False
+        if self._loop is None:
+            return True
+        if self._loop.is_closed():
+            return False
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:    # no loop running right now — keep the pool for when its loop runs again
+            return True
+
+    # Opens min_size connections and starts the reaper; acquire() calls it on first use.
+    # Concurrent callers share one start; a failed start is rolled back and retried by the next call.
+    async def start(self):
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(self._start())
+        await asyncio.shield(self._starting)
+
+    async def acquire(self, timeout: Optional[float] = None) -> Database:
+        await self.start()
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        self.stats.acquired += 1
+        waited = False
+        while True:
+            async with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("pool is closed")
+                    if self._idle:
+                        database, released_at = self._idle.pop()
+                        if time.monotonic() - released_at <= self.health_check_interval:
+                            self.stats.reused += 1
+                            return database
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        database = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.stats.timeouts += 1
+                        raise asyncio.TimeoutError(f"no {self.factory.name} database free within {timeout}s")
+                    if not waited:
+                        self.stats.waited += 1
+                        waited = True
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            # Connect and health-check outside the lock — other acquires and releases carry on meanwhile
+            if database is None:
+                return await self._connect()
+            if await self._healthy(database):
+                self.stats.reused += 1
+                return database
+
+    # Returns a connection to the pool; a broken one is closed instead
+    async def release(self, database: Database):
+        async with self._cond:
+            if self._closed or database.connection is None:
+                self._discard(database)
+            else:
+                self._idle.append((database, time.monotonic()))
+            self._cond.notify()
+
+    # async with pool.connection() as db: ... — acquire and always release
+    @asynccontextmanager
+    async def connection(self, timeout: Optional[float] = None) -> AsyncIterator[Database]:
+        database = await self.acquire(timeout)
+        try:
+            yield database
+        finally:
+            await self.release(database)
+
+    # Closes idle connections; in-use ones are closed as they're released
+    async def close(self):
+        if self._cond is None:
+            return
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+        async with self._cond:
+            while self._idle:
+                self._discard(self._idle.pop()[0])
+            self._cond.notify_all()
+        logger.info(f"[{self.factory.name}] database pool closed — {self.stats}")
+
+    async def _start(self):
+        # Created here, not in __init__, so the pool binds to the loop that actually uses it
+        self._cond = asyncio.Condition()
+        self._loop = asyncio.get_running_loop()
+        try:
+            await self._fill()
+        except BaseException:
+            # Close what did connect and leave the pool unstarted
+            async with self._cond:
+                while self._idle:
+                    self._discard(self._idle.pop()[0])
+            self._starting = None
+            raise
+        self._reaper = asyncio.ensure_future(self._reap())
+        logger.info(f"[{self.factory.name}] database pool started ({self.min_size}..{self.max_size})")
+
+    async def _connect(self) -> Database:
+        try:
+            database = self.factory.get_database(**self.database_options)
+            await asyncio.get_running_loop().run_in_executor(None, database.connect_to_db)
+        except BaseException:
+            async with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        self.stats.created += 1
+        return database
+
+    # Health-checks a connection taken off the idle list, on a worker thread without the lock held.
+    # An unhealthy connection is dropped from the pool.
+    async def _healthy(self, database: Database) -> bool:
+        try:
+            healthy = await asyncio.get_running_loop().run_in_executor(None, database.is_healthy)
+        except BaseException:
+            # Cancelled or failed mid-check — free the connection's slot
+            async with self._cond:
+                self._discard(database)
+            raise
+        if healthy:
+            return True
+        self.stats.evicted_unhealthy += 1
+        logger.warning(f"[{self.factory.name}] dropping unhealthy database connection")
+        async with self._cond:
+            self._discard(database)
+        return False
+
+    # Closes a connection and frees its slot (caller holds the lock)
+    def _discard(self, database: Database):
+        database.close()
+        self._size -= 1
+        self._cond.notify()
+
+    # Connects up to min_size idle-or-busy connections
+    async def _fill(self):
+        while not self._closed:
+            async with self._cond:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            database = await self._connect()
+            await self.release(database)
+
+    # Periodically closes connections idle past idle_timeout (oldest first, never below min_size)
+    async def _reap(self):
+        while True:
+            await asyncio.sleep(max(0.01, min(self.idle_timeout, self.health_check_interval) / 2))
+            async with self._cond:
+                now = time.monotonic()
+                while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+                    self._discard(self._idle.popleft()[0])
+                    self.stats.evicted_idle += 1
+            await self._fill()
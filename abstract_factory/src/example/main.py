@@ -1,5 +1,5 @@
 import logging
-from src.example.cloud_service import AWSFactory, AZUREFactory, GCPFactory
+from src.example.registry import get_factory
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -13,8 +13,9 @@ if __name__=='__main__':
     logger.info("=== Abstract Factory — Cloud Service Example ===")
 
     # Iterate over each cloud provider factory
-    # Same client code, different factories produce different matched service sets
-    factories = [AWSFactory(), GCPFactory(), AZUREFactory()]
+    # Same client code, different factories produce different matched service sets.
+    # Factories come from the provider registry — each provider's module loads on first use.
+    factories = [get_factory(name) for name in ("AWS", "GCP", "Azure")]
     for factory in factories:
         logger.info(f"--- {factory.name} ---")
         vm = factory.get_virtual_machine()
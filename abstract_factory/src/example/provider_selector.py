@@ -0,0 +1,135 @@
+import functools
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from src.example.cloud_service import CloudServiceFactory
+from src.example.provisioning import DATABASE, PRODUCTS, STORAGE, VIRTUAL_MACHINE
+
+logger = logging.getLogger(__name__)
+
+
+# What the selector knows about one provider for one product kind
+@dataclass
+class ProviderStats():
+    calls: int = 0
+    errors: int = 0
+    routed: int = 0                     # get_* calls sent to this provider
+    explored: int = 0                   # ...of which were exploration, not the expected-fastest pick
+    latency: Optional[float] = None     # EWMA seconds of successful calls
+    error_rate: float = 0.0             # EWMA of failures (1) vs successes (0)
+
+    # Latency per successful call, counting the retries failures cost
+    @property
+    def expected_latency(self) -> float:
+        if self.latency is None:
+            return math.inf
+        return self.latency / max(1.0 - self.error_rate, 0.01)
+
+
+# --- Latency-Aware Selector ---
+# A factory over several providers' factories: each get_* call goes to the provider expected
+# to be fastest for that product kind.
+#   - the product's bring-up call (start_machine, connect_to_db, connect_to_storage) is timed,
+#     and feeds an EWMA of latency and of error rate per provider and kind
+#   - providers not yet tried for a kind are tried first
+#   - with probability `exploration` another provider is picked at random, so a provider that
+#     got faster again is noticed — with exploration=0 the selector only moves off a provider
+#     once it slows down
+# record() feeds measurements of other operations, timed by the caller, into the same stats.
+class LatencyAwareSelector(CloudServiceFactory):
+
+    def __init__(self, factories: Sequence[CloudServiceFactory], exploration: float = 0.05,
+                 alpha: float = 0.2, seed: Optional[int] = None, clock: Callable[[], float] = time.perf_counter):
+        if not factories:
+            raise ValueError("need at least one factory to select from")
+        if not 0.0 <= exploration <= 1.0 or not 0.0 < alpha <= 1.0:
+            raise ValueError("need 0 <= exploration <= 1 and 0 < alpha <= 1")
+        super().__init__("Auto")
+        self.factories = {factory.name: factory for factory in factories}
+        self.exploration = exploration
+        self.alpha = alpha
+        self.clock = clock
+        self.stats: Dict[Tuple[str, str], ProviderStats] = {
+            (name, kind): ProviderStats() for name in self.factories for kind in PRODUCTS}
+        self._best: Dict[str, Optional[str]] = dict.fromkeys(PRODUCTS)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def get_virtual_machine(self, **options):
+        return self._create(VIRTUAL_MACHINE, options)
+
+    def get_database(self, **options):
+        return self._create(DATABASE, options)
+
+    def get_storage(self, **options):
+        return self._create(STORAGE, options)
+
+    # The provider the next call for this kind would go to, bar exploration
+    def fastest(self, kind: str) -> CloudServiceFactory:
+        with self._lock:
+            return self.factories[self._fastest(kind)]
+
+    # Feeds one measured call into the provider's stats for a product kind
+    def record(self, provider: str, kind: str, seconds: float, ok: bool = True):
+        with self._lock:
+            stats = self.stats[(provider, kind)]
+            stats.calls += 1
+            stats.error_rate += self.alpha * ((0.0 if ok else 1.0) - stats.error_rate)
+            if not ok:
+                stats.errors += 1
+            elif stats.latency is None:
+                stats.latency = seconds
+            else:
+                stats.latency += self.alpha * (seconds - stats.latency)
+
+    def _create(self, kind: str, options: Dict[str, Any]):
+        factory = self._choose(kind)
+        create, bring_up = PRODUCTS[kind]
+        start = self.clock()
+        try:
+            product = getattr(factory, create)(**options)
+        except Exception:
+            self.record(factory.name, kind, self.clock() - start, ok=False)
+            raise
+        # Instance attribute — the product keeps its type, only this call is measured
+        setattr(product, bring_up, self._measured(factory.name, kind, getattr(product, bring_up)))
+        return product
+
+    def _measured(self, provider: str, kind: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def measured(*args, **kwargs):
+            start = self.clock()
+            try:
+                result = method(*args, **kwargs)
+            except Exception:
+                self.record(provider, kind, self.clock() - start, ok=False)
+                raise
+            self.record(provider, kind, self.clock() - start)
+            return result
+        return measured
+
+    def _choose(self, kind: str) -> CloudServiceFactory:
+        with self._lock:
+            best = self._fastest(kind)
+            name, explored = best, False
+            others = [other for other in self.factories if other != best]
+            if others and self.stats[(best, kind)].routed and self._random.random() < self.exploration:
+                name, explored = self._random.choice(others), True
+            stats = self.stats[(name, kind)]
+            stats.routed += 1
+            stats.explored += explored
+            if best != self._best[kind] and self.stats[(best, kind)].calls:
+                expected = self.stats[(best, kind)].expected_latency
+                logger.info(f"[{kind}] routing to {best} (expected {expected * 1000:.1f} ms)")
+                self._best[kind] = best
+            return self.factories[name]
+
+    # Providers never tried first, then the lowest expected latency
+    def _fastest(self, kind: str) -> str:
+        return min(self.factories, key=lambda name: (self.stats[(name, kind)].routed > 0,
+                                                     self.stats[(name, kind)].expected_latency))
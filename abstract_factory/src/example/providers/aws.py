@@ -0,0 +1,25 @@
+import logging
+
+from src.example.cloud_service import CloudServiceFactory
+from src.example.database import AWS_Database
+from src.example.storage import AWS_Storage
+from src.example.virtual_machine import AWS_VM
+
+logger = logging.getLogger(__name__)
+
+# Concrete Factory — produces AWS services as a matched set
+class AWSFactory(CloudServiceFactory):
+    def __init__(self):
+        super().__init__("AWS")
+
+    def get_virtual_machine(self, **options):
+        logger.info(f"[{self.name}] creating Virtual Machine")
+        return AWS_VM(**options)
+
+    def get_database(self, **options):
+        logger.info(f"[{self.name}] creating Database")
+        return AWS_Database(**options)
+
+    def get_storage(self, **options):
+        logger.info(f"[{self.name}] creating Storage")
+        return AWS_Storage(**options)
@@ -0,0 +1,25 @@
+import logging
+
+from src.example.cloud_service import CloudServiceFactory
+from src.example.database import AZURE_Database
+from src.example.storage import AZURE_Storage
+from src.example.virtual_machine import AZURE_VM
+
+logger = logging.getLogger(__name__)
+
+# Concrete Factory — produces Azure services as a matched set
+class AZUREFactory(CloudServiceFactory):
+    def __init__(self):
+        super().__init__("Azure")
+
+    def get_virtual_machine(self, **options):
+        logger.info(f"[{self.name}] creating Virtual Machine")
+        return AZURE_VM(**options)
+
+    def get_database(self, **options):
+        logger.info(f"[{self.name}] creating Database")
+        return AZURE_Database(**options)
+
+    def get_storage(self, **options):
+        logger.info(f"[{self.name}] creating Storage")
+        return AZURE_Storage(**options)
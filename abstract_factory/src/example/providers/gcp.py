@@ -0,0 +1,25 @@
+import logging
+
+from src.example.cloud_service import CloudServiceFactory
+from src.example.database import GCP_Database
+from src.example.storage import GCP_Storage
+from src.example.virtual_machine import GCP_VM
+
+logger = logging.getLogger(__name__)
+
+# Concrete Factory — produces GCP services as a matched set
+class GCPFactory(CloudServiceFactory):
+    def __init__(self):
+        super().__init__("GCP")
+
+    def get_virtual_machine(self, **options):
+        logger.info(f"[{self.name}] creating Virtual Machine")
+        return GCP_VM(**options)
+
+    def get_database(self, **options):
+        logger.info(f"[{self.name}] creating Database")
+        return GCP_Database(**options)
+
+    def get_storage(self, **options):
+        logger.info(f"[{self.name}] creating Storage")
+        return GCP_Storage(**options)
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.example.cloud_service import CloudServiceFactory
+
+logger = logging.getLogger(__name__)
+
+# Product kinds a plan can provision
+VIRTUAL_MACHINE = "virtual_machine"
+DATABASE = "database"
+STORAGE = "storage"
+
+# Product kind → (factory method that creates it, product method that brings it up)
+PRODUCTS = {
+    VIRTUAL_MACHINE: ("get_virtual_machine", "start_machine"),
+    DATABASE: ("get_database", "connect_to_db"),
+    STORAGE: ("get_storage", "connect_to_storage"),
+}
+
+
+# One product to provision from one factory, after the steps it depends on
+@dataclass
+class Step():
+    name: str
+    factory: CloudServiceFactory
+    kind: str
+    depends_on: Tuple[str, ...] = ()
+
+
+# --- Provisioning Plan ---
+# A dependency graph of steps, e.g. "AWS/virtual_machine" depends on "AWS/storage".
+class ProvisioningPlan():
+
+    def __init__(self):
+        self.steps: Dict[str, Step] = {}
+
+    # Adds a step; returns the plan so calls can be chained
+    def add(self, name: str, factory: CloudServiceFactory, kind: str,
+            depends_on: Sequence[str] = ()) -> "ProvisioningPlan":
+        if kind not in PRODUCTS:
+            raise ValueError(f"unknown product kind {kind!r}")
+        if name in self.steps:
+            raise ValueError(f"duplicate step {name!r}")
+        self.steps[name] = Step(name, factory, kind, tuple(depends_on))
+        return self
+
+    # Every product of every factory, with the same dependencies inside each provider.
+    # stacks > 1 provisions that many independent copies per provider ("AWS/2/storage"...).
+    @classmethod
+    def for_factories(cls, factories: Sequence[CloudServiceFactory],
+                      depends_on: Optional[Mapping[str, Sequence[str]]] = None,
+                      stacks: int = 1) -> "ProvisioningPlan":
+        depends_on = {VIRTUAL_MACHINE: (STORAGE,)} if depends_on is None else depends_on
+        plan = cls()
+        for factory in factories:
+            for stack in range(1, stacks + 1):
+                prefix = factory.name if stacks == 1 else f"{factory.name}/{stack}"
+                for kind in PRODUCTS:
+                    plan.add(f"{prefix}/{kind}", factory, kind,
+                             [f"{prefix}/{dep}" for dep in depends_on.get(kind, ())])
+        return plan
+
+    # Steps in an order that respects every dependency (Kahn's algorithm).
+    # Raises ValueError for unknown dependencies and cycles.
+    def topological_order(self) -> List[Step]:
+        waiting_on = {}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.steps}
+        for step in self.steps.values():
+            for dep in step.depends_on:
+                if dep not in self.steps:
+                    raise ValueError(f"step {step.name!r} depends on unknown step {dep!r}")
+                dependents[dep].append(step.name)
+            waiting_on[step.name] = len(set(step.depends_on))
+        ready = [name for name, count in waiting_on.items() if count == 0]
+        order = []
+        while ready:
+            name = ready.pop()
+            order.append(self.steps[name])
+            for dependent in set(dependents[name]):
+                waiting_on[dependent] -= 1
+                if waiting_on[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) < len(self.steps):
+            cycle = sorted(name for name, count in waiting_on.items() if count > 0)
+            raise ValueError(f"dependency cycle among {cycle}")
+        return order
+
+
+# What happened to one step; offsets are seconds since the run started
+@dataclass
+class StepResult():
+    step: Step
+    product: Any = None
+    started: float = 0.0
+    finished: float = 0.0
+    error: Optional[BaseException] = None
+    skipped: bool = False       # a dependency failed, so the step never ran
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.skipped
+
+
+@dataclass
+class ProvisioningReport():
+    results: Dict[str, StepResult] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results.values())
+
+    @property
+    def failed(self) -> List[str]:
+        return [name for name, result in self.results.items() if result.error is not None]
+
+    @property
+    def skipped(self) -> List[str]:
+        return [name for name, result in self.results.items() if result.skipped]
+
+
+# --- Provisioning Orchestrator ---
+# Runs a plan on asyncio: every step starts as soon as its dependencies are up, so independent
+# steps run concurrently across products and providers.
+#   - per_provider_limit caps how many steps of one provider run at once (int for all, or
+#     {provider name: limit}; None = no cap) — cloud APIs throttle concurrent provisioning
+#   - backend does the bringing-up: anything with `async execute(provider, kind, action)`, e.g.
+#     SimulatedBackend. Without one, the product's own (blocking) method runs on a worker thread.
+#   - a failed step doesn't stop the run; only the steps depending on it are skipped
+class ProvisioningOrchestrator():
+
+    def __init__(self, backend=None, per_provider_limit: Union[None, int, Mapping[str, int]] = 4):
+        self.backend = backend
+        self.per_provider_limit = per_provider_limit
+
+    async def run(self, plan: ProvisioningPlan) -> ProvisioningReport:
+        order = plan.topological_order()
+        limits = {name: self._semaphore(name) for name in {step.factory.name for step in order}}
+        report = ProvisioningReport()
+        started = time.perf_counter()
+        tasks: Dict[str, asyncio.Future] = {}
+
+        async def run_step(step: Step) -> StepResult:
+            result = report.results[step.name] = StepResult(step)
+            # Steps are created in dependency order, so every task awaited here already exists
+            for dep in step.depends_on:
+                if not (await tasks[dep]).ok:
+                    result.skipped = True
+                    logger.warning(f"[{step.factory.name}] skipping {step.name} — {dep} did not come up")
+                    return result
+            async with limits[step.factory.name]:
+                result.started = time.perf_counter() - started
+                try:
+                    result.product = await self._provision(step)
+                except Exception as e:
+                    result.error = e
+                    logger.error(f"[{step.factory.name}] {step.name} failed: {e}")
+                result.finished = time.perf_counter() - started
+            return result
+
+        for step in order:
+            tasks[step.name] = asyncio.ensure_future(run_step(step))
+        await asyncio.gather(*tasks.values())
+        report.seconds = time.perf_counter() - started
+        report.results = {step.name: report.results[step.name] for step in order}
+        logger.info(f"Provisioned {len(order) - len(report.failed) - len(report.skipped)}/{len(order)} "
+                    f"steps in {report.seconds:.2f}s")
+        return report
+
+    # Blocking convenience wrapper for callers without an event loop
+    def run_sync(self, plan: ProvisioningPlan) -> ProvisioningReport:
+        return asyncio.run(self.run(plan))
+
+    # Creates the product through its factory, then brings it up. The factory call runs on a
+    # worker thread too — it may block (e.g. a warm-pool checkout that falls back to a cold start).
+    async def _provision(self, step: Step) -> Any:
+        create, bring_up = PRODUCTS[step.kind]
+        product = await asyncio.get_running_loop().run_in_executor(None, getattr(step.factory, create))
+        action: Callable[[], Any] = getattr(product, bring_up)
+        if self.backend is not None:
+            await self.backend.execute(step.factory.name, step.kind, action)
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, action)
+        return product
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        limit = self.per_provider_limit
+        if isinstance(limit, Mapping):
+            limit = limit[provider]
+        # None = unlimited; a semaphore nobody can exhaust keeps run_step uniform
+        return asyncio.Semaphore(limit if limit is not None else 2 ** 30)
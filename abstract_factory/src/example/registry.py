@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+from importlib import import_module
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Type, Union
+
+from src.example.cloud_service import CloudServiceFactory
+
+if TYPE_CHECKING:
+    from importlib import metadata
+
+logger = logging.getLogger(__name__)
+
+# Entry-point group third-party providers register under, e.g. in their pyproject.toml:
+#   [project.entry-points."cloud_service.providers"]
+#   DigitalOcean = "do_cloud.factory:DigitalOceanFactory"
+ENTRY_POINT_GROUP = "cloud_service.providers"
+
+# Providers shipped with this package — name -> "module:attribute", imported only when asked for
+BUILTIN_PROVIDERS = {
+    "AWS": "src.example.providers.aws:AWSFactory",
+    "GCP": "src.example.providers.gcp:GCPFactory",
+    "Azure": "src.example.providers.azure:AZUREFactory",
+}
+
+
+# --- Provider Registry ---
+# Maps provider names to concrete factories without importing them up front.
+#   - a provider's module is imported the first time its factory is asked for, so startup
+#     cost follows the providers a process uses, not the ones installed
+#   - third-party providers are discovered through ENTRY_POINT_GROUP entry points; the
+#     metadata scan runs once, and only when a name isn't already known or names() is called
+#   - names are case-insensitive; get() hands out one shared factory per provider
+class ProviderRegistry():
+
+    def __init__(self, providers: Mapping[str, str] = BUILTIN_PROVIDERS,
+                 group: Optional[str] = ENTRY_POINT_GROUP):
+        self.group = group
+        self._names: Dict[str, str] = {}
+        self._targets: Dict[str, Union[str, Type[CloudServiceFactory]]] = {}
+        self._classes: Dict[str, Type[CloudServiceFactory]] = {}
+        self._factories: Dict[str, CloudServiceFactory] = {}
+        self._discovered = group is None
+        self._lock = threading.RLock()
+        for name, target in providers.items():
+            self.register(name, target)
+
+    # target: a factory class, or "module:attribute" to import on first use.
+    # Registering a name again replaces it, along with any factory already built from it.
+    def register(self, name: str, target: Union[str, Type[CloudServiceFactory]]):
+        key = name.casefold()
+        with self._lock:
+            self._names[key] = name
+            self._targets[key] = target
+            self._classes.pop(key, None)
+            self._factories.pop(key, None)
+
+    # Every known provider — built-in, registered and installed — without importing any of them
+    def names(self) -> List[str]:
+        self._discover()
+        with self._lock:
+            return sorted(self._names.values())
+
+    # Providers whose modules have been imported so far
+    def loaded(self) -> List[str]:
+        with self._lock:
+            return sorted(self._names[key] for key in self._classes)
+
+    def factory_class(self, name: str) -> Type[CloudServiceFactory]:
+        key = name.casefold()
+        with self._lock:
+            if key not in self._classes:
+                self._classes[key] = self._load(key, name)
+            return self._classes[key]
+
+    # The shared factory for a provider, created (and its module imported) on first call
+    def get(self, name: str) -> CloudServiceFactory:
+        key = name.casefold()
+        with self._lock:
+            if key not in self._factories:
+                self._factories[key] = self.factory_class(name)()
+            return self._factories[key]
+
+    # Imports every known provider — the startup cost of loading them all up front
+    def load_all(self) -> List[Type[CloudServiceFactory]]:
+        return [self.factory_class(name) for name in self.names()]
+
+    def _load(self, key: str, name: str) -> Type[CloudServiceFactory]:
+        if key not in self._targets:
+            self._discover()
+        if key not in self._targets:
+            raise KeyError(f"unknown cloud provider {name!r} (known: {', '.join(self.names())})")
+        target = self._targets[key]
+        if isinstance(target, str):
+            module, _, attribute = target.partition(":")
+            start = time.perf_counter()
+            target = import_module(module)
+            for part in filter(None, attribute.split(".")):
+                target = getattr(target, part)
+            logger.info(f"Loaded provider {self._names[key]} from {module} "
+                        f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+        if not (isinstance(target, type) and issubclass(target, CloudServiceFactory)):
+            raise TypeError(f"provider {name!r} is not a CloudServiceFactory: {target!r}")
+        return target
+
+    # Adds installed third-party providers; names registered explicitly or built in win
+    def _discover(self):
+        with self._lock:
+            if self._discovered:
+                return
+            self._discovered = True
+            for entry_point in _entry_points(self.group):
+                key = entry_point.name.casefold()
+                if key in self._targets:
+                    logger.warning(f"Ignoring entry point {entry_point.name} = {entry_point.value} "
+                                   f"— provider already registered")
+                    continue
+                self._names[key] = entry_point.name
+                self._targets[key] = entry_point.value
+
+
+def _entry_points(group: str) -> Iterable["metadata.EntryPoint"]:
+    # Imported here — importlib.metadata costs more to import than the built-in providers do
+    from importlib import metadata
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):     # Python 3.10+
+        return entry_points.select(group=group)
+    return entry_points.get(group, ())
+
+
+# The process-wide registry
+registry = ProviderRegistry()
+
+
+def get_factory(name: str) -> CloudServiceFactory:
+    return registry.get(name)
@@ -0,0 +1,44 @@
+import asyncio
+import logging
+import random
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from src.example.provisioning import DATABASE, STORAGE, VIRTUAL_MACHINE
+
+logger = logging.getLogger(__name__)
+
+# Seconds each provider takes to bring a product up — real clouds' ratios, scaled down so runs stay short
+DEFAULT_LATENCIES: Dict[str, Dict[str, float]] = {
+    "AWS": {VIRTUAL_MACHINE: 0.12, DATABASE: 0.09, STORAGE: 0.03},
+    "GCP": {VIRTUAL_MACHINE: 0.10, DATABASE: 0.08, STORAGE: 0.02},
+    "Azure": {VIRTUAL_MACHINE: 0.15, DATABASE: 0.10, STORAGE: 0.04},
+}
+
+
+# Raised by SimulatedBackend for injected failures
+class ProvisioningError(Exception):
+    pass
+
+
+# --- Simulated Backend ---
+# Stands in for the cloud APIs so orchestration can be measured offline: each call waits out
+# its provider's latency (± jitter, as a fraction of it), then runs the product's own method on a
+# worker thread — bring-ups may block, and must not stall the other steps on the event loop.
+# failure_rate injects errors; seed makes jitter and failures repeatable.
+class SimulatedBackend():
+
+    def __init__(self, latencies: Optional[Mapping[str, Mapping[str, float]]] = None, jitter: float = 0.1,
+                 failure_rate: float = 0.0, seed: Optional[int] = None):
+        self.latencies = DEFAULT_LATENCIES if latencies is None else latencies
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+
+    def latency(self, provider: str, kind: str) -> float:
+        return self.latencies[provider][kind] * (1 + self._rng.uniform(-self.jitter, self.jitter))
+
+    async def execute(self, provider: str, kind: str, action: Callable[[], Any]) -> Any:
+        await asyncio.sleep(self.latency(provider, kind))
+        if self._rng.random() < self.failure_rate:
+            raise ProvisioningError(f"{provider} {kind} provisioning failed (simulated)")
+        return await asyncio.get_running_loop().run_in_executor(None, action)
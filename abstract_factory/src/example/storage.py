@@ -1,26 +1,221 @@
+import io
 import logging
+import os
+import tempfile
+import time
+import uuid
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import BinaryIO, Optional, Union
 
 logger = logging.getLogger(__name__)
 
-# Abstract Product — interface for all cloud storage types
+MiB = 1024 * 1024
+
+
+# What put_object stored
+@dataclass
+class ObjectInfo():
+    key: str
+    size: int
+    parts: int
+
+
+# Abstract Product — interface for all cloud storage types.
+# Objects move in parts: uploads and downloads are split into part_size chunks that transfer
+# in parallel on a thread pool, and file objects are streamed — at most two parts per worker
+# are in memory, however large the object.
+# Every provider is backed by a local filesystem stand-in (one directory per provider under
+# `root`) so transfers can be measured offline; request_latency and bandwidth (bytes/s per
+# request) simulate the network. POSIX only — parts are written and read with pwrite/pread.
 class Storage(ABC):
+
+    DEFAULT_BUCKET = "storage"
+
+    def __init__(self, root: Optional[str] = None, part_size: int = 8 * MiB, max_workers: int = 8,
+                 request_latency: float = 0.0, bandwidth: Optional[float] = None):
+        root = root or os.path.join(tempfile.gettempdir(), "cloud-storage")
+        # Absolute and normalized, so key paths (normalized in _path) compare against it as-is
+        self.bucket = os.path.abspath(os.path.join(root, self.DEFAULT_BUCKET))
+        self.part_size = part_size
+        self.max_workers = max_workers
+        self.request_latency = request_latency
+        self.bandwidth = bandwidth
+        self._executor: Optional[ThreadPoolExecutor] = None
+
     @abstractmethod
     def connect_to_storage(self):
         pass
 
+    # Uploads bytes or a readable binary file object, part by part.
+    # The object appears only once every part is stored — readers never see half an upload.
+    def put_object(self, key: str, data: Union[bytes, BinaryIO], part_size: Optional[int] = None) -> ObjectInfo:
+        part_size = part_size or self.part_size
+        stream = io.BytesIO(data) if isinstance(data, (bytes, bytearray, memoryview)) else data
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        upload = f"{path}.{uuid.uuid4().hex}.upload"
+        fd = os.open(upload, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        in_flight = deque()
+        size = parts = 0
+        try:
+            while True:
+                chunk = stream.read(part_size)
+                if not chunk:
+                    break
+                in_flight.append(self._pool().submit(self._put_part, fd, size, chunk))
+                size += len(chunk)
+                parts += 1
+                # Bounded read-ahead keeps memory flat for large sources
+                while len(in_flight) >= 2 * self.max_workers:
+                    in_flight.popleft().result()
+            for future in in_flight:
+                future.result()
+        except BaseException:
+            self._settle(in_flight)
+            os.close(fd)
+            os.unlink(upload)
+            raise
+        os.close(fd)
+        os.replace(upload, path)
+        logger.info(f"Stored {key} ({size} bytes, {parts} parts) in {self.DEFAULT_BUCKET}")
+        return ObjectInfo(key, size, parts)
+
+    # Bytes [start, end) of an object (end=None: to the end); large ranges are fetched in parallel parts
+    def get_object(self, key: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        with self._open(key) as fd:
+            end = self._clamp(fd, start, end)
+            futures = [self._pool().submit(self._get_part, fd, offset, min(self.part_size, end - offset))
+                       for offset in range(start, end, self.part_size)]
+            try:
+                return b"".join(future.result() for future in futures)
+            finally:
+                self._settle(futures)
+
+    # Streams a whole object into a writable binary file object, parts fetched in parallel
+    # but written in order; returns the bytes written
+    def download_object(self, key: str, out: BinaryIO) -> int:
+        with self._open(key) as fd:
+            end = self._clamp(fd, 0, None)
+            in_flight = deque()
+            try:
+                for offset in range(0, end, self.part_size):
+                    in_flight.append(self._pool().submit(self._get_part, fd, offset,
+                                                         min(self.part_size, end - offset)))
+                    while len(in_flight) >= 2 * self.max_workers:
+                        out.write(in_flight.popleft().result())
+                while in_flight:
+                    out.write(in_flight.popleft().result())
+            finally:
+                self._settle(in_flight)
+            return end
+
+    def object_size(self, key: str) -> int:
+        try:
+            return os.path.getsize(self._path(key))
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def delete_object(self, key: str):
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix=f"{self.DEFAULT_BUCKET}-transfer")
+        return self._executor
+
+    # Cancels parts not yet started and waits for the running ones — called before the
+    # descriptor they use is closed, so no part ever touches a closed (or reused) fd
+    @staticmethod
+    def _settle(futures):
+        for future in futures:
+            future.cancel()
+        wait(futures)
+
+    # One part upload request
+    def _put_part(self, fd: int, offset: int, data: bytes):
+        self._simulate_network(len(data))
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view, offset = view[written:], offset + written
+
+    # One ranged GET request
+    def _get_part(self, fd: int, offset: int, length: int) -> bytes:
+        self._simulate_network(length)
+        chunks = []
+        while length:
+            chunk = os.pread(fd, length, offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            offset, length = offset + len(chunk), length - len(chunk)
+        return b"".join(chunks)
+
+    def _simulate_network(self, size: int):
+        delay = self.request_latency + (size / self.bandwidth if self.bandwidth else 0.0)
+        if delay:
+            time.sleep(delay)
+
+    # Keys are slash-separated paths inside the bucket; nothing may escape it
+    def _path(self, key: str) -> str:
+        path = os.path.normpath(os.path.join(self.bucket, key))
+        if not key or os.path.isabs(key) or not path.startswith(self.bucket + os.sep):
+            raise ValueError(f"invalid object key {key!r}")
+        return path
+
+    def _open(self, key: str) -> "_Descriptor":
+        try:
+            return _Descriptor(os.open(self._path(key), os.O_RDONLY))
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    @staticmethod
+    def _clamp(fd: int, start: int, end: Optional[int]) -> int:
+        size = os.fstat(fd).st_size
+        if not 0 <= start <= size:
+            raise ValueError(f"range start {start} outside object of {size} bytes")
+        return size if end is None else max(start, min(end, size))
+
+
+# An open file descriptor as a context manager
+class _Descriptor(int):
+
+    def __enter__(self) -> int:
+        return self
+
+    def __exit__(self, *exc):
+        os.close(self)
+
 
 # Concrete Product — AWS S3 bucket
 class AWS_Storage(Storage):
+    DEFAULT_BUCKET = "aws-s3"
+
     def connect_to_storage(self):
         logger.info("Connecting to AWS Storage")
 
 # Concrete Product — GCP Cloud Storage bucket
 class GCP_Storage(Storage):
+    DEFAULT_BUCKET = "gcp-cloud-storage"
+
     def connect_to_storage(self):
         logger.info("Connecting to GCP Storage")
 
 # Concrete Product — Azure Blob Storage
 class AZURE_Storage(Storage):
+    DEFAULT_BUCKET = "azure-blob"
+
     def connect_to_storage(self):
-        logger.info("Connecting to AZURE Storage")
\ No newline at end of file
+        logger.info("Connecting to AZURE Storage")
@@ -1,27 +1,47 @@
 import logging
+import time
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
-# Abstract Product — interface for all cloud VM types
+# Abstract Product — interface for all cloud VM types.
+# start_latency simulates how long a real instance takes to boot.
 class VirtualMachine(ABC):
 
+    def __init__(self, start_latency: float = 0.0):
+        self.start_latency = start_latency
+        self.running = False
+
     @abstractmethod
     def start_machine(self):
         pass
 
+    def stop_machine(self):
+        logger.info(f"Stopping {type(self).__name__}")
+        self.running = False
+
+    # Boots the instance; a no-op if it is already running (e.g. handed out by a warm pool)
+    def _boot(self):
+        if self.running:
+            return
+        time.sleep(self.start_latency)
+        self.running = True
+
 
 # Concrete Product — AWS EC2 instance
 class AWS_VM(VirtualMachine):
     def start_machine(self):
         logger.info("Starting AWS Virtual Machine instance")
+        self._boot()
 
 # Concrete Product — GCP Compute Engine instance
 class GCP_VM(VirtualMachine):
     def start_machine(self):
         logger.info("Starting GCP Virtual Machine instance")
+        self._boot()
 
 # Concrete Product — Azure VM instance
 class AZURE_VM(VirtualMachine):
     def start_machine(self):
-        logger.info("Starting AZURE Virtual Machine instance")
\ No newline at end of file
+        logger.info("Starting AZURE Virtual Machine instance")
+        self._boot()
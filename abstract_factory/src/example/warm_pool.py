@@ -0,0 +1,181 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Deque, Mapping, Optional, Tuple
+
+from src.example.cloud_service import CloudServiceFactory
+from src.example.virtual_machine import VirtualMachine
+
+logger = logging.getLogger(__name__)
+
+
+# Counters exposed by the warm pool
+@dataclass
+class WarmPoolStats():
+    requests: int = 0
+    hits: int = 0           # served by a pre-started VM
+    cold_starts: int = 0    # pool was empty — the caller waited for a full boot
+    boots: int = 0          # VMs started in the background
+    drained: int = 0        # idle VMs stopped because demand fell
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+
+# --- Warm VM Pool ---
+# Keeps pre-started VMs of one provider ready, so handing one out is a checkout, not a boot.
+#   - the target size follows demand: enough VMs to cover the requests expected while one
+#     VM boots (request rate over the last `window` seconds × boot time × headroom),
+#     clamped to min_size..max_size
+#   - a background thread tops the pool up to the target, booting VMs in parallel
+#   - VMs above the target that sat idle for drain_after seconds are stopped
+#   - an empty pool falls back to a cold start on the caller's thread
+class WarmVMPool():
+
+    def __init__(self, factory: CloudServiceFactory, min_size: int = 0, max_size: int = 16,
+                 initial_size: int = 2, window: float = 5.0, headroom: float = 1.5, drain_after: float = 5.0,
+                 vm_options: Optional[Mapping[str, Any]] = None, interval: float = 0.05):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("need 0 <= min_size <= max_size and max_size >= 1")
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.window = window
+        self.headroom = headroom
+        self.drain_after = drain_after
+        # Passed to factory.get_virtual_machine() for each VM
+        self.vm_options = dict(vm_options or {})
+        self.interval = interval
+        self.target = max(min_size, min(max_size, initial_size))
+        self.stats = WarmPoolStats()
+        self._lock = threading.Lock()
+        # Ready VMs, most recently ready last, each with the time it became ready
+        self._warm: Deque[Tuple[VirtualMachine, float]] = deque()
+        self._booting = 0
+        self._requests: Deque[float] = deque()
+        self._boot_time: Optional[float] = None     # EWMA of observed boot durations
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._boots = ThreadPoolExecutor(max_workers=max_size, thread_name_prefix=f"warm-{factory.name}")
+        self._thread = threading.Thread(target=self._run, name=f"warm-pool-{factory.name}", daemon=True)
+        self._thread.start()
+        logger.info(f"[{factory.name}] warm VM pool started ({min_size}..{max_size}, initially {self.target})")
+
+    @property
+    def warm(self) -> int:
+        return len(self._warm)
+
+    # A running VM — pre-started if one is ready, otherwise booted now
+    def checkout(self) -> VirtualMachine:
+        with self._lock:
+            self.stats.requests += 1
+            self._requests.append(time.monotonic())
+            vm = self._warm.pop()[0] if self._warm else None
+            if vm is not None:
+                self.stats.hits += 1
+            else:
+                self.stats.cold_starts += 1
+        # Replenish right away rather than at the next tick
+        self._wake.set()
+        if vm is None:
+            logger.warning(f"[{self.factory.name}] warm pool empty — cold-starting a VM")
+            vm = self._start_vm()
+        return vm
+
+    # Stops the background thread and every warm VM
+    def close(self):
+        self._closed.set()
+        self._wake.set()
+        self._thread.join()
+        self._boots.shutdown(wait=True)
+        with self._lock:
+            warm, self._warm = list(self._warm), deque()
+        for vm, _ in warm:
+            vm.stop_machine()
+        logger.info(f"[{self.factory.name}] warm VM pool closed — {self.stats}")
+
+    def _start_vm(self) -> VirtualMachine:
+        vm = self.factory.get_virtual_machine(**self.vm_options)
+        start = time.monotonic()
+        vm.start_machine()
+        seconds = time.monotonic() - start
+        with self._lock:
+            self._boot_time = seconds if self._boot_time is None else 0.8 * self._boot_time + 0.2 * seconds
+        return vm
+
+    def _boot_into_pool(self):
+        try:
+            vm = self._start_vm()
+        except Exception as e:
+            logger.error(f"[{self.factory.name}] background VM boot failed: {e}")
+            with self._lock:
+                self._booting -= 1
+            return
+        with self._lock:
+            self._booting -= 1
+            self.stats.boots += 1
+            if not self._closed.is_set():
+                self._warm.append((vm, time.monotonic()))
+                return
+        vm.stop_machine()
+
+    # VMs needed to cover the requests expected during one boot
+    def _target(self, now: float) -> int:
+        while self._requests and now - self._requests[0] > self.window:
+            self._requests.popleft()
+        if self._boot_time is None:
+            return self.target
+        rate = len(self._requests) / self.window
+        needed = math.ceil(rate * self._boot_time * self.headroom)
+        return max(self.min_size, min(self.max_size, needed))
+
+    def _run(self):
+        while not self._closed.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            with self._lock:
+                now = time.monotonic()
+                self.target = self._target(now)
+                # Oldest idle VMs go first, and only once they've been idle for drain_after
+                drain = []
+                while self._warm and len(self._warm) + self._booting > self.target \
+                        and now - self._warm[0][1] > self.drain_after:
+                    drain.append(self._warm.popleft()[0])
+                self.stats.drained += len(drain)
+                missing = max(0, self.target - len(self._warm) - self._booting)
+                self._booting += missing
+            for vm in drain:
+                vm.stop_machine()
+            for _ in range(missing):
+                self._boots.submit(self._boot_into_pool)
+
+
+# --- Warm Pool Factory ---
+# Wraps any CloudServiceFactory so get_virtual_machine() checks a running VM out of a WarmVMPool.
+# Databases and storage come straight from the wrapped factory.
+class WarmPoolFactory(CloudServiceFactory):
+
+    def __init__(self, factory: CloudServiceFactory, **pool_options):
+        super().__init__(factory.name)
+        self.factory = factory
+        self.pool = WarmVMPool(factory, **pool_options)
+
+    # VMs with their own options can't come from the pool — those are created as usual
+    def get_virtual_machine(self, **options):
+        if options:
+            return self.factory.get_virtual_machine(**options)
+        return self.pool.checkout()
+
+    def get_database(self, **options):
+        return self.factory.get_database(**options)
+
+    def get_storage(self, **options):
+        return self.factory.get_storage(**options)
+
+    def close(self):
+        self.pool.close()
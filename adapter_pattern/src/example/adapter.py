@@ -1,4 +1,34 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from src.example.customer import Customer
+from src.example.customer_batch import CustomerBatch
+from src.example.etag import compute_etag
+
+# A page of translated customers plus the cursor for the next page (None = last page)
+CustomerPage = Tuple[List[Customer], Optional[Any]]
+CustomerBatchPage = Tuple[CustomerBatch, Optional[Any]]
+# Customers modified since a watermark, the cursor for the next page, and the newest
+# modification time on the page (None if the page is empty)
+ChangePage = Tuple[List[Customer], Optional[Any], Optional[str]]
+
+
+# A page size below 1 would return empty pages whose cursor never moves — paging would never end
+def check_page_size(page_size: int):
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+
+# Outcome of a conditional fetch, HTTP-style:
+# 200 = changed (customer + new etag), 304 = caller's copy is current, 404 = no such customer
+@dataclass
+class ConditionalResult():
+    status: int
+    customer: Optional[Customer] = None
+    etag: Optional[str] = None
 
 
 # --- Target Interface ---
@@ -6,7 +36,109 @@ from abc import ABC, abstractmethod
 # Client code depends on this abstraction, not on any specific CRM API.
 class Adapter(ABC):
 
-    # Each adapter must translate its CRM's data into a common Customer format
+    # Each adapter must translate its CRM's data into a common Customer format.
+    # customer_id picks a specific customer (None = the CRM's default record);
+    # returns None when the CRM has no such customer.
+    @abstractmethod
+    def get_customer_data(self, customer_id: Optional[str] = None) -> Optional[Customer]:
+        pass
+
+    # Fetches a customer only if it changed since `etag` (None = unconditional).
+    # Default fetches the full record and compares content hashes; adapters whose CRM
+    # supports If-None-Match override this so unchanged records cost no payload.
+    def get_customer_conditional(self, customer_id: Optional[str] = None,
+                                 etag: Optional[str] = None) -> ConditionalResult:
+        customer = self.get_customer_data(customer_id)
+        if customer is None:
+            return ConditionalResult(404)
+        current = compute_etag((customer.id, customer.full_name, customer.email, customer.status))
+        if current == etag:
+            return ConditionalResult(304, etag=current)
+        return ConditionalResult(200, customer, current)
+
+
+# --- Capability: paged bulk fetches ---
+# Adapters whose CRM can list every customer page by page.
+class PagedAdapter(Adapter):
+
+    # Fetches one page of customers starting at `cursor` (None = first page).
+    # Cursors are opaque — each adapter uses whatever its CRM paginates with.
+    @abstractmethod
+    def fetch_customer_page(self, cursor: Optional[Any], page_size: int) -> CustomerPage:
+        pass
+
+    # Same as fetch_customer_page, but as one columnar CustomerBatch.
+    # Default converts the page; adapters can build columns straight from raw records.
+    def fetch_customer_batch(self, cursor: Optional[Any], page_size: int) -> CustomerBatchPage:
+        customers, next_cursor = self.fetch_customer_page(cursor, page_size)
+        return CustomerBatch.from_customers(customers), next_cursor
+
+    # Streams every customer, page by page.
+    # The next page is fetched on a background thread while the current one is consumed,
+    # so at most two pages are in memory regardless of the total customer count.
+    def iter_customers(self, page_size: int = 500) -> Iterator[Customer]:
+        check_page_size(page_size)
+        return chain.from_iterable(self._prefetch_pages(self.fetch_customer_page, page_size))
+
+    # Streams every customer as one CustomerBatch per page, with the same prefetching
+    def iter_customer_batches(self, page_size: int = 500) -> Iterator[CustomerBatch]:
+        check_page_size(page_size)
+        return self._prefetch_pages(self.fetch_customer_batch, page_size)
+
+    # Pulls pages from fetch(cursor, page_size), always one page ahead of the consumer
+    def _prefetch_pages(self, fetch, page_size: int) -> Iterator:
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_page = prefetcher.submit(fetch, None, page_size)
+            while next_page is not None:
+                page, cursor = next_page.result()
+                next_page = None if cursor is None else prefetcher.submit(fetch, cursor, page_size)
+                yield page
+
+
+# --- Capability: incremental fetches ---
+# Adapters whose CRM can list only the customers modified since a watermark.
+class IncrementalAdapter(Adapter):
+
+    # Fetches one page of customers modified after `since` (None = every customer), oldest change first.
+    # `since` is a watermark from an earlier page — the CRM's own modification timestamp.
+    @abstractmethod
+    def fetch_changed_page(self, since: Optional[str], cursor: Optional[Any], page_size: int) -> ChangePage:
+        pass
+
+
+# --- Capability: bulk exports ---
+# Adapters that can parse the bulk export files their CRM produces.
+class ExportingAdapter(Adapter):
+
+    # Streams the customers in a bulk export the CRM wrote to `stream` (a file, socket...), one at a time.
+    # The export is parsed incrementally, so memory doesn't grow with its size.
     @abstractmethod
-    def get_customer_data(self):
-        pass
\ No newline at end of file
+    def iter_export(self, stream: IO, buffer_size: int = 64 * 1024) -> Iterator[Customer]:
+        pass
+
+
+# --- Wrapping Adapter ---
+# Base for adapters that wrap another one (caching, scheduling...). A wrapper offers exactly the
+# capabilities of the adapter it wraps: FORWARDS lists a (capability, forwarding mixin) pair per
+# capability, and each instance's class mixes in only those the wrapped adapter actually has.
+class WrappingAdapter(Adapter):
+
+    FORWARDS: Tuple[Tuple[type, type], ...] = ()
+    _classes: Dict[Tuple[type, Tuple[type, ...]], type] = {}
+
+    def __new__(cls, adapter: Adapter, *args, **kwargs):
+        return super().__new__(cls._forwarding_class(adapter))
+
+    @classmethod
+    def _forwarding_class(cls, adapter: Adapter) -> type:
+        mixins = tuple(mixin for capability, mixin in cls.FORWARDS
+                       if isinstance(adapter, capability) and not issubclass(cls, mixin))
+        if not mixins:
+            return cls
+        forwarding = WrappingAdapter._classes.get((cls, mixins))
+        if forwarding is None:
+            # Same name as the wrapper, so logs and reprs don't show the generated class
+            forwarding = type(cls.__name__, (cls,) + mixins,
+                              {"__module__": cls.__module__, "__qualname__": cls.__qualname__})
+            WrappingAdapter._classes[(cls, mixins)] = forwarding
+        return forwarding
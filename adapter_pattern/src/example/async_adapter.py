@@ -0,0 +1,54 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Optional
+
+from src.example.adapter import CustomerPage, check_page_size
+from src.example.customer import Customer
+from src.example.http_pool import HttpConnectionPool
+
+# Path segment the stub server maps to the CRM's default record (customer_id=None)
+DEFAULT_CUSTOMER = "default"
+
+
+# --- Async Target Interface ---
+# Async counterpart of Adapter for CRMs reached over HTTP.
+# Each adapter owns a pool of keep-alive connections; the pool size doubles as the
+# adapter's concurrency limit, and every request is bounded by the pool's timeout.
+class AsyncAdapter(ABC):
+
+    def __init__(self, host: str, port: int, max_connections: int = 10, timeout: float = 10.0):
+        self.pool = HttpConnectionPool(host, port, max_connections=max_connections, timeout=timeout)
+
+    # Fetch one customer and translate it; None when the CRM has no such customer
+    @abstractmethod
+    async def aget_customer_data(self, customer_id: Optional[str] = None) -> Optional[Customer]:
+        pass
+
+    # Fetches one page of customers starting at `cursor` (None = first page)
+    @abstractmethod
+    async def afetch_customer_page(self, cursor: Optional[Any], page_size: int) -> CustomerPage:
+        pass
+
+    # Streams every customer, requesting the next page while the current one is consumed
+    async def aiter_customers(self, page_size: int = 500) -> AsyncIterator[Customer]:
+        check_page_size(page_size)
+        next_page = asyncio.ensure_future(self.afetch_customer_page(None, page_size))
+        try:
+            while next_page is not None:
+                customers, cursor = await next_page
+                next_page = None if cursor is None else asyncio.ensure_future(
+                    self.afetch_customer_page(cursor, page_size))
+                for customer in customers:
+                    yield customer
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def close(self):
+        await self.pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
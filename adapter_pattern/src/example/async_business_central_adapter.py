@@ -0,0 +1,26 @@
+import logging
+from typing import Optional
+from urllib.parse import quote
+
+from src.example.adapter import CustomerPage
+from src.example.async_adapter import DEFAULT_CUSTOMER, AsyncAdapter
+from src.example.business_central_adapter import BusinessCentralAdapter
+from src.example.customer import Customer
+
+logger = logging.getLogger(__name__)
+
+
+# --- Async Adapter B ---
+# Talks to the Business Central API over HTTP; same field mapping as BusinessCentralAdapter.
+class AsyncBusinessCentralAdapter(AsyncAdapter):
+
+    async def aget_customer_data(self, customer_id: Optional[str] = None) -> Optional[Customer]:
+        logger.debug("Adapting Business Central data → Customer (%s)", customer_id)
+        data = await self.pool.get_json(f"/businesscentral/customers/{quote(customer_id or DEFAULT_CUSTOMER, safe='')}")
+        return None if data is None else BusinessCentralAdapter.EXTRACTOR.extract(data)
+
+    # Business Central paginates by next link — the cursor is its skip token
+    async def afetch_customer_page(self, cursor, page_size: int) -> CustomerPage:
+        page = await self.pool.get_json("/businesscentral/customers", {"top": page_size, "skiptoken": cursor})
+        customers = BusinessCentralAdapter.EXTRACTOR.extract_page(page["value"])
+        return customers, page.get("@odata.nextLink")
@@ -0,0 +1,27 @@
+import logging
+from typing import Optional
+from urllib.parse import quote
+
+from src.example.adapter import CustomerPage
+from src.example.async_adapter import DEFAULT_CUSTOMER, AsyncAdapter
+from src.example.customer import Customer
+from src.example.net_suite_adapter import NetSuiteAdapter
+
+logger = logging.getLogger(__name__)
+
+
+# --- Async Adapter A ---
+# Talks to the NetSuite API over HTTP; same field mapping as NetSuiteAdapter.
+class AsyncNetSuiteAdapter(AsyncAdapter):
+
+    async def aget_customer_data(self, customer_id: Optional[str] = None) -> Optional[Customer]:
+        logger.debug("Adapting NetSuite data → Customer (%s)", customer_id)
+        data = await self.pool.get_json(f"/netsuite/customers/{quote(customer_id or DEFAULT_CUSTOMER, safe='')}")
+        return None if data is None else NetSuiteAdapter.EXTRACTOR.extract(data)
+
+    # NetSuite paginates by offset — the cursor is the next offset
+    async def afetch_customer_page(self, cursor, page_size: int) -> CustomerPage:
+        offset = cursor or 0
+        page = await self.pool.get_json("/netsuite/customers", {"offset": offset, "limit": page_size})
+        customers = NetSuiteAdapter.EXTRACTOR.extract_page(page["items"])
+        return customers, (offset + page["count"] if page["hasMore"] else None)
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import time
+
+from src.example.async_business_central_adapter import AsyncBusinessCentralAdapter
+from src.example.async_net_suite_adapter import AsyncNetSuiteAdapter
+from src.example.crm_stub_server import CrmStubServer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+LOOKUPS = 1000
+LATENCY = 0.01          # seconds the stub server adds to every response
+CUSTOMERS = 20_000
+
+
+async def lookups(adapter, ids):
+    return await asyncio.gather(*(adapter.aget_customer_data(customer_id) for customer_id in ids))
+
+
+async def main():
+    logger.info("=== Adapter Pattern — Async CRM Adapter Benchmark ===")
+    async with CrmStubServer(latency=LATENCY, total_customers=CUSTOMERS) as server:
+        ids = [str(100000 + i * 7 % CUSTOMERS) for i in range(LOOKUPS)]
+
+        for connections in (1, 10, 50, 200):
+            async with AsyncNetSuiteAdapter(server.host, server.port, max_connections=connections) as adapter:
+                start = time.perf_counter()
+                customers = await lookups(adapter, ids)
+                elapsed = time.perf_counter() - start
+                assert all(c is not None for c in customers)
+                logger.info("NetSuite lookups   | %3d connection(s) | %7.0f lookups/s | %4d connection(s) opened",
+                            connections, LOOKUPS / elapsed, adapter.pool.connections_opened)
+
+        # Same concurrency without keep-alive: every request pays a new TCP connection
+        async with AsyncNetSuiteAdapter(server.host, server.port, max_connections=50) as adapter:
+            adapter.pool.keep_alive = False
+            start = time.perf_counter()
+            await lookups(adapter, ids)
+            elapsed = time.perf_counter() - start
+            logger.info("NetSuite lookups   |  50 no keep-alive | %7.0f lookups/s | %4d connection(s) opened",
+                        LOOKUPS / elapsed, adapter.pool.connections_opened)
+
+        for adapter_type in (AsyncNetSuiteAdapter, AsyncBusinessCentralAdapter):
+            async with adapter_type(server.host, server.port) as adapter:
+                start = time.perf_counter()
+                count = 0
+                async for _ in adapter.aiter_customers(page_size=1000):
+                    count += 1
+                elapsed = time.perf_counter() - start
+                assert count == CUSTOMERS
+                logger.info("%-27s | bulk %7.0f customers/s", adapter_type.__name__, count / elapsed)
+
+
+if __name__ == '__main__':
+    # The adaptees log every lookup at INFO — keep them quiet while timing
+    logging.getLogger("src.example.net_suite_api").setLevel(logging.WARNING)
+    logging.getLogger("src.example.business_central_api").setLevel(logging.WARNING)
+    asyncio.run(main())
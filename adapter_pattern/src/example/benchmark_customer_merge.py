@@ -0,0 +1,118 @@
+import argparse
+import hashlib
+import logging
+import resource
+import time
+from difflib import SequenceMatcher
+from typing import Iterator
+
+from src.example.customer import Customer
+from src.example.customer_merge import CustomerMerger, normalize_email, normalize_name
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+# Names are built from syllables — a few accented, to exercise normalization
+SYLLABLES = ["an", "bel", "cor", "dan", "el", "fer", "gar", "hal", "is", "jor", "kel", "lin", "mar", "nor", "ol",
+             "pet", "quin", "ros", "sal", "tor", "ul", "ven", "wil", "xan", "yor", "zel", "bra", "chi", "dro", "fin",
+             "ga", "hu", "ith", "jo", "ka", "lo", "mu", "né", "øv", "prá"]
+NAIVE_RECORDS = 1000
+
+
+# Person i, derived from a hash of i so any source can regenerate it without shared state
+def person(i: int):
+    h = int.from_bytes(hashlib.blake2b(i.to_bytes(8, "little"), digest_size=8).digest(), "little")
+    n = len(SYLLABLES)
+    first = (SYLLABLES[h % n] + SYLLABLES[h // n % n]).capitalize()
+    last = "".join(SYLLABLES[h // n ** k % n] for k in range(2, 6)).capitalize()
+    return first, last, f"{first}.{last}.{i}@example.com".lower(), h // n ** 6
+
+
+# NetSuite has every person, exactly as entered
+def net_suite_customers(persons: int) -> Iterator[Customer]:
+    for i in range(persons):
+        first, last, email, _ = person(i)
+        yield Customer(str(100000 + i), f"{first} {last}", email, "ACTIVE")
+
+
+# Business Central has ~2/3 of them, entered differently, plus people NetSuite never saw:
+#   variant 0 — same email with different case and a +tag           → email match
+#   variant 1 — a work email and a mistyped, upper-cased name       → fuzzy name match
+#   variant 2 — not in Business Central
+def business_central_customers(persons: int) -> Iterator[Customer]:
+    for i in range(persons + persons // 5):
+        first, last, email, h = person(i)
+        variant = h % 3 if i < persons else 1
+        if variant == 0:
+            local, _, domain = email.partition("@")
+            yield Customer(f"BC-{i:08d}", f"{first} {last}", f" {local.upper()}+bc@{domain}", "ACTIVE")
+        elif variant == 1:
+            p = 1 + h // 3 % (len(last) - 2)
+            typo = last[:p] + last[p + 1] + last[p] + last[p + 2:]
+            yield Customer(f"BC-{i:08d}", f"{first} {typo}".upper(), f"{first}.{i}@work.example", "ACTIVE")
+
+
+# Golden records whose members are all the same person, and cross-CRM pairs found
+def accuracy(merger: CustomerMerger, persons: int):
+    pure = total = pairs = 0
+    for record in merger.golden_records():
+        ids = {int(sid) - 100000 if source == "netsuite" else int(sid[3:]) for source, sid in record.members}
+        total += 1
+        pure += len(ids) == 1
+        pairs += len(ids) == 1 and len(record.members) == 2
+    expected_pairs = sum(1 for i in range(persons) if person(i)[3] % 3 != 2)
+    return pure / total, pairs / expected_pairs
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# The nested-loop approach: compare every record with every golden record so far
+def naive_merge(customers):
+    golden = []
+    for c in customers:
+        email, name = normalize_email(c.email), normalize_name(c.full_name)
+        for g in golden:
+            if g[0] == email or SequenceMatcher(None, g[1], name).ratio() >= 0.9:
+                break
+        else:
+            golden.append((email, name))
+    return golden
+
+
+def run(persons: int):
+    merger = CustomerMerger(source_priority=["netsuite", "business_central"])
+    start = time.perf_counter()
+    merger.add("netsuite", net_suite_customers(persons))
+    merger.add("business_central", business_central_customers(persons))
+    elapsed = time.perf_counter() - start
+    stats = merger.stats
+    purity, recall = accuracy(merger, persons)
+    logger.info("%10d records | %7.1fs | %7.0f records/s | %9d golden | purity %.4f | recall %.4f | peak RSS %4.0f MB",
+                stats.records, elapsed, stats.records / elapsed, len(merger), purity, recall, peak_rss_mb())
+    logger.info("  %s", stats)
+    merger.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the cross-CRM customer merge engine")
+    parser.add_argument("--persons", type=int, nargs="+", default=[100_000, 1_000_000],
+                        help="people per run (records ≈ 1.87 × persons); e.g. 5400000 for ~10M records")
+    args = parser.parse_args()
+    logger.info("=== Adapter Pattern — Customer Merge Benchmark ===")
+
+    customers = list(net_suite_customers(NAIVE_RECORDS // 2)) + list(business_central_customers(NAIVE_RECORDS // 2))
+    start = time.perf_counter()
+    naive_merge(customers)
+    elapsed = time.perf_counter() - start
+    logger.info("%10d records | %7.1fs | %7.0f records/s | nested loops (quadratic — slows as data grows)",
+                len(customers), elapsed, len(customers) / elapsed)
+
+    # Peak RSS is cumulative — a flat value across growing runs means memory stays bounded
+    for persons in args.persons:
+        run(persons)
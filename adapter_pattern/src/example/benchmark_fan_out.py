@@ -0,0 +1,89 @@
+import logging
+import random
+import threading
+import time
+
+from src.example.adapter import Adapter
+from src.example.business_central_adapter import BusinessCentralAdapter
+from src.example.business_central_api import BusinessCentralApi
+from src.example.client import Client
+from src.example.fan_out_client import FIRST, MERGE, FanOutClient
+from src.example.net_suite_adapter import NetSuiteAdapter
+from src.example.net_suite_api import NetSuiteApi
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+LOOKUPS = 500
+MEDIAN_LATENCY = 0.004      # seconds
+STALL_RATE = 0.03           # fraction of requests that stall (GC pause, cold cache, noisy neighbour...)
+STALL_LATENCY = 0.15
+
+
+# Wraps an adapter with a long-tailed latency: mostly a few ms, occasionally a stall
+class SlowAdapter(Adapter):
+
+    def __init__(self, adapter: Adapter, seed: int):
+        self.adapter = adapter
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def get_customer_data(self, customer_id=None):
+        with self._lock:
+            stall = self._rng.random() < STALL_RATE
+            delay = STALL_LATENCY if stall else self._rng.lognormvariate(0, 0.3) * MEDIAN_LATENCY
+        time.sleep(delay)
+        return self.adapter.get_customer_data(customer_id)
+
+
+def percentiles(latencies):
+    latencies = sorted(latencies)
+    return [latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1000 for p in (50, 95, 99, 100)]
+
+
+def measure(label, lookup, ids, stats=None):
+    latencies = []
+    for ns_id, bc_id in ids:
+        start = time.perf_counter()
+        customer = lookup(ns_id, bc_id)
+        latencies.append(time.perf_counter() - start)
+        assert customer is not None
+    p50, p95, p99, worst = percentiles(latencies)
+    extra = f" | {stats.hedges:3d} hedges, {stats.hedge_wins:3d} won" if stats is not None else ""
+    logger.info("%-36s | p50 %5.1f ms | p95 %5.1f ms | p99 %6.1f ms | max %6.1f ms%s",
+                label, p50, p95, p99, worst, extra)
+
+
+if __name__ == '__main__':
+    # The adaptees and adapters log every lookup at INFO — keep them quiet while timing
+    for name in ("net_suite_api", "net_suite_adapter", "business_central_api", "business_central_adapter",
+                 "client", "fan_out_client"):
+        logging.getLogger(f"src.example.{name}").setLevel(logging.WARNING)
+    logger.info("=== Adapter Pattern — Fan-Out Client Benchmark (%d lookups) ===", LOOKUPS)
+
+    net = SlowAdapter(NetSuiteAdapter(NetSuiteApi()), seed=1)
+    bc = SlowAdapter(BusinessCentralAdapter(BusinessCentralApi()), seed=2)
+    rng = random.Random(42)
+    ids = [(str(100000 + i), f"BC-{i:08d}") for i in (rng.randrange(1000) for _ in range(LOOKUPS))]
+
+    # One Client per CRM, one after another
+    net_client, bc_client = Client(net), Client(bc)
+    measure("sequential clients, both CRMs", lambda n, b: (net_client.process_customer_data(n),
+                                                          bc_client.process_customer_data(b))[0], ids)
+
+    for label, mode, hedge in (("fan-out, merge, no hedging", MERGE, None),
+                               ("fan-out, merge, hedge at p90", MERGE, 90.0),
+                               ("fan-out, first answer, hedge at p90", FIRST, 90.0)):
+        client = FanOutClient({"netsuite": net, "business_central": bc}, timeouts=1.0,
+                              hedge_percentile=hedge, mode=mode)
+        # Warm the latency trackers so hedging has percentiles to work from
+        for ns_id, bc_id in ids[:50]:
+            client.process_customer_data({"netsuite": ns_id, "business_central": bc_id})
+        client.stats.hedges = client.stats.hedge_wins = 0
+        measure(label, lambda n, b: client.process_customer_data({"netsuite": n, "business_central": b}),
+                ids, client.stats)
+        client.close()
@@ -0,0 +1,57 @@
+import logging
+import timeit
+
+from src.example.customer import Customer
+from src.example.field_mapping import Field, FieldMapping
+from src.example.net_suite_adapter import NetSuiteAdapter
+from src.example.net_suite_api import NetSuiteApi
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 10_000
+REPEAT = 20
+
+
+# The translation NetSuiteAdapter used to hand-write per record
+def handwritten(data) -> Customer:
+    return Customer(
+        id=data["customer_id"],
+        full_name=data["name"],
+        email=data["email"],
+        status=data["status"]
+    )
+
+
+def per_record_ns(fn) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=REPEAT)) / PAGE_SIZE * 1e9
+
+
+if __name__ == '__main__':
+    logger.info("=== Adapter Pattern — Field Mapping Benchmark ===")
+    records = NetSuiteApi(PAGE_SIZE).list_customers(limit=PAGE_SIZE)["items"]
+    extractor = NetSuiteAdapter.EXTRACTOR
+    assert extractor.extract_page(records) == [handwritten(r) for r in records]
+
+    logger.info("%-28s | %6.0f ns/record", "handwritten, per record", per_record_ns(lambda: [handwritten(r) for r in records]))
+    logger.info("%-28s | %6.0f ns/record", "compiled, per record", per_record_ns(lambda: [extractor.extract(r) for r in records]))
+    logger.info("%-28s | %6.0f ns/record", "compiled, whole page", per_record_ns(lambda: extractor.extract_page(records)))
+    logger.info("%-28s | %6.0f ns/record", "compiled, columnar batch", per_record_ns(lambda: extractor.extract_batch(records)))
+
+    # Nested paths and converters take the column-by-column route
+    nested_records = [{"id": int(r["customer_id"]), "profile": {"name": r["name"], "contact": {"email": r["email"]}},
+                       "state": r["status"].lower()} for r in records]
+    nested = FieldMapping(id=Field("id", str), full_name="profile.name", email="profile.contact.email",
+                          status=Field("state", str.upper)).compile()
+    assert nested.extract_page(nested_records) == extractor.extract_page(records)
+
+    def nested_handwritten():
+        return [Customer(str(r["id"]), r["profile"]["name"], r["profile"]["contact"]["email"], r["state"].upper())
+                for r in nested_records]
+
+    logger.info("%-28s | %6.0f ns/record", "nested, handwritten", per_record_ns(nested_handwritten))
+    logger.info("%-28s | %6.0f ns/record", "nested, compiled page", per_record_ns(lambda: nested.extract_page(nested_records)))
@@ -0,0 +1,89 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import socket
+import tempfile
+import threading
+import time
+
+from src.example.net_suite_adapter import NetSuiteAdapter
+from src.example.net_suite_api import NetSuiteApi
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+METHODS = ("json.load", "streaming, file", "streaming, socket")
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# Parses one export in a fresh process, so each method's peak memory is its own
+def parse(method: str, path: str, customers: int, results):
+    logging.getLogger("src.example.net_suite_api").setLevel(logging.WARNING)
+    logging.getLogger("src.example.net_suite_adapter").setLevel(logging.WARNING)
+    adapter = NetSuiteAdapter(NetSuiteApi(customers))
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    if method == "json.load":
+        # Today's path: materialize the whole document, then translate
+        with open(path, "rb") as f:
+            items = json.load(f)["items"]
+        count = sum(1 for _ in map(adapter.EXTRACTOR.extract, items))
+    elif method == "streaming, file":
+        with open(path, "rb") as f:
+            count = sum(1 for _ in adapter.iter_export(f))
+    else:
+        # NetSuite writes the export straight into a socket; nothing touches disk
+        reader, writer = socket.socketpair()
+
+        def send():
+            with writer, writer.makefile("wb") as out:
+                adapter.net_suite_api.export_customers(out)
+
+        sender = threading.Thread(target=send)
+        sender.start()
+        with reader, reader.makefile("rb") as stream:
+            count = sum(1 for _ in adapter.iter_export(stream))
+        sender.join()
+    results.put((count, time.perf_counter() - start, peak_rss_mb() - baseline))
+
+
+def run(customers: int):
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "wb") as out:
+        NetSuiteApi(customers).export_customers(out)
+    size_mb = os.path.getsize(path) / 2 ** 20
+    spawn = multiprocessing.get_context("spawn")
+    try:
+        for method in METHODS:
+            results = spawn.Queue()
+            child = spawn.Process(target=parse, args=(method, path, customers, results))
+            child.start()
+            count, elapsed, rss = results.get()
+            child.join()
+            assert count == customers
+            logger.info("%9d customers | %6.1f MB export | %-17s | %5.2fs | %8.0f customers/s | +%6.1f MB peak RSS",
+                        customers, size_mb, method, elapsed, count / elapsed, rss)
+    finally:
+        os.unlink(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark streaming vs whole-document parsing of CRM exports")
+    parser.add_argument("--customers", type=int, nargs="+", default=[100_000, 1_000_000],
+                        help="customers per export")
+    args = parser.parse_args()
+    logging.getLogger("src.example.net_suite_api").setLevel(logging.WARNING)
+    logger.info("=== Adapter Pattern — Streaming Export Parser Benchmark ===")
+    # Peak RSS that stays flat as the export grows means memory is independent of export size
+    for customers in args.customers:
+        run(customers)
@@ -0,0 +1,163 @@
+import logging
+import multiprocessing
+import os
+import statistics
+import threading
+import time
+
+from src.example.client import Client
+from src.example.net_suite_adapter import NetSuiteAdapter
+from src.example.net_suite_api import NetSuiteApi
+from src.example.rate_limiter import SharedTokenBucket, TokenBucket
+from src.example.request_scheduler import BULK, RequestScheduler
+from src.example.scheduled_adapter import ScheduledAdapter
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+QUOTA = 400             # requests per second NetSuite allows, across every process
+BURST = 40
+# Client buckets burst a little less than the server allows: requests reach NetSuite a moment
+# after their token is granted, and that jitter can bunch a full burst together
+CLIENT_BURST = BURST * 0.9
+PROCESSES = 4
+LOOKUPS = 300           # per process
+QUIET = ("net_suite_api", "net_suite_adapter", "client", "rate_limiter", "scheduled_adapter")
+
+
+# NetSuite with a meter: records when each request arrives, and can be made slow
+class MeteredNetSuiteApi(NetSuiteApi):
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__()
+        self.latency = latency
+        self.arrivals = []
+
+    def get_customer(self, customer_id=None):
+        self.arrivals.append(time.time())
+        time.sleep(self.latency)
+        return super().get_customer(customer_id)
+
+    def list_customers(self, offset=0, limit=1000):
+        self.arrivals.append(time.time())
+        time.sleep(self.latency)
+        return super().list_customers(offset, limit)
+
+
+# One worker process: its own Client, hammering NetSuite as fast as it can
+def worker(limiter: str, bucket_name: str, results):
+    for name in QUIET:
+        logging.getLogger(f"src.example.{name}").setLevel(logging.WARNING)
+    api = MeteredNetSuiteApi()
+    adapter = NetSuiteAdapter(api)
+    if limiter == "per-process":
+        adapter = ScheduledAdapter(adapter, RequestScheduler(TokenBucket(QUOTA, CLIENT_BURST)))
+    elif limiter == "shared":
+        bucket = SharedTokenBucket(bucket_name, QUOTA, CLIENT_BURST)
+        adapter = ScheduledAdapter(adapter, RequestScheduler(bucket))
+    client = Client(adapter)
+    for i in range(LOOKUPS):
+        client.process_customer_data(str(100000 + (os.getpid() * 7 + i) % 1000))
+    results.put(api.arrivals)
+
+
+# Replays every arrival through NetSuite's own bucket: anything it rejects would have been a 429
+def server_side(arrivals, started):
+    clock = [started]
+    quota = TokenBucket(QUOTA, BURST, clock=lambda: clock[0])
+    throttled = 0
+    for t in sorted(arrivals):
+        clock[0] = t
+        throttled += quota.try_acquire() > 0.0
+    return throttled
+
+
+def cross_process(limiter: str):
+    bucket_name = f"netsuite-quota-{os.getpid()}"
+    owner = SharedTokenBucket(bucket_name, QUOTA, CLIENT_BURST) if limiter == "shared" else None
+    results = multiprocessing.Queue()
+    started = time.time()
+    processes = [multiprocessing.Process(target=worker, args=(limiter, bucket_name, results))
+                 for _ in range(PROCESSES)]
+    for p in processes:
+        p.start()
+    arrivals = [t for _ in processes for t in results.get()]
+    for p in processes:
+        p.join()
+    if owner is not None:
+        owner.close()
+        owner.unlink()
+    elapsed = max(arrivals) - started
+    throttled = server_side(arrivals, started)
+    logger.info("%-26s | %5d requests | %5.2fs | %6.0f req/s (quota %d) | %4d would be 429s",
+                limiter, len(arrivals), elapsed, len(arrivals) / elapsed, QUOTA, throttled)
+
+
+# Four bulk exports saturate the quota while a user looks customers up every 20 ms
+def lanes(prioritized: bool):
+    api = MeteredNetSuiteApi()
+    scheduler = RequestScheduler(TokenBucket(200, 10))
+    adapter = ScheduledAdapter(NetSuiteAdapter(api), scheduler)
+    stop = threading.Event()
+
+    def export():
+        while not stop.is_set():
+            adapter.fetch_customer_page(0, 50)
+
+    exports = [threading.Thread(target=export) for _ in range(4)]
+    for t in exports:
+        t.start()
+    latencies = []
+    started = time.perf_counter()
+    for i in range(100):
+        start = time.perf_counter()
+        if prioritized:
+            adapter.get_customer_data(str(100000 + i))
+        else:
+            # Same scheduler, but the lookup queues behind the exports
+            scheduler.call(BULK, None, adapter.adapter.get_customer_data, str(100000 + i))
+        latencies.append(time.perf_counter() - start)
+        time.sleep(0.02)
+    stop.set()
+    elapsed = time.perf_counter() - started
+    for t in exports:
+        t.join()
+    latencies.sort()
+    logger.info("%-26s | lookup p50 %5.1f ms | p99 %5.1f ms | exports %4.0f pages/s",
+                "priority lanes" if prioritized else "one FIFO lane", statistics.median(latencies) * 1000,
+                latencies[98] * 1000, (len(api.arrivals) - len(latencies)) / elapsed)
+
+
+# Fifty callers ask for the same customer at once; NetSuite takes 20 ms to answer
+def coalescing():
+    api = MeteredNetSuiteApi(latency=0.02)
+    adapter = ScheduledAdapter(NetSuiteAdapter(api), RequestScheduler(TokenBucket(QUOTA, BURST)))
+    barrier = threading.Barrier(50)
+
+    def lookup():
+        barrier.wait()
+        assert adapter.get_customer_data("100042") is not None
+
+    callers = [threading.Thread(target=lookup) for _ in range(50)]
+    for t in callers:
+        t.start()
+    for t in callers:
+        t.join()
+    logger.info("%-26s | 50 lookups → %d NetSuite request(s), %d coalesced",
+                "coalescing", len(api.arrivals), adapter.scheduler.stats.coalesced)
+
+
+if __name__ == '__main__':
+    for name in QUIET:
+        logging.getLogger(f"src.example.{name}").setLevel(logging.WARNING)
+    logger.info("=== Adapter Pattern — Rate Limiter Benchmark (%d processes × %d lookups, quota %d/s burst %d) ===",
+                PROCESSES, LOOKUPS, QUOTA, BURST)
+    for limiter in ("unlimited", "per-process", "shared"):
+        cross_process(limiter)
+    lanes(prioritized=False)
+    lanes(prioritized=True)
+    coalescing()
@@ -0,0 +1,101 @@
+import logging
+import os
+import random
+import tempfile
+import time
+
+from src.example.caching_adapter import CachingAdapter
+from src.example.net_suite_adapter import NetSuiteAdapter
+from src.example.net_suite_api import NetSuiteApi
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+CUSTOMERS = 5000
+LOOKUPS = 10_000
+LATENCY = 0.0005        # seconds per CRM round trip
+PAYLOAD_LATENCY = 0.0005  # extra seconds when a full record is transferred
+TTL = 60.0
+
+
+# NetSuiteApi with simulated network cost: every call pays a round trip, full records pay more
+class SlowNetSuiteApi(NetSuiteApi):
+
+    def __init__(self, total_customers: int):
+        super().__init__(total_customers)
+        self.calls = 0
+        self.payloads = 0
+
+    def get_customer(self, customer_id=None):
+        self.calls += 1
+        self.payloads += 1
+        time.sleep(LATENCY + PAYLOAD_LATENCY)
+        return super().get_customer(customer_id)
+
+    def get_customer_conditional(self, customer_id=None, if_none_match=None):
+        self.calls += 1
+        status, record, etag = super().get_customer_conditional(customer_id, if_none_match)
+        self.payloads += status == 200
+        time.sleep(LATENCY + (PAYLOAD_LATENCY if status == 200 else 0))
+        return status, record, etag
+
+
+# Skewed ids, like real traffic: a few customers are looked up far more often than the rest.
+# One in twenty lookups is for a customer that doesn't exist.
+def workload(seed: int = 42):
+    rng = random.Random(seed)
+    ids = []
+    for _ in range(LOOKUPS):
+        if rng.random() < 0.05:
+            ids.append(str(900000 + rng.randrange(100)))
+        else:
+            ids.append(str(100000 + min(int(rng.paretovariate(0.5)) - 1, CUSTOMERS - 1)))
+    return ids
+
+
+def run(adapter, api, ids, clock=None, label=""):
+    start = time.perf_counter()
+    for i, customer_id in enumerate(ids):
+        if clock is not None:
+            clock[0] += 0.01                          # 10 ms of simulated time per lookup
+            if i % 1000 == 0:
+                api.update_customer(customer_id, status="INACTIVE")
+        adapter.get_customer_data(customer_id)
+    elapsed = time.perf_counter() - start
+    logger.info("%-24s | %8.0f lookups/s | %6d CRM calls | %6d payloads", label, len(ids) / elapsed, api.calls, api.payloads)
+
+
+if __name__ == '__main__':
+    # The adaptees log every lookup at INFO — keep them quiet while timing
+    logging.getLogger("src.example.net_suite_api").setLevel(logging.WARNING)
+    logging.getLogger("src.example.net_suite_adapter").setLevel(logging.WARNING)
+    logger.info("=== Adapter Pattern — Response Cache Benchmark ===")
+    ids = workload()
+
+    api = SlowNetSuiteApi(CUSTOMERS)
+    run(NetSuiteAdapter(api), api, ids, label="uncached")
+
+    # Simulated clock: the run spans ~100 s, so TTL=60 s forces revalidation along the way
+    with tempfile.TemporaryDirectory() as tmp:
+        disk_path = os.path.join(tmp, "customer_cache.sqlite")
+        clock = [time.time()]
+        api = SlowNetSuiteApi(CUSTOMERS)
+        cache = CachingAdapter(NetSuiteAdapter(api), ttl=TTL, max_entries=500, disk_path=disk_path,
+                               clock=lambda: clock[0])
+        run(cache, api, ids, clock, label="cached, cold")
+        logger.info("  %s", cache.stats)
+        cache.close()
+
+        # "Restart": a new process with an empty memory tier, an hour later — every entry is stale,
+        # but its ETag turns the refetch into a 304
+        clock[0] += 3600
+        api.calls = api.payloads = 0
+        cache = CachingAdapter(NetSuiteAdapter(api), ttl=TTL, max_entries=500, disk_path=disk_path,
+                               clock=lambda: clock[0])
+        run(cache, api, ids, clock, label="cached, warm from disk")
+        logger.info("  %s", cache.stats)
+        cache.close()
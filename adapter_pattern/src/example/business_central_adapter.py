@@ -1,7 +1,11 @@
 import logging
+from typing import IO, Iterator, Optional
 
-from src.example.adapter import Adapter
+from src.example.adapter import (ChangePage, ConditionalResult, CustomerBatchPage, CustomerPage,
+                                 ExportingAdapter, IncrementalAdapter, PagedAdapter)
 from src.example.customer import Customer
+from src.example.field_mapping import FieldMapping
+from src.example.json_stream import iter_json_array
 
 logger = logging.getLogger(__name__)
 
@@ -9,7 +13,10 @@ logger = logging.getLogger(__name__)
 # --- Adapter B ---
 # Wraps BusinessCentralApi and translates its response into the unified Customer format.
 # Maps: customerId → id, fullName → full_name, emailID → email, status → status
-class BusinessCentralAdapter(Adapter):
+class BusinessCentralAdapter(PagedAdapter, IncrementalAdapter, ExportingAdapter):
+
+    # Declarative mapping, compiled once into a fast extractor
+    EXTRACTOR = FieldMapping(id="customerId", full_name="fullName", email="emailID", status="status").compile()
 
     def __init__(self, business_central_api):
         # Compose the adaptee (BusinessCentralApi) inside the adapter
@@ -17,13 +24,36 @@ class BusinessCentralAdapter(Adapter):
         logger.info("BusinessCentralAdapter created")
 
     # Fetch from Business Central and translate to Customer dataclass
-    def get_customer_data(self) -> Customer:
+    def get_customer_data(self, customer_id: Optional[str] = None) -> Optional[Customer]:
         logger.info("Adapting Business Central data → Customer")
-        data = self.business_central_api.get_customer()
-
-        return Customer(
-            id=data["customerId"],
-            full_name=data["fullName"],
-            email=data["emailID"],
-            status=data["status"]
-        )
+        data = self.business_central_api.get_customer(customer_id)
+        return None if data is None else self.EXTRACTOR.extract(data)
+
+    # Business Central honours If-None-Match — an unchanged record comes back as a bare 304
+    def get_customer_conditional(self, customer_id: Optional[str] = None,
+                                 etag: Optional[str] = None) -> ConditionalResult:
+        status, data, new_etag = self.business_central_api.get_customer_conditional(customer_id, if_none_match=etag)
+        return ConditionalResult(status, None if data is None else self.EXTRACTOR.extract(data), new_etag)
+
+    # Business Central paginates by next link — the cursor is its skip token
+    def fetch_customer_page(self, cursor, page_size: int) -> CustomerPage:
+        page = self.business_central_api.list_customers(top=page_size, skiptoken=cursor)
+        customers = self.EXTRACTOR.extract_page(page["value"])
+        return customers, page.get("@odata.nextLink")
+
+    # Columnar variant — columns come straight from the raw records
+    def fetch_customer_batch(self, cursor, page_size: int) -> CustomerBatchPage:
+        page = self.business_central_api.list_customers(top=page_size, skiptoken=cursor)
+        batch = self.EXTRACTOR.extract_batch(page["value"])
+        return batch, page.get("@odata.nextLink")
+
+    # Business Central's $filter on lastModifiedDateTime — the cursor is its skip token
+    def fetch_changed_page(self, since, cursor, page_size: int) -> ChangePage:
+        page = self.business_central_api.list_modified_customers(modified_since=since, top=page_size, skiptoken=cursor)
+        value = page["value"]
+        watermark = value[-1]["lastModifiedDateTime"] if value else None
+        return self.EXTRACTOR.extract_page(value), page.get("@odata.nextLink"), watermark
+
+    # Business Central exports are one JSON document with the customers under "value"
+    def iter_export(self, stream: IO, buffer_size: int = 64 * 1024) -> Iterator[Customer]:
+        return map(self.EXTRACTOR.extract, iter_json_array(stream, ("value",), buffer_size))
@@ -1,19 +1,124 @@
+import json
 import logging
+from itertools import islice
+from typing import IO, Optional, Tuple
+
+from src.example.etag import compute_etag
+from src.example.modification_log import ModificationLog
 
 logger = logging.getLogger(__name__)
 
 
 # --- Adaptee B ---
 # Simulates the Business Central CRM API with its own field naming convention.
-# Fields: customerId, fullName, emailID, status
+# Fields: customerId, fullName, emailID, status, lastModifiedDateTime
 class BusinessCentralApi():
 
-    # Returns raw customer data in Business Central's format
-    def get_customer(self):
+    def __init__(self, total_customers: int = 1000):
+        # Size of the simulated customer base for list_customers()
+        self.total_customers = total_customers
+        # Records edited or added since the API came up, in modification order
+        self._changes = ModificationLog(id_field="customerId", modified_field="lastModifiedDateTime")
+
+    # Returns raw customer data in Business Central's format.
+    # With a customer_id, looks up a simulated customer (None if there's no such customer).
+    def get_customer(self, customer_id: Optional[str] = None):
         logger.info("Fetching customer data from Business Central API")
+        return self._lookup(customer_id)
+
+    # Conditional GET, like If-None-Match: returns (status, record, etag).
+    # 304 with no record when `if_none_match` is still the current ETag, 404 for unknown ids.
+    def get_customer_conditional(self, customer_id: Optional[str] = None,
+                                 if_none_match: Optional[str] = None) -> Tuple[int, Optional[dict], Optional[str]]:
+        logger.info("Conditionally fetching customer data from Business Central API")
+        record = self._lookup(customer_id)
+        if record is None:
+            return 404, None, None
+        etag = compute_etag(record.values())
+        if etag == if_none_match:
+            return 304, None, etag
+        return 200, record, etag
+
+    # Simulates an edit made in Business Central — changes the record's ETag and lastModifiedDateTime
+    def update_customer(self, customer_id: str, **changes):
+        record = self._lookup(customer_id)
+        if record is None:
+            raise KeyError(customer_id)
+        self._changes.put({**record, **changes})
+
+    # Simulates a customer created in Business Central; returns its id
+    def add_customer(self, **fields) -> str:
+        record = {**self._generate(self.total_customers), **fields}
+        self.total_customers += 1
+        return self._changes.put(record)["customerId"]
+
+    # Server-driven pagination, OData-style: {value, @odata.nextLink}.
+    # The next link is an opaque skip token; it's absent on the last page.
+    def list_customers(self, top: int = 1000, skiptoken: Optional[str] = None):
+        start = int(skiptoken) if skiptoken else 0
+        logger.debug("Fetching Business Central customers %d..%d", start, start + top)
+        end = min(start + top, self.total_customers)
+        page = {"value": [self._record(i) for i in range(start, end)]}
+        if end < self.total_customers:
+            page["@odata.nextLink"] = str(end)
+        return page
+
+    # $filter=lastModifiedDateTime gt {modified_since}&$orderby=lastModifiedDateTime, OData-style.
+    # The next link is an opaque keyset token ("modified|id"); it's absent on the last page.
+    def list_modified_customers(self, modified_since: Optional[str] = None, top: int = 1000,
+                                skiptoken: Optional[str] = None):
+        logger.debug("Fetching Business Central customers modified since %s", modified_since)
+        after = tuple(skiptoken.split("|", 1)) if skiptoken else None
+        value = list(islice(self._changes.scan(self.total_customers, self._record, self._index,
+                                               modified_since, after), top + 1))
+        page = {"value": value[:top]}
+        if len(value) > top:
+            last = value[top - 1]
+            page["@odata.nextLink"] = f"{last['lastModifiedDateTime']}|{last['customerId']}"
+        return page
+
+    # Bulk export, OData-style: {"@odata.context", "@odata.count", "value": [...]} for every customer,
+    # written to a binary file object (file, socket...) chunk_size records at a time
+    def export_customers(self, out: IO[bytes], chunk_size: int = 1000):
+        logger.info("Exporting %d Business Central customers", self.total_customers)
+        out.write(f'{{"@odata.context": "$metadata#customers", "@odata.count": {self.total_customers}, '
+                  f'"value": ['.encode())
+        for start in range(0, self.total_customers, chunk_size):
+            end = min(start + chunk_size, self.total_customers)
+            chunk = ", ".join(json.dumps(self._record(i)) for i in range(start, end))
+            out.write(((", " if start else "") + chunk).encode())
+        out.write(b"]}")
+
+    # None = the default record; otherwise ids are "BC-" + zero-padded index
+    def _lookup(self, customer_id: Optional[str]) -> Optional[dict]:
+        if customer_id is None or customer_id == "201":
+            return self._changes.get("201") or {
+                "customerId": "201",
+                "fullName": "Bob",
+                "emailID": "bob@example.com",
+                "status": "ACTIVE",
+                "lastModifiedDateTime": self._changes.created_at
+            }
+        i = self._index(customer_id)
+        return self._record(i) if 0 <= i < self.total_customers else None
+
+    # Internal index of a generated id (-1 if it isn't one)
+    @staticmethod
+    def _index(customer_id: str) -> int:
+        digits = customer_id[3:]
+        return int(digits) if customer_id.startswith("BC-") and digits.isdigit() else -1
+
+    # Customer i, including any edits
+    def _record(self, i: int):
+        record = self._generate(i)
+        return (self._changes.get(record["customerId"]) or record) if self._changes else record
+
+    # Generates customer i on the fly so large customer bases cost no memory
+    def _generate(self, i: int):
         return {
-            "customerId": "201",
-            "fullName": "Bob",
-            "emailID": "bob@example.com",
-            "status": "ACTIVE"
-        }
\ No newline at end of file
+            "customerId": f"BC-{i:08d}",
+            "fullName": f"Business Central Customer {i}",
+            "emailID": f"bc.customer{i}@example.com",
+            "status": "ACTIVE" if i % 7 else "BLOCKED",
+            "lastModifiedDateTime": self._changes.created_at
+        }
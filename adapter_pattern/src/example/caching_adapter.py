@@ -0,0 +1,225 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import IO, Any, Callable, Hashable, Iterator, Optional, Tuple
+
+from src.example.adapter import (Adapter, ChangePage, ConditionalResult, CustomerBatchPage, CustomerPage,
+                                 ExportingAdapter, IncrementalAdapter, PagedAdapter, WrappingAdapter)
+from src.example.customer import Customer
+
+logger = logging.getLogger(__name__)
+
+# (customer or None for "no such customer", etag, expires_at as wall-clock seconds)
+CacheEntry = Tuple[Optional[Customer], Optional[str], float]
+
+# Cache key for the CRM's default record (customer_id=None) — an object, so no real customer id,
+# not even "", can share its slot
+_DEFAULT = object()
+
+
+# Counters exposed by the response cache
+@dataclass
+class ResponseCacheStats():
+    hits: int = 0            # fresh entry served, no CRM call
+    negative_hits: int = 0   # fresh "no such customer" served, no CRM call
+    misses: int = 0          # not cached anywhere — full fetch
+    disk_hits: int = 0       # found in the sqlite tier after a memory miss
+    revalidated: int = 0     # stale entry confirmed by a 304 — no payload transferred
+    refetched: int = 0       # stale entry replaced — the record changed or is gone
+    evictions: int = 0       # dropped from memory to respect max_entries
+
+
+# --- On-Disk Tier ---
+# sqlite table of cached customers that survives restarts.
+# Expired rows are kept on purpose: their ETags still make the first refetch a cheap 304.
+# Keys are customer ids, or _DEFAULT for the CRM's default record.
+class SqliteCacheTier():
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS customer_cache ("
+            "key TEXT PRIMARY KEY, id TEXT, full_name TEXT, email TEXT, status TEXT, "
+            "etag TEXT, expires_at REAL NOT NULL)"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM customer_cache").fetchone()[0]
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, full_name, email, status, etag, expires_at FROM customer_cache WHERE key = ?",
+                (self._row_key(key),)
+            ).fetchone()
+        if row is None:
+            return None
+        customer = None if row[0] is None else Customer(*row[:4])
+        return customer, row[4], row[5]
+
+    def put(self, key: Hashable, entry: CacheEntry):
+        customer, etag, expires_at = entry
+        fields = (None,) * 4 if customer is None else (customer.id, customer.full_name, customer.email, customer.status)
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO customer_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             (self._row_key(key), *fields, etag, expires_at))
+
+    def delete(self, key: Hashable):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM customer_cache WHERE key = ?", (self._row_key(key),))
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM customer_cache")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # Customer ids are stored prefixed, so the default record's row can't collide with any of them
+    @staticmethod
+    def _row_key(key: Hashable) -> str:
+        return "default" if key is _DEFAULT else "id:" + key
+
+
+# Pass-through — pages may be far larger than the cache
+class _UncachedPages(PagedAdapter):
+
+    def fetch_customer_page(self, cursor: Optional[Any], page_size: int) -> CustomerPage:
+        return self.adapter.fetch_customer_page(cursor, page_size)
+
+    def fetch_customer_batch(self, cursor: Optional[Any], page_size: int) -> CustomerBatchPage:
+        return self.adapter.fetch_customer_batch(cursor, page_size)
+
+
+# Pass-through — change feeds may be far larger than the cache too
+class _UncachedChanges(IncrementalAdapter):
+
+    def fetch_changed_page(self, since: Optional[str], cursor: Optional[Any], page_size: int) -> ChangePage:
+        return self.adapter.fetch_changed_page(since, cursor, page_size)
+
+
+# Exports are parsed straight through — nothing to cache
+class _UncachedExports(ExportingAdapter):
+
+    def iter_export(self, stream: IO, buffer_size: int = 64 * 1024) -> Iterator[Customer]:
+        return self.adapter.iter_export(stream, buffer_size)
+
+
+# --- Caching Adapter ---
+# Wraps any Adapter and caches get_customer_data() per customer id, so the Client
+# stops hitting rate-limited CRM APIs for records that rarely change.
+#   - fresh entries (younger than ttl) are served with no CRM call
+#   - stale entries are revalidated with their ETag — an unchanged record costs a bare 304
+#   - "no such customer" is cached too, for negative_ttl
+#   - memory holds at most max_entries (LRU); the optional sqlite tier keeps everything
+#     across restarts, so a warm start revalidates instead of refetching
+# Bulk reads (pages, batches, change feeds, exports) are passed through uncached, and only if the
+# wrapped adapter supports them (see WrappingAdapter).
+class CachingAdapter(WrappingAdapter):
+
+    FORWARDS = ((PagedAdapter, _UncachedPages), (IncrementalAdapter, _UncachedChanges),
+                (ExportingAdapter, _UncachedExports))
+
+    def __init__(self, adapter: Adapter, ttl: float = 300.0, negative_ttl: float = 30.0,
+                 max_entries: int = 10_000, disk_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.adapter = adapter
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        # Wall clock, not monotonic — expiry times are persisted and must mean the same after a restart
+        self.clock = clock
+        self.disk = SqliteCacheTier(disk_path) if disk_path is not None else None
+        self.stats = ResponseCacheStats()
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        logger.info("CachingAdapter created around %s", type(adapter).__name__)
+
+    def __len__(self):
+        return len(self._entries)
+
+    # Serve from cache while fresh; revalidate or fetch through the wrapped adapter otherwise
+    def get_customer_data(self, customer_id: Optional[str] = None) -> Optional[Customer]:
+        key = _DEFAULT if customer_id is None else customer_id
+        entry = self._lookup(key)
+        if entry is None:
+            self.stats.misses += 1
+            return self._store(key, self.adapter.get_customer_conditional(customer_id))
+
+        customer, etag, expires_at = entry
+        if expires_at > self.clock():
+            if customer is None:
+                self.stats.negative_hits += 1
+            else:
+                self.stats.hits += 1
+            return customer
+
+        result = self.adapter.get_customer_conditional(customer_id, etag)
+        if result.status == 304:
+            self.stats.revalidated += 1
+            result = ConditionalResult(200, customer, result.etag)
+        else:
+            self.stats.refetched += 1
+        return self._store(key, result)
+
+    # Forces the next lookup of this customer to go to the CRM (no ETag, full fetch)
+    def invalidate(self, customer_id: Optional[str] = None):
+        key = _DEFAULT if customer_id is None else customer_id
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+
+    # Memory first, then the disk tier (promoting what it finds back into memory)
+    def _lookup(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.disk is None:
+            return None
+        entry = self.disk.get(key)
+        if entry is not None:
+            self.stats.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    # Caches a 200/404 result (304s arrive here already resolved to the cached customer)
+    def _store(self, key: Hashable, result: ConditionalResult) -> Optional[Customer]:
+        ttl = self.negative_ttl if result.customer is None else self.ttl
+        entry = (result.customer, result.etag, self.clock() + ttl)
+        self._remember(key, entry)
+        if self.disk is not None:
+            self.disk.put(key, entry)
+        return result.customer
+
+    def _remember(self, key: Hashable, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from src.example.adapter import Adapter
 
@@ -16,6 +17,6 @@ class Client():
         logger.info("Client created with %s", type(adapter).__name__)
 
     # Delegates to whichever adapter was injected — NetSuite, Business Central, etc.
-    def process_customer_data(self):
+    def process_customer_data(self, customer_id: Optional[str] = None):
         logger.info("Client processing customer data")
-        return self.adapter.get_customer_data()
\ No newline at end of file
+        return self.adapter.get_customer_data(customer_id)
\ No newline at end of file
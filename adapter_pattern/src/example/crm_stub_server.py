@@ -0,0 +1,141 @@
+import argparse
+import asyncio
+import json
+import logging
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.example.async_adapter import DEFAULT_CUSTOMER
+from src.example.business_central_api import BusinessCentralApi
+from src.example.net_suite_api import NetSuiteApi
+
+logger = logging.getLogger(__name__)
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+# --- Local Stub Server ---
+# Serves both simulated CRM APIs over HTTP/1.1 with keep-alive, for offline benchmarks.
+# Every request waits `latency` seconds before responding, like a remote API would.
+#   GET /netsuite/customers?offset=&limit=        → NetSuiteApi.list_customers
+#   GET /netsuite/customers/{id|default}          → NetSuiteApi.get_customer
+#   GET /businesscentral/customers?top=&skiptoken= → BusinessCentralApi.list_customers
+#   GET /businesscentral/customers/{id|default}   → BusinessCentralApi.get_customer
+class CrmStubServer():
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 total_customers: int = 1000):
+        self.host = host
+        self.port = port                    # 0 = pick a free port; the real one is set by start()
+        self.latency = latency
+        self.net_suite_api = NetSuiteApi(total_customers)
+        self.business_central_api = BusinessCentralApi(total_customers)
+        self.requests = 0
+        self.connections = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> "CrmStubServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("CRM stub server listening on %s:%d (latency %.0f ms)", self.host, self.port, self.latency * 1e3)
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    # Serves requests on one connection until the client closes it or asks to
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, payload = self._route(method, target)
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                body = json.dumps(payload).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    .encode("latin-1") + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Loop shutting down with this connection open — just drop it
+            pass
+        finally:
+            writer.close()
+
+    def _route(self, method: str, target: str):
+        if method != "GET":
+            return 405, {"error": "method not allowed"}
+        url = urlsplit(target)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        parts = [unquote(p) for p in url.path.strip("/").split("/")]
+        if len(parts) < 2 or parts[1] != "customers":
+            return 404, {"error": "not found"}
+        try:
+            if parts[0] == "netsuite":
+                api = self.net_suite_api
+                if len(parts) == 2:
+                    return 200, api.list_customers(offset=int(query.get("offset", 0)),
+                                                   limit=int(query.get("limit", 1000)))
+            elif parts[0] == "businesscentral":
+                api = self.business_central_api
+                if len(parts) == 2:
+                    return 200, api.list_customers(top=int(query.get("top", 1000)),
+                                                   skiptoken=query.get("skiptoken"))
+            else:
+                return 404, {"error": "not found"}
+        except ValueError:
+            return 400, {"error": "bad query"}
+
+        if len(parts) != 3:
+            return 404, {"error": "not found"}
+        record = api.get_customer(None if parts[2] == DEFAULT_CUSTOMER else parts[2])
+        return (200, record) if record is not None else (404, {"error": "not found"})
+
+
+async def _serve_forever(args):
+    async with CrmStubServer(args.host, args.port, args.latency, args.customers) as server:
+        await server._server.serve_forever()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+        datefmt="%H:%M:%S"
+    )
+    parser = argparse.ArgumentParser(description="Local stub server for the NetSuite and Business Central APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every response")
+    parser.add_argument("--customers", type=int, default=100_000, help="simulated customers per CRM")
+    asyncio.run(_serve_forever(parser.parse_args()))
@@ -4,8 +4,11 @@ from dataclasses import dataclass
 # --- Unified Data Model ---
 # Common representation of a customer across all CRM systems.
 # Each adapter maps its CRM-specific fields into this standard format.
+# __slots__ drops the per-instance __dict__ — millions of customers fit in far less memory.
 @dataclass
 class Customer():
+    __slots__ = ("id", "full_name", "email", "status")
+
     id: str
     full_name: str
     email: str
@@ -0,0 +1,103 @@
+from array import array
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+from src.example.customer import Customer
+
+
+# --- Columnar Data Model ---
+# Many customers stored as columns instead of one object per row.
+# `status` is dictionary-encoded: each distinct value is stored once in `status_values`
+# and rows hold a 2-byte code, which suits low-cardinality fields like ACTIVE/INACTIVE.
+# Rows are materialized on demand as Customer objects.
+class CustomerBatch():
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.full_names: List[str] = []
+        self.emails: List[str] = []
+        self.status_codes = array("H")                  # index into status_values per row
+        self.status_values: List[str] = []              # code -> status
+        self._status_index: Dict[str, int] = {}         # status -> code
+
+    # Builds a batch from ready-made columns (taken over, not copied)
+    @classmethod
+    def from_columns(cls, ids: List[str], full_names: List[str], emails: List[str],
+                     statuses: Iterable[str]) -> "CustomerBatch":
+        batch = cls()
+        batch.ids = ids
+        batch.full_names = full_names
+        batch.emails = emails
+        batch._encode_statuses(statuses)
+        return batch
+
+    # Builds a batch straight from raw CRM records, column by column — no Customer objects
+    @classmethod
+    def from_records(cls, records: Sequence[dict], id_key: str, full_name_key: str,
+                     email_key: str, status_key: str) -> "CustomerBatch":
+        return cls.from_columns(list(map(itemgetter(id_key), records)),
+                                list(map(itemgetter(full_name_key), records)),
+                                list(map(itemgetter(email_key), records)),
+                                map(itemgetter(status_key), records))
+
+    @classmethod
+    def from_customers(cls, customers: Iterable[Customer]) -> "CustomerBatch":
+        batch = cls()
+        for customer in customers:
+            batch.append(customer)
+        return batch
+
+    def append(self, customer: Customer):
+        self.ids.append(customer.id)
+        self.full_names.append(customer.full_name)
+        self.emails.append(customer.email)
+        self._encode_statuses((customer.status,))
+
+    # Appends another batch, translating its status codes into this batch's dictionary
+    def extend(self, other: "CustomerBatch"):
+        self.ids.extend(other.ids)
+        self.full_names.extend(other.full_names)
+        self.emails.extend(other.emails)
+        remap = [self._status_code(status) for status in other.status_values]
+        self.status_codes.extend(array("H", map(remap.__getitem__, other.status_codes)))
+
+    # Decoded status column
+    @property
+    def statuses(self) -> List[str]:
+        return list(map(self.status_values.__getitem__, self.status_codes))
+
+    # Row count per status, counted on the codes
+    def status_counts(self) -> Dict[str, int]:
+        counts = [0] * len(self.status_values)
+        for code in self.status_codes:
+            counts[code] += 1
+        return dict(zip(self.status_values, counts))
+
+    def to_customers(self) -> List[Customer]:
+        return list(self)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Customer]:
+        return map(Customer, self.ids, self.full_names, self.emails,
+                   map(self.status_values.__getitem__, self.status_codes))
+
+    def __getitem__(self, i: int) -> Customer:
+        return Customer(self.ids[i], self.full_names[i], self.emails[i],
+                        self.status_values[self.status_codes[i]])
+
+    def __repr__(self):
+        return f"CustomerBatch({len(self)} customer(s), statuses={self.status_values})"
+
+    def _status_code(self, status: str) -> int:
+        code = self._status_index.get(status)
+        if code is None:
+            if len(self.status_values) > 0xFFFF:
+                raise ValueError("too many distinct statuses for dictionary encoding")
+            code = self._status_index[status] = len(self.status_values)
+            self.status_values.append(status)
+        return code
+
+    def _encode_statuses(self, statuses: Iterable[str]):
+        self.status_codes.extend(array("H", map(self._status_code, statuses)))
@@ -0,0 +1,277 @@
+import hashlib
+import logging
+import re
+import sqlite3
+import unicodedata
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from src.example.adapter import PagedAdapter
+from src.example.customer import Customer
+
+logger = logging.getLogger(__name__)
+
+# Max parameters per IN (...) lookup — stays under sqlite's variable limit on old builds too
+_LOOKUP_BATCH = 500
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+# Lower-cased and trimmed; "+tag" suffixes dropped, so jane+crm@x.com matches jane@x.com
+def normalize_email(email: Optional[str]) -> str:
+    email = (email or "").strip().lower()
+    local, at, domain = email.partition("@")
+    return local.split("+", 1)[0] + at + domain
+
+
+# Accents, punctuation, case and repeated whitespace removed: "  O'Brien, José " → "obrien jose"
+def normalize_name(name: Optional[str]) -> str:
+    name = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode()
+    return " ".join(_PUNCTUATION.sub("", name).casefold().split())
+
+
+# Blocking keys for a normalized name: only customers sharing a key are compared by name.
+# Two keys (surname prefix and surname suffix, each with the start of the first name) so a
+# single typo can't keep a match out of every block.
+def blocking_keys(name: str) -> Tuple[str, ...]:
+    tokens = name.split()
+    if not tokens:
+        return ()
+    first, last = tokens[0][:3], tokens[-1]
+    return (f"{last[:4]}<{first}", f"{last[-4:]}>{first}")
+
+
+# Character bigrams — a cheap, C-speed similarity prefilter before SequenceMatcher
+def _bigrams(name: str) -> frozenset:
+    return frozenset(map(str.__add__, name, name[1:]))
+
+
+# 64-bit key for the email hash index
+def _hash_key(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+# One merged customer and the source records behind it
+@dataclass
+class GoldenRecord():
+    golden_id: int
+    customer: Customer
+    members: List[Tuple[str, str]]      # (source, source customer id)
+
+
+# How each input record was matched
+@dataclass
+class MergeStats():
+    records: int = 0
+    id_matches: int = 0         # same source id seen before
+    email_matches: int = 0      # normalized email already belongs to a golden record
+    name_matches: int = 0       # fuzzy name match within a block
+    new_golden: int = 0         # no match — started a new golden record
+
+
+# --- Merge Engine ---
+# Finds which customers from different CRMs describe the same person and merges them into
+# golden records, in one pass over the input.
+#   - indexes on (source, id) and on a 64-bit hash of the normalized email give exact matches,
+#     looked up once per chunk instead of once per record
+#   - blocking keys limit fuzzy name comparisons to a handful of candidates per record
+#   - within one CRM, different ids are different people: a golden record that already holds a
+#     member from a source never takes a second one from it, by email or by name
+#   - source_priority decides which source's values win when records disagree: a higher-priority
+#     source overwrites, a lower-priority one only fills in empty fields
+# Indexes and golden records live in sqlite (a private temporary file by default), and input is
+# resolved chunk by chunk with batched lookups, so memory is bounded by chunk_size — not by how
+# many customers have been merged so far.
+# A record joins at most one golden record; golden records are never merged with each other.
+class CustomerMerger():
+
+    def __init__(self, source_priority: Sequence[str], path: str = "", name_threshold: float = 0.9,
+                 chunk_size: int = 5000, max_block_size: int = 32, prefilter: float = 0.6):
+        # Rank per source — lower wins
+        self.ranks = {source: rank for rank, source in enumerate(source_priority)}
+        # Names match when SequenceMatcher.ratio() reaches name_threshold; candidates whose
+        # bigram overlap (Dice) is below prefilter are skipped without computing it
+        self.name_threshold = name_threshold
+        self.prefilter = prefilter
+        self.chunk_size = chunk_size
+        # Candidates compared per blocking key, so a very common name can't make matching quadratic
+        self.max_block_size = max_block_size
+        self.stats = MergeStats()
+        # "" = private on-disk temporary database, deleted on close
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=OFF" if path == "" else "PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS golden (
+                golden_id INTEGER PRIMARY KEY, id TEXT, full_name TEXT, email TEXT, status TEXT, rank INTEGER);
+            CREATE TABLE IF NOT EXISTS members (
+                source TEXT, id TEXT, golden_id INTEGER, PRIMARY KEY (source, id)) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS emails (email_key INTEGER PRIMARY KEY, golden_id INTEGER);
+            CREATE TABLE IF NOT EXISTS blocks (
+                block_key TEXT, golden_id INTEGER, rank INTEGER, name TEXT,
+                PRIMARY KEY (block_key, golden_id, rank)) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS golden_sources (
+                source TEXT, golden_id INTEGER, PRIMARY KEY (source, golden_id)) WITHOUT ROWID;
+        """)
+        self._next_id = self._db.execute("SELECT COALESCE(MAX(golden_id), 0) + 1 FROM golden").fetchone()[0]
+
+    # Merges a stream of customers from one source
+    def add(self, source: str, customers: Iterable[Customer]) -> MergeStats:
+        if source not in self.ranks:
+            raise ValueError(f"Unknown source {source!r} — add it to source_priority")
+        rank = self.ranks[source]
+        customers = iter(customers)
+        while True:
+            chunk = list(islice(customers, self.chunk_size))
+            if not chunk:
+                return self.stats
+            self._merge_chunk(source, rank, chunk)
+
+    # Merges every customer an adapter can stream
+    def add_adapter(self, source: str, adapter: PagedAdapter, page_size: int = 5000) -> MergeStats:
+        return self.add(source, adapter.iter_customers(page_size=page_size))
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM golden").fetchone()[0]
+
+    # Streams every golden record with its members, in golden_id order
+    def golden_records(self) -> Iterator[GoldenRecord]:
+        # Built once, after loading — cheaper than maintaining it on every insert
+        self._db.execute("CREATE INDEX IF NOT EXISTS members_by_golden ON members (golden_id)")
+        rows = self._db.execute(
+            "SELECT g.golden_id, g.id, g.full_name, g.email, g.status, m.source, m.id "
+            "FROM golden g JOIN members m ON m.golden_id = g.golden_id ORDER BY g.golden_id"
+        )
+        record = None
+        for golden_id, cid, full_name, email, status, source, source_id in rows:
+            if record is None or record.golden_id != golden_id:
+                if record is not None:
+                    yield record
+                record = GoldenRecord(golden_id, Customer(cid, full_name, email, status), [])
+            record.members.append((source, source_id))
+        if record is not None:
+            yield record
+
+    def close(self):
+        self._db.close()
+
+    def _merge_chunk(self, source: str, rank: int, chunk: List[Customer]):
+        names = [normalize_name(c.full_name) for c in chunk]
+        emails = [normalize_email(c.email) for c in chunk]
+        email_keys = [_hash_key(e) if e else None for e in emails]
+        block_keys = [blocking_keys(n) for n in names]
+
+        # One batched lookup per index for the whole chunk
+        members = self._lookup("SELECT id, golden_id FROM members WHERE source = ? AND id IN ({})",
+                               [c.id for c in chunk], prefix=(source,))
+        email_index = self._lookup("SELECT email_key, golden_id FROM emails WHERE email_key IN ({})",
+                                   [k for k in email_keys if k is not None])
+        # Name candidates from the other sources, at most max_block_size per key
+        blocks: Dict[str, List[Tuple[int, str]]] = {}
+        max_block_size = self.max_block_size
+        for key, golden_id, name in self._rows(
+                "SELECT block_key, golden_id, name FROM blocks WHERE rank != ? AND block_key IN ({})",
+                list({k for keys in block_keys for k in keys}), prefix=(rank,)):
+            block = blocks.setdefault(key, [])
+            if len(block) < max_block_size:
+                block.append((golden_id, name))
+        # Candidates that already hold a member from this source are off limits
+        candidates = set(email_index.values()).union(g for block in blocks.values() for g, _ in block)
+        taken = {g for (g,) in self._rows(
+            "SELECT golden_id FROM golden_sources WHERE source = ? AND golden_id IN ({})",
+            list(candidates), prefix=(source,))}
+
+        # Resolve each record; members, email_index and taken double as the chunk's overlay of
+        # not-yet-written entries (block entries don't need one — the chunk is all one source)
+        first_new = self._next_id
+        assigned = []
+        new_members, new_emails, new_blocks, new_sources = [], [], [], []
+        stats = self.stats
+        for customer, name, email_key, keys in zip(chunk, names, email_keys, block_keys):
+            golden_id = members.get(customer.id)
+            if golden_id is not None:
+                stats.id_matches += 1
+            elif email_key is not None and email_key in email_index and email_index[email_key] not in taken:
+                golden_id = email_index[email_key]
+                stats.email_matches += 1
+            else:
+                golden_id = self._match_name(name, keys, blocks, taken)
+                if golden_id is not None:
+                    stats.name_matches += 1
+                else:
+                    golden_id = self._next_id
+                    self._next_id += 1
+                    stats.new_golden += 1
+            assigned.append(golden_id)
+
+            if customer.id not in members:
+                members[customer.id] = golden_id
+                new_members.append((source, customer.id, golden_id))
+            if golden_id not in taken:
+                taken.add(golden_id)
+                new_sources.append((source, golden_id))
+            if email_key is not None and email_key not in email_index:
+                email_index[email_key] = golden_id
+                new_emails.append((email_key, golden_id))
+            for key in keys:
+                new_blocks.append((key, golden_id, rank, name))
+        stats.records += len(chunk)
+
+        # Apply the source-wins rule on top of the stored golden records
+        golden = {g: [cid, full_name, email, status, r] for g, cid, full_name, email, status, r in self._rows(
+            "SELECT golden_id, id, full_name, email, status, rank FROM golden WHERE golden_id IN ({})",
+            list({g for g in assigned if g < first_new}))}
+        for customer, golden_id in zip(chunk, assigned):
+            fields = (customer.id, customer.full_name, customer.email, customer.status)
+            current = golden.get(golden_id)
+            if current is None:
+                golden[golden_id] = [*fields, rank]
+            elif rank <= current[4]:
+                current[:4] = [new or old for new, old in zip(fields, current)]
+                current[4] = rank
+            else:
+                current[:4] = [old or new for new, old in zip(fields, current)]
+
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO golden VALUES (?, ?, ?, ?, ?, ?)",
+                                 [(g, *values) for g, values in golden.items()])
+            self._db.executemany("INSERT INTO members VALUES (?, ?, ?)", new_members)
+            self._db.executemany("INSERT INTO emails VALUES (?, ?)", new_emails)
+            self._db.executemany("INSERT OR IGNORE INTO blocks VALUES (?, ?, ?, ?)", new_blocks)
+            self._db.executemany("INSERT OR IGNORE INTO golden_sources VALUES (?, ?)", new_sources)
+
+    # Best fuzzy match among the candidates sharing a blocking key, if it clears name_threshold;
+    # golden records in `taken` already hold a member from this source and are skipped
+    def _match_name(self, name: str, keys: Tuple[str, ...], blocks: Dict[str, List[Tuple[int, str]]],
+                    taken: Set[int]) -> Optional[int]:
+        if not name:
+            return None
+        grams = _bigrams(name)
+        prefilter = self.prefilter
+        matcher = None
+        best, best_score = None, self.name_threshold
+        for key in keys:
+            for golden_id, candidate in blocks.get(key, ()):
+                if golden_id in taken:
+                    continue
+                candidate_grams = _bigrams(candidate)
+                if 2 * len(grams & candidate_grams) < prefilter * (len(grams) + len(candidate_grams)):
+                    continue
+                if matcher is None:
+                    matcher = SequenceMatcher(None, b=name, autojunk=False)
+                matcher.set_seq1(candidate)
+                score = matcher.ratio()
+                if score >= best_score:
+                    best, best_score = golden_id, score
+        return best
+
+    def _lookup(self, sql: str, keys: list, prefix: tuple = ()) -> dict:
+        return dict(self._rows(sql, keys, prefix))
+
+    # Runs an IN (...) query over `keys` in batches
+    def _rows(self, sql: str, keys: list, prefix: tuple = ()) -> Iterator[tuple]:
+        for i in range(0, len(keys), _LOOKUP_BATCH):
+            batch = keys[i:i + _LOOKUP_BATCH]
+            yield from self._db.execute(sql.format(",".join("?" * len(batch))), (*prefix, *batch))
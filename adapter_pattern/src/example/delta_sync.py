@@ -0,0 +1,73 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from src.example.adapter import IncrementalAdapter, check_page_size
+from src.example.snapshot_store import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+
+# What one sync of one source did
+@dataclass
+class SyncReport():
+    source: str
+    full: bool                  # no watermark yet — every customer was fetched
+    resumed: bool               # picked up an interrupted sync from its checkpoint
+    pages: int = 0
+    upserts: int = 0
+    watermark: Optional[str] = None
+    seconds: float = 0.0
+
+
+# --- Incremental Sync Engine ---
+# Keeps a SnapshotStore in step with any number of CRMs through the IncrementalAdapter interface.
+# The first sync of a source pulls everything; after that only customers modified since
+# the source's watermark are fetched and upserted. Every page is checkpointed, so an
+# interrupted sync resumes where it stopped instead of starting over.
+class DeltaSync():
+
+    def __init__(self, store: SnapshotStore, sources: Dict[str, IncrementalAdapter], page_size: int = 5000):
+        check_page_size(page_size)
+        for source, adapter in sources.items():
+            if not isinstance(adapter, IncrementalAdapter):
+                raise TypeError(f"{source}: {type(adapter).__name__} does not support incremental fetches")
+        self.store = store
+        self.sources = sources
+        self.page_size = page_size
+
+    # Syncs every source, one after another
+    def sync_all(self) -> List[SyncReport]:
+        return [self.sync(source) for source in self.sources]
+
+    # The next page is fetched on a background thread while the current one is written
+    def sync(self, source: str) -> SyncReport:
+        adapter = self.sources[source]
+        state = self.store.get_state(source)
+        since, cursor, watermark = state.watermark, state.cursor, state.pending_watermark or state.watermark
+        report = SyncReport(source, full=since is None, resumed=cursor is not None)
+        logger.info("Syncing %s %s", source, "(full)" if report.full else f"since {since}")
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_page = prefetcher.submit(adapter.fetch_changed_page, since, cursor, self.page_size)
+            while next_page is not None:
+                customers, cursor, page_watermark = next_page.result()
+                if cursor is not None:
+                    next_page = prefetcher.submit(adapter.fetch_changed_page, since, cursor, self.page_size)
+                else:
+                    next_page = None
+                if page_watermark is not None and (watermark is None or page_watermark > watermark):
+                    watermark = page_watermark
+                self.store.apply_page(source, customers, cursor, watermark)
+                report.pages += 1
+                report.upserts += len(customers)
+
+        self.store.finish_sync(source, watermark)
+        report.watermark = watermark
+        report.seconds = time.perf_counter() - start
+        logger.info("Synced %s: %d customer(s) in %d page(s), %.2fs", source, report.upserts, report.pages,
+                    report.seconds)
+        return report
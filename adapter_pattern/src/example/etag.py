@@ -0,0 +1,10 @@
+import hashlib
+from typing import Iterable
+
+
+# --- Entity Tags ---
+# Short content hash used as an HTTP-style ETag: same field values → same tag.
+# Lets callers ask "has this record changed since version X?" without comparing payloads.
+def compute_etag(values: Iterable[str]) -> str:
+    digest = hashlib.blake2b("\x1f".join(values).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
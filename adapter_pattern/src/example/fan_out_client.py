@@ -0,0 +1,232 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Union
+
+from src.example.adapter import Adapter
+from src.example.customer import Customer
+
+logger = logging.getLogger(__name__)
+
+FIRST = "first"     # return the first good answer
+MERGE = "merge"     # wait for every adapter (up to its timeout) and merge the answers
+
+
+# Counters exposed by the fan-out client
+@dataclass
+class FanOutStats():
+    lookups: int = 0
+    requests: int = 0       # adapter calls, hedges included
+    hedges: int = 0         # duplicate requests sent because the first one was slow
+    hedge_wins: int = 0     # answers that came from a hedge
+    timeouts: int = 0       # adapters given up on at their deadline
+    errors: int = 0         # adapter calls that raised
+    abandoned: int = 0      # attempts still running when their lookup stopped waiting for them
+    shed: int = 0           # attempts not sent — every worker of that adapter was held by abandoned ones
+
+
+# --- Latency Tracker ---
+# Rolling window of an adapter's recent latencies, for percentile-based hedging
+class LatencyTracker():
+
+    def __init__(self, window: int = 256, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    # The p-th percentile of the window (None until min_samples latencies were seen)
+    def percentile(self, p: float) -> Optional[float]:
+        samples = sorted(self._samples)
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+
+# One adapter's part of a lookup: its attempts so far and when to hedge or give up
+class _Call():
+
+    def __init__(self, name: str, customer_id: Optional[str], hedge_at: float, deadline: float):
+        self.name = name
+        self.customer_id = customer_id
+        self.hedge_at = hedge_at
+        self.deadline = deadline
+        self.attempts: List[Future] = []
+        self.done = False
+        self.customer: Optional[Customer] = None
+
+
+# --- Fan-Out Client ---
+# Like Client, but asks several adapters at once instead of one after another.
+#   - every adapter gets its own timeout; slow ones are given up on, not waited for
+#   - when an adapter is slower than its own hedge_percentile latency, a duplicate request
+#     is sent and whichever attempt answers first is used — trimming the latency tail
+#   - mode FIRST returns the first good answer; MERGE merges all answers, adapters listed
+#     first winning each field (later ones only fill in empty fields)
+# Attempts that lose the race or time out can't be interrupted. Queued ones are cancelled,
+# running ones finish in the background and their results are dropped. Each adapter has its own
+# max_workers threads, so one slow CRM can't starve the others. abandoned_running() reports how many
+# threads abandoned attempts still hold. Once they hold all of an adapter's threads, new attempts to
+# it are shed instead of queued behind them.
+class FanOutClient():
+
+    def __init__(self, adapters: Mapping[str, Adapter], timeouts: Union[float, Mapping[str, float]] = 2.0,
+                 hedge_percentile: Optional[float] = 95.0, mode: str = FIRST, max_workers: int = 32):
+        if mode not in (FIRST, MERGE):
+            raise ValueError(f"mode must be {FIRST!r} or {MERGE!r}")
+        self.adapters = dict(adapters)
+        self.timeouts = {name: timeouts if isinstance(timeouts, (int, float)) else timeouts[name]
+                         for name in self.adapters}
+        # None disables hedging
+        self.hedge_percentile = hedge_percentile
+        self.mode = mode
+        self.latency = {name: LatencyTracker() for name in self.adapters}
+        self.stats = FanOutStats()
+        self.max_workers = max_workers          # per adapter
+        self._executors = {name: ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"fan-out-{name}")
+                           for name in self.adapters}
+        self._abandoned = {name: 0 for name in self.adapters}
+        self._stats_lock = threading.Lock()
+        logger.info("FanOutClient created with %s", ", ".join(self.adapters))
+
+    # customer_id: one id for every adapter, or {adapter name: id} — CRMs number customers differently.
+    # With a mapping, only the adapters it names are asked.
+    def process_customer_data(self, customer_id: Union[None, str, Mapping[str, Optional[str]]] = None
+                              ) -> Optional[Customer]:
+        logger.info("FanOutClient processing customer data")
+        ids = customer_id if isinstance(customer_id, Mapping) else {name: customer_id for name in self.adapters}
+        start = time.perf_counter()
+        calls = [self._start(name, ids[name], start) for name in self.adapters if name in ids]
+        self._count("lookups")
+        try:
+            return self._collect(calls)
+        finally:
+            self._abandon(calls)
+
+    # Abandoned attempts still running, per adapter — each holds one of that adapter's workers
+    def abandoned_running(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._abandoned)
+
+    def close(self):
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+
+    # Waits for answers, hedging and timing out each adapter's call as it goes
+    def _collect(self, calls: List[_Call]) -> Optional[Customer]:
+        pending: Dict[Future, _Call] = {f: call for call in calls for f in call.attempts}
+        while any(not call.done for call in calls):
+            now = time.perf_counter()
+            open_calls = [call for call in calls if not call.done]
+            next_event = min(min(call.deadline for call in open_calls),
+                             min((call.hedge_at for call in open_calls if len(call.attempts) == 1),
+                                 default=float("inf")))
+            finished, _ = wait(pending, timeout=max(0.0, next_event - now), return_when=FIRST_COMPLETED)
+
+            for future in finished:
+                call = pending.pop(future)
+                if call.done:
+                    continue
+                error = future.exception()
+                if error is not None:
+                    self._count("errors")
+                    logger.warning("%s lookup failed: %s", call.name, error)
+                    if all(f.done() for f in call.attempts):
+                        # Failed fast — the hedge doubles as a single retry
+                        retry = self._attempt(call) if len(call.attempts) == 1 else None
+                        if retry is not None:
+                            self._count("hedges")
+                            pending[retry] = call
+                        else:
+                            call.done = True
+                    continue
+                call.done = True
+                call.customer = future.result()
+                if future is not call.attempts[0]:
+                    self._count("hedge_wins")
+                if self.mode == FIRST and call.customer is not None:
+                    return call.customer
+
+            now = time.perf_counter()
+            for call in calls:
+                if call.done:
+                    continue
+                if now >= call.deadline:
+                    call.done = True
+                    self._count("timeouts")
+                    logger.warning("%s lookup timed out after %.3fs", call.name, self.timeouts[call.name])
+                elif len(call.attempts) == 1 and now >= call.hedge_at:
+                    # Slower than usual — race a duplicate against it
+                    hedge = self._attempt(call)
+                    if hedge is not None:
+                        self._count("hedges")
+                        pending[hedge] = call
+                    else:
+                        call.hedge_at = float("inf")
+
+        answers = [call.customer for call in calls if call.customer is not None]
+        if not answers:
+            return None
+        return answers[0] if self.mode == FIRST else self._merge(answers)
+
+    # Sends the first attempt for one adapter and works out when to hedge it
+    def _start(self, name: str, customer_id: Optional[str], start: float) -> _Call:
+        hedge_after = None
+        if self.hedge_percentile is not None:
+            hedge_after = self.latency[name].percentile(self.hedge_percentile)
+        deadline = start + self.timeouts[name]
+        call = _Call(name, customer_id, start + hedge_after if hedge_after is not None else float("inf"), deadline)
+        if self._attempt(call) is None:
+            call.done = True
+        return call
+
+    # Sends one attempt; None (shed) when abandoned attempts hold every one of the adapter's workers
+    def _attempt(self, call: _Call) -> Optional[Future]:
+        with self._stats_lock:
+            if self._abandoned[call.name] >= self.max_workers:
+                self.stats.shed += 1
+                logger.warning("%s: all %d workers held by abandoned attempts — not sending",
+                               call.name, self.max_workers)
+                return None
+        adapter, tracker = self.adapters[call.name], self.latency[call.name]
+        sent = time.perf_counter()
+        future = self._executors[call.name].submit(adapter.get_customer_data, call.customer_id)
+        # Every attempt that ran feeds the tracker, including ones that lost the race
+        # (not ones cancelled while still queued — they never reached the CRM)
+        def record(f: Future):
+            if not f.cancelled():
+                tracker.record(time.perf_counter() - sent)
+        future.add_done_callback(record)
+        call.attempts.append(future)
+        self._count("requests")
+        return future
+
+    # Stops waiting on a lookup's unfinished attempts: queued ones are cancelled, running ones are
+    # counted as abandoned until they finish
+    def _abandon(self, calls: List[_Call]):
+        for call in calls:
+            for future in call.attempts:
+                if future.done() or future.cancel():
+                    continue
+                with self._stats_lock:
+                    self._abandoned[call.name] += 1
+                    self.stats.abandoned += 1
+                future.add_done_callback(lambda f, name=call.name: self._finished_abandoned(name))
+
+    def _finished_abandoned(self, name: str):
+        with self._stats_lock:
+            self._abandoned[name] -= 1
+
+    def _count(self, counter: str):
+        with self._stats_lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    # Field by field, the first non-empty value in adapter order
+    @staticmethod
+    def _merge(answers: List[Customer]) -> Customer:
+        return Customer(*(next((value for value in values if value), values[0]) for values in zip(
+            *((c.id, c.full_name, c.email, c.status) for c in answers))))
@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from itertools import starmap
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from src.example.customer import Customer
+from src.example.customer_batch import CustomerBatch
+
+# Customer fields in constructor order — every mapping must cover all of them
+CUSTOMER_FIELDS = ("id", "full_name", "email", "status")
+
+
+# Where one Customer field comes from in a raw CRM record.
+# `path` is a key, or a dotted/tuple path into nested dicts ("contact.email");
+# `converter` optionally transforms the raw value (e.g. str, str.upper).
+@dataclass(frozen=True)
+class Field():
+    path: Union[str, Tuple[str, ...]]
+    converter: Optional[Callable[[Any], Any]] = None
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        return tuple(self.path.split(".")) if isinstance(self.path, str) else tuple(self.path)
+
+
+# --- Declarative Mapping ---
+# Describes how a CRM's records map onto Customer, one Field per Customer field:
+#   FieldMapping(id="customerId", full_name="fullName", email="contact.email",
+#                status=Field("status", str.upper))
+# compile() turns it into a CustomerExtractor once; adapters keep that as a class attribute.
+class FieldMapping():
+
+    def __init__(self, **fields: Union[str, Tuple[str, ...], Field]):
+        missing = set(CUSTOMER_FIELDS) - set(fields)
+        unknown = set(fields) - set(CUSTOMER_FIELDS)
+        if missing or unknown:
+            raise ValueError(f"mapping must cover exactly {CUSTOMER_FIELDS} "
+                             f"(missing {sorted(missing)}, unknown {sorted(unknown)})")
+        self.fields: Dict[str, Field] = {
+            name: spec if isinstance(spec, Field) else Field(spec) for name, spec in fields.items()
+        }
+
+    def compile(self) -> "CustomerExtractor":
+        return CustomerExtractor(self)
+
+
+# Builds a function that extracts one column from a page of records.
+# Every step is a map() over an itemgetter (or the converter), so the per-record loop runs in C.
+def _column_extractor(field: Field) -> Callable[[Sequence[dict]], List[Any]]:
+    getters = [itemgetter(key) for key in field.keys]
+    converter = field.converter
+
+    def extract_column(records: Sequence[dict]) -> List[Any]:
+        values = records
+        for getter in getters:
+            values = map(getter, values)
+        if converter is not None:
+            values = map(converter, values)
+        return list(values)
+
+    return extract_column
+
+
+# Generates row and page functions for mappings with nested paths or converters, the same way
+# collections.namedtuple generates its methods: the lookups are spelled out in source, so the
+# result runs as fast as a handwritten translation. Keys enter the source only via repr().
+def _generated_extractors(fields: Sequence[Field]) -> Tuple[Callable[[dict], Customer],
+                                                             Callable[[Sequence[dict]], List[Customer]]]:
+    namespace: Dict[str, Any] = {"Customer": Customer}
+    args = []
+    for i, field in enumerate(fields):
+        expr = "record" + "".join(f"[{key!r}]" for key in field.keys)
+        if field.converter is not None:
+            namespace[f"convert_{i}"] = field.converter
+            expr = f"convert_{i}({expr})"
+        args.append(expr)
+    row = f"Customer({', '.join(args)})"
+    source = (f"def extract(record):\n    return {row}\n"
+              f"def extract_page(records):\n    return [{row} for record in records]\n")
+    exec(source, namespace)
+    return namespace["extract"], namespace["extract_page"]
+
+
+# --- Compiled Extractor ---
+# Specialized record → Customer translation for one FieldMapping.
+# If every field is a flat key with no converter, one itemgetter pulls all four values per
+# record; otherwise generated functions do the nested lookups and conversions.
+# Columnar batches are always built column by column.
+class CustomerExtractor():
+
+    def __init__(self, mapping: FieldMapping):
+        self.mapping = mapping
+        fields = [mapping.fields[name] for name in CUSTOMER_FIELDS]
+        self.flat = all(len(f.keys) == 1 and f.converter is None for f in fields)
+        self._row_getter = itemgetter(*(f.keys[0] for f in fields)) if self.flat else None
+        self._row, self._page = (None, None) if self.flat else _generated_extractors(fields)
+        self._columns = [_column_extractor(f) for f in fields]
+
+    # Translates one record
+    def extract(self, record: dict) -> Customer:
+        if self.flat:
+            return Customer(*self._row_getter(record))
+        return self._row(record)
+
+    # Translates a whole page of records in one call
+    def extract_page(self, records: Sequence[dict]) -> List[Customer]:
+        if self.flat:
+            return list(starmap(Customer, map(self._row_getter, records)))
+        return self._page(records)
+
+    # Translates a page straight into a columnar CustomerBatch
+    def extract_batch(self, records: Sequence[dict]) -> CustomerBatch:
+        return CustomerBatch.from_columns(*self.extract_columns(records))
+
+    # The four Customer columns for a page, in CUSTOMER_FIELDS order
+    def extract_columns(self, records: Sequence[dict]) -> List[List[Any]]:
+        return [column(records) for column in self._columns]
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+
+# Raised for non-2xx responses other than 404 (which get_json reports as None)
+class HttpError(Exception):
+
+    def __init__(self, status: int, reason: str):
+        super().__init__(f"HTTP {status} {reason}")
+        self.status = status
+
+
+# One keep-alive HTTP/1.1 connection
+class _Connection():
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+
+# --- Connection Pool ---
+# Minimal async HTTP/1.1 JSON client over pooled keep-alive connections (stdlib only).
+# `max_connections` is also the concurrency limit: each request holds one connection,
+# and callers beyond the limit wait on the semaphore.
+# Connections and the semaphore belong to one event loop. The pool binds to the loop it is
+# used on and rebinds on a new one (e.g. a later asyncio.run); idle connections are closed
+# when their loop shuts down.
+class HttpConnectionPool():
+
+    def __init__(self, host: str, port: int, max_connections: int = 10, timeout: float = 10.0,
+                 keep_alive: bool = True):
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.timeout = timeout                  # seconds per request, connect included
+        self.keep_alive = keep_alive
+        self.connections_opened = 0
+        self.requests = 0
+        self._idle: Deque[_Connection] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None    # created per loop, inside it
+        self._closer: Optional[asyncio.Task] = None
+
+    # GETs `path` and decodes the JSON body. Returns None on 404.
+    async def get_json(self, path: str, params: Optional[dict] = None) -> Any:
+        if params:
+            path = f"{path}?{urlencode({k: v for k, v in params.items() if v is not None})}"
+        self._bind()
+        async with self._semaphore:
+            status, reason, body = await asyncio.wait_for(self._request(path), self.timeout)
+        if status == 404:
+            return None
+        if not 200 <= status < 300:
+            raise HttpError(status, reason)
+        return json.loads(body)
+
+    # Closes idle connections (in-use ones close when their request finishes)
+    async def close(self):
+        while self._idle:
+            connection = self._idle.pop()
+            connection.close()
+            await connection.writer.wait_closed()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _bind(self):
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        # Idle connections of an earlier loop can't be used, or closed, from this one. Normally
+        # that loop's shutdown already closed them; any left over are dropped.
+        self._idle.clear()
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.max_connections)
+        self._closer = loop.create_task(self._close_on_shutdown())
+
+    # Waits for the loop's shutdown — asyncio.run cancels leftover tasks before closing the loop —
+    # then closes the idle connections while the loop can still do it
+    async def _close_on_shutdown(self):
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await self.close()
+
+    async def _request(self, path: str) -> Tuple[int, str, bytes]:
+        connection = self._idle.pop() if self._idle else None
+        reused = connection is not None
+        if connection is None:
+            connection = await self._connect()
+        try:
+            result, reusable = await self._exchange(connection, path)
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            connection.close()
+            if not reused:
+                raise
+            # The server may have dropped an idle keep-alive connection — retry once, fresh
+            logger.debug("Stale pooled connection (%s), reconnecting", e)
+            connection = await self._connect()
+            try:
+                result, reusable = await self._exchange(connection, path)
+            except BaseException:
+                connection.close()
+                raise
+        except BaseException:
+            # Timeouts/cancellation leave the stream mid-response — never reuse it
+            connection.close()
+            raise
+
+        if reusable and self.keep_alive:
+            self._idle.append(connection)
+        else:
+            connection.close()
+        return result
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    # Sends one request and reads one response. Returns ((status, reason, body), reusable).
+    async def _exchange(self, connection: _Connection, path: str):
+        self.requests += 1
+        keep_alive = "keep-alive" if self.keep_alive else "close"
+        connection.writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+            f"Accept: application/json\r\nConnection: {keep_alive}\r\n\r\n".encode("ascii")
+        )
+        await connection.writer.drain()
+
+        status_line = await connection.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed by server")
+        _, status, reason = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+
+        headers = {}
+        while True:
+            line = await connection.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        body = await connection.reader.readexactly(int(headers.get("content-length", "0")))
+        reusable = headers.get("connection", "").lower() != "close"
+        return (int(status), reason, body), reusable
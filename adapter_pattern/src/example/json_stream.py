@@ -0,0 +1,172 @@
+import codecs
+import json
+import logging
+import re
+from typing import IO, Any, Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_SEPARATOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+
+
+# --- Streaming JSON ---
+# Yields the elements of one JSON array inside a document of any size, one at a time.
+#   stream      — anything with read(n): a file opened "rb" or "r", socket.makefile("rb"), a response body...
+#   path        — object keys leading to the array, e.g. ("items",) for {"items": [...]}; () = the document is the array
+#   buffer_size — bytes read per call
+# Memory is one buffer plus the element being decoded, however long the array. Each element is
+# decoded by the C json scanner; the walk between elements is a few regex matches.
+# Reading stops at the end of the array — whatever follows it in the document is never read.
+def iter_json_array(stream: IO, path: Sequence[str] = (), buffer_size: int = 64 * 1024) -> Iterator[Any]:
+    buf = _Buffer(stream, buffer_size)
+    for key in path:
+        for member in _members(buf):
+            if member == key:
+                break
+            _skip_value(buf)
+        else:
+            raise KeyError(f"no {key!r} key on the path to the array")
+    yield from _array_values(buf)
+
+
+# A window over the stream: text not yet consumed starts at `pos`
+class _Buffer():
+
+    def __init__(self, stream: IO, buffer_size: int):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+
+    # Appends one read to the window, dropping what was consumed
+    def fill(self):
+        chunk = self.stream.read(self.buffer_size)
+        if not chunk:
+            self.eof = True
+        if isinstance(chunk, bytes):
+            # The incremental decoder holds back a multi-byte character split across reads
+            chunk = self._utf8.decode(chunk, final=self.eof)
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+
+    # Next non-whitespace character ("" at the end of the stream), without consuming it
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or self.eof:
+                return self.text[self.pos:self.pos + 1]
+            self.fill()
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            self.fail(f"Expecting {char!r}")
+        self.pos += 1
+
+    # Decodes one value at the cursor, reading more until it is complete.
+    # A number cut off by the end of the window still decodes ("-12500." → -12500), so a value
+    # that ends at the window's edge, or is followed by what could be more of a number, is re-read.
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self.fill()
+                continue
+            if not self.eof and (end == len(self.text) or self.text[end] in _NUMBER_CHARS):
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+    def fail(self, message: str):
+        raise json.JSONDecodeError(message, self.text, self.pos)
+
+
+# Decodes an array's elements. While the window holds whole elements they are scanned back to back —
+# an element followed by ',' or ']' is complete. The one running past the window's edge takes the careful path.
+def _array_values(buf: _Buffer) -> Iterator[Any]:
+    scan, separator_at = _DECODER.scan_once, _SEPARATOR.match
+    buf.expect("[")
+    if buf.peek() == "]":
+        buf.pos += 1
+        return
+    while True:
+        buf.peek()
+        text = buf.text
+        while True:
+            try:
+                value, end = scan(text, buf.pos)
+            except (StopIteration, json.JSONDecodeError):
+                break
+            separator = separator_at(text, end)
+            if separator is None:
+                break
+            buf.pos = separator.end()
+            yield value
+            if separator.group(1) == "]":
+                return
+        yield buf.decode()
+        separator = buf.peek()
+        buf.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            buf.fail("Expecting ',' or ']'")
+
+
+# Steps through an array: each time it yields, the cursor is on the next element,
+# which the caller must consume before resuming
+def _elements(buf: _Buffer) -> Iterator[None]:
+    buf.expect("[")
+    if buf.peek() == "]":
+        buf.pos += 1
+        return
+    while True:
+        yield
+        separator = buf.peek()
+        buf.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            buf.fail("Expecting ',' or ']'")
+
+
+# Steps through an object: yields each key with the cursor on its value, which the caller must consume
+def _members(buf: _Buffer) -> Iterator[str]:
+    buf.expect("{")
+    if buf.peek() == "}":
+        buf.pos += 1
+        return
+    while True:
+        if buf.peek() != '"':
+            buf.fail("Expecting property name")
+        key = buf.decode()
+        buf.expect(":")
+        yield key
+        separator = buf.peek()
+        buf.pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            buf.fail("Expecting ',' or '}'")
+
+
+# Skips a value without building it — containers element by element, so a huge sibling array costs no memory
+def _skip_value(buf: _Buffer):
+    char = buf.peek()
+    if char == "[":
+        for _ in _elements(buf):
+            _skip_value(buf)
+    elif char == "{":
+        for _ in _members(buf):
+            _skip_value(buf)
+    else:
+        buf.decode()
@@ -0,0 +1,74 @@
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+
+# ISO-8601 UTC with microseconds — fixed width, so string order is time order
+def iso_timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+# --- Modification Log ---
+# Server-side change tracking for the simulated CRM APIs.
+# Generated records all carry the log's creation time; edited and inserted records get
+# strictly increasing timestamps and are kept in modification order, so "modified since X"
+# only scans the tail of the log instead of the whole customer base.
+class ModificationLog():
+
+    def __init__(self, id_field: str, modified_field: str, clock: Callable[[], float] = time.time):
+        self.id_field = id_field
+        self.modified_field = modified_field
+        self.clock = clock
+        self._last = clock()
+        # Modification time of every record that was never edited
+        self.created_at = iso_timestamp(self._last)
+        # Edited/inserted records by id, oldest modification first
+        self._records: Dict[str, dict] = {}
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, customer_id: str):
+        return customer_id in self._records
+
+    def get(self, customer_id: str) -> Optional[dict]:
+        return self._records.get(customer_id)
+
+    # Stores a new version of a record, stamped and moved to the end of the log
+    def put(self, record: dict) -> dict:
+        self._last = max(self.clock(), self._last + 1e-6)
+        record = {**record, self.modified_field: iso_timestamp(self._last)}
+        customer_id = record[self.id_field]
+        self._records.pop(customer_id, None)
+        self._records[customer_id] = record
+        return record
+
+    # Records modified after `since` (None = every record), ordered by (modification time, index).
+    # `after` is the (modified, id) of the last record already returned — a keyset cursor, so
+    # edits made while a caller pages through move records forward instead of shifting pages.
+    def scan(self, total: int, record: Callable[[int], dict], index: Callable[[str], int],
+             since: Optional[str] = None, after: Optional[Tuple[str, str]] = None) -> Iterator[dict]:
+        created_at = self.created_at
+        start = 0
+        if after is not None:
+            if after[0] == created_at:
+                start = index(after[1]) + 1
+            else:
+                start = total
+                since = after[0]
+        elif since is not None and since >= created_at:
+            start = total
+
+        # Never-edited records, in index order
+        modified = self.modified_field
+        for i in range(start, total):
+            data = record(i)
+            if data[modified] == created_at:
+                yield data
+
+        # Edited records, oldest first — walk back from the newest to find the first one after `since`
+        records = list(self._records.values())
+        first = len(records)
+        while first > 0 and (since is None or records[first - 1][modified] > since):
+            first -= 1
+        yield from records[first:]
@@ -1,7 +1,11 @@
 import logging
+from typing import IO, Iterator, Optional
 
-from src.example.adapter import Adapter
+from src.example.adapter import (ChangePage, ConditionalResult, CustomerBatchPage, CustomerPage,
+                                 ExportingAdapter, IncrementalAdapter, PagedAdapter)
 from src.example.customer import Customer
+from src.example.field_mapping import FieldMapping
+from src.example.json_stream import iter_json_array
 
 logger = logging.getLogger(__name__)
 
@@ -9,7 +13,10 @@ logger = logging.getLogger(__name__)
 # --- Adapter A ---
 # Wraps NetSuiteApi and translates its response into the unified Customer format.
 # Maps: customer_id → id, name → full_name, email → email, status → status
-class NetSuiteAdapter(Adapter):
+class NetSuiteAdapter(PagedAdapter, IncrementalAdapter, ExportingAdapter):
+
+    # Declarative mapping, compiled once into a fast extractor
+    EXTRACTOR = FieldMapping(id="customer_id", full_name="name", email="email", status="status").compile()
 
     def __init__(self, net_suite_api):
         # Compose the adaptee (NetSuiteApi) inside the adapter
@@ -17,13 +24,38 @@ class NetSuiteAdapter(Adapter):
         logger.info("NetSuiteAdapter created")
 
     # Fetch from NetSuite and translate to Customer dataclass
-    def get_customer_data(self) -> Customer:
+    def get_customer_data(self, customer_id: Optional[str] = None) -> Optional[Customer]:
         logger.info("Adapting NetSuite data → Customer")
-        data = self.net_suite_api.get_customer()
-
-        return Customer(
-            id=data["customer_id"],
-            full_name=data["name"],
-            email=data["email"],
-            status=data["status"]
-        )
\ No newline at end of file
+        data = self.net_suite_api.get_customer(customer_id)
+        return None if data is None else self.EXTRACTOR.extract(data)
+
+    # NetSuite honours If-None-Match — an unchanged record comes back as a bare 304
+    def get_customer_conditional(self, customer_id: Optional[str] = None,
+                                 etag: Optional[str] = None) -> ConditionalResult:
+        status, data, new_etag = self.net_suite_api.get_customer_conditional(customer_id, if_none_match=etag)
+        return ConditionalResult(status, None if data is None else self.EXTRACTOR.extract(data), new_etag)
+
+    # NetSuite paginates by offset — the cursor is the next offset
+    def fetch_customer_page(self, cursor, page_size: int) -> CustomerPage:
+        offset = cursor or 0
+        page = self.net_suite_api.list_customers(offset=offset, limit=page_size)
+        customers = self.EXTRACTOR.extract_page(page["items"])
+        return customers, (offset + page["count"] if page["hasMore"] else None)
+
+    # Columnar variant — columns come straight from the raw records
+    def fetch_customer_batch(self, cursor, page_size: int) -> CustomerBatchPage:
+        offset = cursor or 0
+        page = self.net_suite_api.list_customers(offset=offset, limit=page_size)
+        batch = self.EXTRACTOR.extract_batch(page["items"])
+        return batch, (offset + page["count"] if page["hasMore"] else None)
+
+    # NetSuite's saved search on lastModifiedDate — the cursor is its searchAfter key
+    def fetch_changed_page(self, since, cursor, page_size: int) -> ChangePage:
+        page = self.net_suite_api.list_modified_customers(modified_since=since, limit=page_size, search_after=cursor)
+        items = page["items"]
+        watermark = items[-1]["lastModifiedDate"] if items else None
+        return self.EXTRACTOR.extract_page(items), page["searchAfter"], watermark
+
+    # NetSuite exports are one JSON document with the customers under "items"
+    def iter_export(self, stream: IO, buffer_size: int = 64 * 1024) -> Iterator[Customer]:
+        return map(self.EXTRACTOR.extract, iter_json_array(stream, ("items",), buffer_size))
@@ -1,19 +1,127 @@
+import json
 import logging
+from itertools import islice
+from typing import IO, List, Optional, Tuple
+
+from src.example.etag import compute_etag
+from src.example.modification_log import ModificationLog
 
 logger = logging.getLogger(__name__)
 
 
 # --- Adaptee A ---
 # Simulates the NetSuite CRM API with its own field naming convention.
-# Fields: customer_id, name, email, status
+# Fields: customer_id, name, email, status, lastModifiedDate
 class NetSuiteApi():
 
-    # Returns raw customer data in NetSuite's format
-    def get_customer(self):
+    def __init__(self, total_customers: int = 1000):
+        # Size of the simulated customer base for list_customers()
+        self.total_customers = total_customers
+        # Records edited or added since the API came up, in modification order
+        self._changes = ModificationLog(id_field="customer_id", modified_field="lastModifiedDate")
+
+    # Returns raw customer data in NetSuite's format.
+    # With a customer_id, looks up a simulated customer (None if there's no such customer).
+    def get_customer(self, customer_id: Optional[str] = None):
         logger.info("Fetching customer data from NetSuite API")
+        return self._lookup(customer_id)
+
+    # Conditional GET, like If-None-Match: returns (status, record, etag).
+    # 304 with no record when `if_none_match` is still the current ETag, 404 for unknown ids.
+    def get_customer_conditional(self, customer_id: Optional[str] = None,
+                                 if_none_match: Optional[str] = None) -> Tuple[int, Optional[dict], Optional[str]]:
+        logger.info("Conditionally fetching customer data from NetSuite API")
+        record = self._lookup(customer_id)
+        if record is None:
+            return 404, None, None
+        etag = compute_etag(record.values())
+        if etag == if_none_match:
+            return 304, None, etag
+        return 200, record, etag
+
+    # Simulates an edit made in NetSuite — changes the record's ETag and lastModifiedDate
+    def update_customer(self, customer_id: str, **changes):
+        record = self._lookup(customer_id)
+        if record is None:
+            raise KeyError(customer_id)
+        self._changes.put({**record, **changes})
+
+    # Simulates a customer created in NetSuite; returns its id
+    def add_customer(self, **fields) -> str:
+        record = {**self._generate(self.total_customers), **fields}
+        self.total_customers += 1
+        return self._changes.put(record)["customer_id"]
+
+    # Offset/limit pagination, NetSuite-style: {items, offset, count, hasMore, totalResults}
+    def list_customers(self, offset: int = 0, limit: int = 1000):
+        logger.debug("Fetching NetSuite customers %d..%d", offset, offset + limit)
+        end = min(offset + limit, self.total_customers)
+        items = [self._record(i) for i in range(offset, end)]
+        return {
+            "items": items,
+            "offset": offset,
+            "count": len(items),
+            "hasMore": end < self.total_customers,
+            "totalResults": self.total_customers
+        }
+
+    # Saved search on lastModifiedDate, NetSuite-style: {items, hasMore, searchAfter}.
+    # Sorted by (lastModifiedDate, internal id); pass searchAfter back to get the next page.
+    def list_modified_customers(self, modified_since: Optional[str] = None, limit: int = 1000,
+                                search_after: Optional[List[str]] = None):
+        logger.debug("Fetching NetSuite customers modified since %s", modified_since)
+        after = tuple(search_after) if search_after else None
+        items = list(islice(self._changes.scan(self.total_customers, self._record, self._index,
+                                               modified_since, after), limit + 1))
+        has_more = len(items) > limit
+        del items[limit:]
+        last = items[-1] if items else None
+        return {
+            "items": items,
+            "hasMore": has_more,
+            "searchAfter": [last["lastModifiedDate"], last["customer_id"]] if has_more else None
+        }
+
+    # Bulk export, NetSuite-style: one JSON document {"items": [...], "totalResults": n} for every customer,
+    # written to a binary file object (file, socket...) chunk_size records at a time
+    def export_customers(self, out: IO[bytes], chunk_size: int = 1000):
+        logger.info("Exporting %d NetSuite customers", self.total_customers)
+        out.write(b'{"items": [')
+        for start in range(0, self.total_customers, chunk_size):
+            end = min(start + chunk_size, self.total_customers)
+            chunk = ", ".join(json.dumps(self._record(i)) for i in range(start, end))
+            out.write(((", " if start else "") + chunk).encode())
+        out.write(f'], "totalResults": {self.total_customers}}}'.encode())
+
+    # None = the default record; otherwise ids are "100000" + index
+    def _lookup(self, customer_id: Optional[str]) -> Optional[dict]:
+        if customer_id is None or customer_id == "101":
+            return self._changes.get("101") or {
+                "customer_id": "101",
+                "name": "Alice",
+                "email": "alice@example.com",
+                "status": "ACTIVE",
+                "lastModifiedDate": self._changes.created_at
+            }
+        i = self._index(customer_id)
+        return self._record(i) if 0 <= i < self.total_customers else None
+
+    # Internal index of a generated id (-1 if it isn't one)
+    @staticmethod
+    def _index(customer_id: str) -> int:
+        return int(customer_id) - 100000 if customer_id.isdigit() else -1
+
+    # Customer i, including any edits
+    def _record(self, i: int):
+        record = self._generate(i)
+        return (self._changes.get(record["customer_id"]) or record) if self._changes else record
+
+    # Generates customer i on the fly so large customer bases cost no memory
+    def _generate(self, i: int):
         return {
-            "customer_id": "101",
-            "name": "Alice",
-            "email": "alice@example.com",
-            "status": "ACTIVE"
+            "customer_id": str(100000 + i),
+            "name": f"NetSuite Customer {i}",
+            "email": f"ns.customer{i}@example.com",
+            "status": "ACTIVE" if i % 10 else "INACTIVE",
+            "lastModifiedDate": self._changes.created_at
         }
@@ -0,0 +1,128 @@
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows — SharedTokenBucket needs POSIX file locks
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+# --- Token Bucket ---
+# Allows `rate` requests per second on average, with bursts of up to `capacity`.
+# Tokens refill continuously; a request takes one token or learns how long to wait for it.
+class TokenBucket():
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.time):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._tokens, self._updated_at = float(capacity), clock()
+
+    # Takes `tokens` if at least tokens + reserve are available.
+    # Returns 0.0 when granted, otherwise the seconds until they will be.
+    def try_acquire(self, tokens: float = 1.0, reserve: float = 0.0) -> float:
+        with self._locked():
+            level, updated_at = self._load()
+            now = self.clock()
+            # max(): a wall clock stepping backwards must not drain the bucket
+            level = min(self.capacity, level + max(0.0, now - updated_at) * self.rate)
+            needed = tokens + reserve
+            if level >= needed:
+                self._store(level - tokens, now)
+                return 0.0
+            self._store(level, now)
+            return (needed - level) / self.rate
+
+    # Blocks until granted; False if that would take longer than `timeout`
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    # Storage and locking — overridden by SharedTokenBucket
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            yield
+
+    def _load(self) -> Tuple[float, float]:
+        return self._tokens, self._updated_at
+
+    def _store(self, tokens: float, updated_at: float):
+        self._tokens, self._updated_at = tokens, updated_at
+
+
+# --- Shared Token Bucket ---
+# Same bucket, with its state in a small memory-mapped file so every process using the same `name`
+# draws from one quota. The file lives in /dev/shm where available (RAM-backed), so this is
+# shared memory without a server. A file lock (flock) serializes processes; a thread lock
+# serializes threads within one (flock is per open file, so threads would otherwise share it).
+# The wall clock is used on purpose — it is the one clock all processes agree on.
+class SharedTokenBucket(TokenBucket):
+
+    _STATE = struct.Struct("dd")     # tokens, updated_at
+
+    def __init__(self, name: str, rate: float, capacity: float, clock: Callable[[], float] = time.time,
+                 directory: Optional[str] = None):
+        if fcntl is None:
+            raise RuntimeError("SharedTokenBucket needs POSIX file locks (fcntl)")
+        super().__init__(rate, capacity, clock)
+        if directory is None:
+            directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+        self.name = name
+        self.path = os.path.join(directory, f"{name}.bucket")
+        self._file = open(self.path, "a+b")
+        with self._flock():
+            # First one in sizes the file and fills the bucket; later ones just map it
+            created = os.fstat(self._file.fileno()).st_size < self._STATE.size
+            if created:
+                self._file.truncate(self._STATE.size)
+            self._state = mmap.mmap(self._file.fileno(), self._STATE.size)
+            if created:
+                self._store(float(capacity), clock())
+        logger.info("SharedTokenBucket %r %s (%.0f/s, burst %.0f)", name,
+                    "created" if created else "attached", rate, capacity)
+
+    def close(self):
+        self._state.close()
+        self._file.close()
+
+    # Removes the state file; processes still attached keep their mapping until they close
+    def unlink(self):
+        os.unlink(self.path)
+
+    @contextmanager
+    def _locked(self):
+        with self._lock, self._flock():
+            yield
+
+    @contextmanager
+    def _flock(self):
+        fcntl.flock(self._file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+
+    def _load(self) -> Tuple[float, float]:
+        return self._STATE.unpack_from(self._state)
+
+    def _store(self, tokens: float, updated_at: float):
+        self._STATE.pack_into(self._state, 0, tokens, updated_at)
@@ -0,0 +1,108 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.example.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = 0     # a user is waiting — served first
+BULK = 1            # paging, syncs, exports — served when no interactive request is waiting
+
+
+# Counters exposed by the scheduler
+@dataclass
+class SchedulerStats():
+    requests: int = 0           # calls that went to the API
+    coalesced: int = 0          # calls answered by an identical call already in flight
+    interactive_wait: float = 0.0   # seconds spent waiting for tokens, per lane
+    bulk_wait: float = 0.0
+
+
+# --- Request Scheduler ---
+# Sits between adapters and one CRM API; every adapter of that CRM shares one scheduler.
+#   - each call takes a token from the API's bucket first, so the API's quota is never exceeded
+#     (with a SharedTokenBucket, not even by all processes together)
+#   - identical calls already in flight are coalesced: the second caller waits for the first's answer
+#   - calls wait in priority lanes: an interactive call always gets the next token before any bulk call,
+#     and bulk calls leave `bulk_reserve` tokens in the bucket — headroom for interactive calls from
+#     other processes, which this process's lanes can't see
+class RequestScheduler():
+
+    def __init__(self, bucket: TokenBucket, bulk_reserve: float = 0.0):
+        # A bulk call needs 1 + bulk_reserve tokens at once, and the bucket never holds more than capacity
+        if not 0.0 <= bulk_reserve <= bucket.capacity - 1:
+            raise ValueError("bulk_reserve must be between 0 and the bucket capacity minus one")
+        self.bucket = bucket
+        self.bulk_reserve = bulk_reserve
+        self.stats = SchedulerStats()
+        self._cond = threading.Condition()
+        self._waiting: List[Tuple[int, int]] = []      # heap of (lane, arrival) tickets
+        self._arrivals = itertools.count()
+        self._in_flight: Dict[Hashable, Future] = {}
+
+    # Runs fn(*args) once a token is granted in `lane`.
+    # Calls with the same non-None `key` made while one is in flight share its result (or exception).
+    def call(self, lane: int, key: Optional[Hashable], fn: Callable[..., Any], *args) -> Any:
+        if key is None:
+            return self._run(lane, fn, args)
+        with self._cond:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+            else:
+                self.stats.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            future.set_result(self._run(lane, fn, args))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._cond:
+                del self._in_flight[key]
+        return future.result()
+
+    def _run(self, lane: int, fn: Callable[..., Any], args: tuple) -> Any:
+        self._wait_for_token(lane)
+        return fn(*args)
+
+    # Queues a ticket and waits until it is first in line and the bucket grants a token.
+    # Only the head ticket polls the bucket; the others sleep until the line moves.
+    def _wait_for_token(self, lane: int):
+        ticket = (lane, next(self._arrivals))
+        reserve = self.bulk_reserve if lane == BULK else 0.0
+        start = time.perf_counter()
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            # A new head may have arrived — let the old one step back
+            self._cond.notify_all()
+            try:
+                while True:
+                    if self._waiting[0] != ticket:
+                        self._cond.wait()
+                        continue
+                    wait = self.bucket.try_acquire(1.0, reserve)
+                    if wait == 0.0:
+                        heapq.heappop(self._waiting)
+                        break
+                    self._cond.wait(wait)
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                raise
+            finally:
+                # The line moved — wake the next head
+                self._cond.notify_all()
+            self.stats.requests += 1
+            waited = time.perf_counter() - start
+            if lane == INTERACTIVE:
+                self.stats.interactive_wait += waited
+            else:
+                self.stats.bulk_wait += waited
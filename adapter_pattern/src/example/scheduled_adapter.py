@@ -0,0 +1,60 @@
+import logging
+from typing import IO, Any, Iterator, Optional
+
+from src.example.adapter import (Adapter, ChangePage, ConditionalResult, CustomerBatchPage, CustomerPage,
+                                 ExportingAdapter, IncrementalAdapter, PagedAdapter, WrappingAdapter)
+from src.example.customer import Customer
+from src.example.request_scheduler import BULK, INTERACTIVE, RequestScheduler
+
+logger = logging.getLogger(__name__)
+
+
+# Bulk calls aren't coalesced — cursors needn't be hashable, and two syncs rarely ask for the same page
+class _ScheduledPages(PagedAdapter):
+
+    def fetch_customer_page(self, cursor: Optional[Any], page_size: int) -> CustomerPage:
+        return self.scheduler.call(BULK, None, self.adapter.fetch_customer_page, cursor, page_size)
+
+    def fetch_customer_batch(self, cursor: Optional[Any], page_size: int) -> CustomerBatchPage:
+        return self.scheduler.call(BULK, None, self.adapter.fetch_customer_batch, cursor, page_size)
+
+
+class _ScheduledChanges(IncrementalAdapter):
+
+    def fetch_changed_page(self, since: Optional[str], cursor: Optional[Any], page_size: int) -> ChangePage:
+        return self.scheduler.call(BULK, None, self.adapter.fetch_changed_page, since, cursor, page_size)
+
+
+# The export was already fetched — parsing it makes no API calls, so it skips the scheduler
+class _ScheduledExports(ExportingAdapter):
+
+    def iter_export(self, stream: IO, buffer_size: int = 64 * 1024) -> Iterator[Customer]:
+        return self.adapter.iter_export(stream, buffer_size)
+
+
+# --- Scheduled Adapter ---
+# Wraps any adapter so its CRM calls go through a RequestScheduler.
+# Single-customer lookups use the interactive lane and are coalesced; page fetches use the bulk lane.
+# Give every adapter of the same CRM the same scheduler — that's what keeps them within one quota.
+# Paging, change feeds and exports are offered only if the wrapped adapter supports them
+# (see WrappingAdapter).
+class ScheduledAdapter(WrappingAdapter):
+
+    FORWARDS = ((PagedAdapter, _ScheduledPages), (IncrementalAdapter, _ScheduledChanges),
+                (ExportingAdapter, _ScheduledExports))
+
+    def __init__(self, adapter: Adapter, scheduler: RequestScheduler):
+        self.adapter = adapter
+        self.scheduler = scheduler
+        logger.info("ScheduledAdapter wrapping %s", type(adapter).__name__)
+
+    # Lookups are keyed on the wrapped adapter's identity, not its class — two adapters of one CRM
+    # may talk to different endpoints or accounts, and must never answer each other's calls
+    def get_customer_data(self, customer_id: Optional[str] = None) -> Optional[Customer]:
+        return self.scheduler.call(INTERACTIVE, ("get", id(self.adapter), customer_id),
+                                   self.adapter.get_customer_data, customer_id)
+
+    def get_customer_conditional(self, customer_id: Optional[str] = None,
+                                 etag: Optional[str] = None) -> ConditionalResult:
+        return self.scheduler.call(INTERACTIVE, ("conditional", id(self.adapter), customer_id, etag),
+                                   self.adapter.get_customer_conditional, customer_id, etag)
@@ -0,0 +1,105 @@
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
+
+from src.example.customer import Customer
+
+logger = logging.getLogger(__name__)
+
+
+# Where a source's sync stands.
+# watermark: newest modification time covered by the last complete sync (None = never synced)
+# cursor / pending_watermark: progress of a sync that hasn't finished yet, so it can resume
+@dataclass
+class SyncState():
+    watermark: Optional[str] = None
+    cursor: Optional[Any] = None
+    pending_watermark: Optional[str] = None
+
+
+# --- Snapshot Store ---
+# Local sqlite copy of every source's customers, plus per-source sync state.
+# Each page of changes is applied as upserts in the same transaction that records the
+# sync's progress, so a crash never leaves customers and watermark out of step.
+class SnapshotStore():
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS customers ("
+            "source TEXT NOT NULL, id TEXT NOT NULL, full_name TEXT, email TEXT, status TEXT, "
+            "PRIMARY KEY (source, id)) WITHOUT ROWID"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            "source TEXT PRIMARY KEY, watermark TEXT, cursor TEXT, pending_watermark TEXT)"
+        )
+        self._db.commit()
+
+    def get_state(self, source: str) -> SyncState:
+        row = self._db.execute(
+            "SELECT watermark, cursor, pending_watermark FROM sync_state WHERE source = ?", (source,)
+        ).fetchone()
+        if row is None:
+            return SyncState()
+        return SyncState(row[0], None if row[1] is None else json.loads(row[1]), row[2])
+
+    # Upserts one page of customers and checkpoints the sync in a single transaction
+    def apply_page(self, source: str, customers: List[Customer], cursor: Optional[Any],
+                   pending_watermark: Optional[str]):
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO customers VALUES (?, ?, ?, ?, ?)",
+                [(source, c.id, c.full_name, c.email, c.status) for c in customers]
+            )
+            self._save_state(source, json.dumps(cursor) if cursor is not None else None, pending_watermark)
+
+    # Marks the sync complete: the pending watermark becomes the one the next sync starts from
+    def finish_sync(self, source: str, watermark: Optional[str]):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, NULL, NULL)", (source, watermark)
+            )
+
+    def get(self, source: str, customer_id: str) -> Optional[Customer]:
+        row = self._db.execute(
+            "SELECT id, full_name, email, status FROM customers WHERE source = ? AND id = ?", (source, customer_id)
+        ).fetchone()
+        return None if row is None else Customer(*row)
+
+    def count(self, source: Optional[str] = None) -> int:
+        if source is None:
+            return self._db.execute("SELECT COUNT(*) FROM customers").fetchone()[0]
+        return self._db.execute("SELECT COUNT(*) FROM customers WHERE source = ?", (source,)).fetchone()[0]
+
+    # Streams one source's customers in id order
+    def iter_customers(self, source: str) -> Iterator[Customer]:
+        rows = self._db.execute(
+            "SELECT id, full_name, email, status FROM customers WHERE source = ? ORDER BY id", (source,)
+        )
+        for row in rows:
+            yield Customer(*row)
+
+    # Forgets a source entirely — its next sync is a full one
+    def reset(self, source: str):
+        logger.info("Resetting snapshot of %s", source)
+        with self._db:
+            self._db.execute("DELETE FROM customers WHERE source = ?", (source,))
+            self._db.execute("DELETE FROM sync_state WHERE source = ?", (source,))
+
+    def close(self):
+        self._db.close()
+
+    # Keeps the committed watermark; only the in-progress fields change
+    def _save_state(self, source: str, cursor: Optional[str], pending_watermark: Optional[str]):
+        updated = self._db.execute(
+            "UPDATE sync_state SET cursor = ?, pending_watermark = ? WHERE source = ?",
+            (cursor, pending_watermark, source)
+        ).rowcount
+        if not updated:
+            self._db.execute("INSERT INTO sync_state VALUES (?, NULL, ?, ?)", (source, cursor, pending_watermark))
@@ -1,5 +1,9 @@
 import logging
+import operator
 from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
+from typing import Optional, Sequence, Tuple, Type
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -21,50 +25,89 @@ class Coffee(ABC):
     def get_cost(self) -> float:
         pass
 
+    # Ordered ingredient names, base first — e.g. ("Plain Coffee", "Milk", "Sugar")
+    def get_components(self) -> Tuple[str, ...]:
+        return (self.get_description(),)
+
 
 # --- Concrete Component ---
 # The base object that decorators will wrap. Starts at $2.00.
 class PlainCoffee(Coffee):
+    NAME = "Plain Coffee"
+    COST = 2.00
+
     def get_description(self) -> str:
-        return "Plain Coffee"
+        return self.NAME
 
     def get_cost(self) -> float:
-        return 2.00
+        return self.COST
 
 
 # --- Base Decorator ---
 # Wraps a Coffee object and delegates calls to it. Subclasses add behavior on top.
+# Subclasses declare NAME and COST. Running cost, components and description are computed
+# once, when wrapping, from the wrapped coffee's already-computed values — reading them is O(1).
 class CoffeeDecorator(Coffee):
+    NAME: Optional[str] = None      # None → adds nothing to the description
+    COST: float = 0.0
+
     def __init__(self, decorate_coffee: Coffee):
         # Hold a reference to the wrapped coffee (composition)
         self.decorate_coffee = decorate_coffee
-        logger.info("Wrapping [%s] with %s", decorate_coffee.get_description(), type(self).__name__)
+        logger.info("Wrapping %s with %s", type(decorate_coffee).__name__, type(self).__name__)
+        self._cost = decorate_coffee.get_cost() + self.COST
+        if isinstance(decorate_coffee, CoffeeDecorator) and decorate_coffee.NAME is None:
+            # A layer without a NAME may describe itself by overriding get_description
+            inner = (decorate_coffee.get_description(),)
+        else:
+            inner = decorate_coffee.get_components()
+        self._components = inner + ((self.NAME,) if self.NAME is not None else ())
+        self._description = ", ".join(self._components)
 
     def get_description(self):
-        return self.decorate_coffee.get_description()
+        return self._description
 
     def get_cost(self):
-        return self.decorate_coffee.get_cost()
+        return self._cost
+
+    def get_components(self):
+        return self._components
 
 
 # --- Concrete Decorator A ---
 # Adds milk to the coffee (+$0.50).
 class Milk(CoffeeDecorator):
-    def get_description(self):
-        return self.decorate_coffee.get_description() + ', Milk'
-
-    def get_cost(self):
-        return self.decorate_coffee.get_cost() + 0.50
+    NAME = "Milk"
+    COST = 0.50
 
 
 # --- Concrete Decorator B ---
 # Adds sugar to the coffee (+$0.10).
 class Sugar(CoffeeDecorator):
-    def get_description(self):
-        return self.decorate_coffee.get_description() + ', Sugar'
-
-    def get_cost(self):
-        return self.decorate_coffee.get_cost() + 0.10
+    NAME = "Sugar"
+    COST = 0.10
+
+
+# --- Bulk Pricing ---
+# Prices many orders without building a decorator chain per order.
+# Each order is a row of add-on counts (one column per add-on class), stored flat
+# row-major in `counts`: [milk_0, sugar_0, milk_1, sugar_1, ...].
+# Works column by column with map() over array slices, so the per-element loop runs in C.
+def price_orders(counts: Sequence[int],
+                 add_ons: Sequence[Type[CoffeeDecorator]] = (Milk, Sugar),
+                 base: Type[Coffee] = PlainCoffee) -> array:
+    width = len(add_ons)
+    if width == 0 or len(counts) % width:
+        raise ValueError(f"counts length {len(counts)} is not a multiple of {width} add-on(s)")
+    if not isinstance(counts, array):
+        counts = array("q", counts)
+
+    n_orders = len(counts) // width
+    totals = array("d", [base.COST]) * n_orders
+    for column, add_on in enumerate(add_ons):
+        per_order = map(operator.mul, counts[column::width], repeat(add_on.COST, n_orders))
+        totals = array("d", map(operator.add, totals, per_order))
+    return totals
 
 
 if __name__ == '__main__':
@@ -81,4 +124,7 @@ if __name__ == '__main__':
     # Wrap again with Sugar decorator ($2.50 + $0.10 = $2.60)
     sugar_coffee = Sugar(milk_coffee)
     logger.info("After Sugar: %s — $%.2f", sugar_coffee.get_description(), sugar_coffee.get_cost())
-    
\ No newline at end of file
+
+    # Bulk pricing — 3 orders as (milk, sugar) counts: plain, milk+sugar, double milk
+    totals = price_orders([0, 0, 1, 1, 2, 0])
+    logger.info("Bulk prices: %s", ", ".join(f"${t:.2f}" for t in totals))
@@ -1,4 +1,6 @@
-from src.example.data_source import DataSource
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+
+from src.example.data_source import DEFAULT_CHUNK_SIZE, DataSource
 
 
 # --- Base Decorator ---
@@ -12,4 +14,43 @@ class DataSourceDecorator(DataSource):
 
     # Default: pass through to the wrapped data source
     def fetch_data(self):
-        return self.decorated_datasource.fetch_data()
\ No newline at end of file
+        return self.decorated_datasource.fetch_data()
+
+    # Async pass-through. A subclass that only overrides fetch_data still gets its sync
+    # behavior, run off the event loop, rather than silently skipping it.
+    async def afetch_data(self) -> str:
+        if type(self).fetch_data is not DataSourceDecorator.fetch_data:
+            return await super().afetch_data()
+        return await self.decorated_datasource.afetch_data()
+
+    # Streams chunks from the wrapped source, transforming each one on the way up.
+    # Only one chunk per layer is alive at a time, so deep chains stay constant-memory.
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        transform = self.transform_chunk
+        for chunk in self.decorated_datasource.iter_chunks(size):
+            yield transform(chunk)
+
+    # Per-chunk hook for streaming decorators — default: unchanged
+    def transform_chunk(self, chunk: str) -> str:
+        return chunk
+
+    # Default: pass writes through to the wrapped data source.
+    # Transforming decorators override both write methods to apply the write-direction transform.
+    def write_data(self, data: str):
+        self.decorated_datasource.write_data(data)
+
+    def write_many(self, chunks: Sequence[str]):
+        self.decorated_datasource.write_many(chunks)
+
+    def flush(self, fsync: bool = False):
+        self.decorated_datasource.flush(fsync)
+
+    def close(self):
+        self.decorated_datasource.close()
+
+    # Describes this layer for chain fusion (see chain_fusion.py) as a (before, after) pair:
+    # `before()` runs ahead of the inner fetch, `after(data)` transforms its result.
+    # Returns None when the layer can't be expressed that way and must stay a real call.
+    # Default: a plain pass-through layer has nothing to add.
+    def fusion_hooks(self) -> Optional[Tuple[Optional[Callable[[], None]], Optional[Callable[[str], str]]]]:
+        return None, None
@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import time
+
+from src.example.data_source import DataSource
+from src.example.fan_in_data_source import FanInDataSource
+from src.example.logging_decorator import LoggingDecorator
+from src.example.uppercase_decorator import UppercaseDecorator
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+SOURCES = 200
+LATENCY = 0.02          # seconds per simulated fetch
+
+
+# Simulated remote source — every fetch waits LATENCY seconds
+class SlowDataSource(DataSource):
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def fetch_data(self) -> str:
+        time.sleep(LATENCY)
+        return f"data from {self.name}"
+
+    async def afetch_data(self) -> str:
+        await asyncio.sleep(LATENCY)
+        return f"data from {self.name}"
+
+
+if __name__ == '__main__':
+    logger.info("=== Decorator Pattern — Async Fan-In Benchmark ===")
+    logging.getLogger("src.example.logging_decorator").setLevel(logging.WARNING)
+
+    sources = [UppercaseDecorator(SlowDataSource(f"source-{i}")) for i in range(SOURCES)]
+
+    start = time.perf_counter()
+    serial = FanInDataSource(sources).fetch_data()
+    logger.info("sync, serial           | %6.2f s", time.perf_counter() - start)
+
+    for limit in (10, 50, 200):
+        chain = LoggingDecorator(FanInDataSource(sources, max_concurrency=limit))
+        start = time.perf_counter()
+        result = asyncio.run(chain.afetch_data())
+        logger.info("async, concurrency %3d | %6.2f s", limit, time.perf_counter() - start)
+        assert result == serial
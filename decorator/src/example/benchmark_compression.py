@@ -0,0 +1,82 @@
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.example.compression_decorator import CompressionDecorator, DecompressionDecorator
+from src.example.data_source import DataSource
+from src.example.file_data_source import FileDataSource
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+FILE_SIZE_MB = 16
+FRAME_SIZE = 1024 * 1024
+
+
+# Serves a fixed payload — stands in for compressed data at rest
+class StaticDataSource(DataSource):
+
+    def __init__(self, data: str):
+        self.data = data
+
+    def fetch_data(self) -> str:
+        return self.data
+
+
+# Writes a synthetic, moderately compressible text file
+def make_file(path: str, size_mb: int):
+    words = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+    with open(path, "w", encoding="utf-8") as f:
+        written = i = 0
+        while written < size_mb * 1024 * 1024:
+            line = f"{i} {words[i % 8]} {words[(i * 7) % 8]} {i * 2654435761 % 1000003}\n"
+            f.write(line)
+            written += len(line)
+            i += 1
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    logger.info("=== Decorator Pattern — Parallel Frame Compression Benchmark ===")
+    logging.getLogger("src.example.compression_decorator").setLevel(logging.WARNING)
+
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        make_file(path, FILE_SIZE_MB)
+        size = os.path.getsize(path)
+        source = FileDataSource(path)
+        original = source.fetch_data()
+
+        for codec in ("zlib", "lzma"):
+            for workers in sorted({1, os.cpu_count() or 1}):
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    compress = CompressionDecorator(source, codec=codec, frame_size=FRAME_SIZE,
+                                                    executor=pool, max_workers=workers)
+                    c_time, container = timed(compress.fetch_data)
+
+                    decompress = DecompressionDecorator(StaticDataSource(container),
+                                                        executor=pool, max_workers=workers)
+                    d_time, restored = timed(decompress.fetch_data)
+                    assert restored == original
+
+                    # A 4 KiB read from the middle touches a single frame
+                    r_time, _ = timed(lambda: decompress.read_range(size // 2, 4096))
+
+                logger.info("%-4s | %2d worker(s) | ratio %5.2f | compress %6.1f MB/s | "
+                            "decompress %6.1f MB/s | 4 KiB ranged read %6.2f ms",
+                            codec, workers, size / len(container), size / c_time / 1e6,
+                            size / d_time / 1e6, r_time * 1e3)
+    finally:
+        os.remove(path)
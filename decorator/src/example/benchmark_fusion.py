@@ -0,0 +1,48 @@
+import logging
+import timeit
+
+from src.example.base_decorator import DataSourceDecorator
+from src.example.chain_fusion import FusedDataSource, fuse_chain
+from src.example.file_data_source import FileDataSource
+from src.example.logging_decorator import LoggingDecorator
+from src.example.uppercase_decorator import UppercaseDecorator
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+CALLS = 200_000
+
+
+# Builds a chain `depth` layers deep, cycling through the given decorator types
+def build_chain(depth: int, layer_types):
+    source = FileDataSource()
+    for i in range(depth):
+        source = layer_types[i % len(layer_types)](source)
+    return source
+
+
+if __name__ == '__main__':
+    logger.info("=== Decorator Pattern — Chain Fusion Benchmark ===")
+    # Keep LoggingDecorator layers in the chain but stop them writing during timing
+    logging.getLogger("src.example.logging_decorator").setLevel(logging.WARNING)
+    logging.getLogger("src.example.chain_fusion").setLevel(logging.WARNING)
+
+    mixes = {
+        "pass-through": [DataSourceDecorator],
+        "uppercase": [UppercaseDecorator, DataSourceDecorator],
+        "logging+uppercase": [LoggingDecorator, UppercaseDecorator],
+    }
+    for name, layer_types in mixes.items():
+        for depth in (5, 10, 15):
+            chain = build_chain(depth, layer_types)
+            fused = fuse_chain(chain)
+            assert fused() == chain.fetch_data() == FusedDataSource(chain).fetch_data()
+
+            unfused_s = timeit.timeit(chain.fetch_data, number=CALLS)
+            fused_s = timeit.timeit(fused, number=CALLS)
+            logger.info("%-17s depth %2d | unfused %6.0f ns/call | fused %6.0f ns/call | %4.1fx",
+                        name, depth, unfused_s / CALLS * 1e9, fused_s / CALLS * 1e9, unfused_s / fused_s)
@@ -0,0 +1,57 @@
+import logging
+import os
+import time
+import timeit
+
+from src.example.data_source import DataSource
+from src.example.file_data_source import FileDataSource
+from src.example.instrumentation_decorator import InstrumentationDecorator, format_report, instrument_chain
+from src.example.logging_decorator import LoggingDecorator
+from src.example.uppercase_decorator import UppercaseDecorator
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+CALLS = 200_000
+
+
+# Source with a noticeable per-call cost, so the per-layer report has something to find
+class SlowDataSource(DataSource):
+
+    def fetch_data(self) -> str:
+        time.sleep(0.0005)
+        return "fetching data"
+
+
+if __name__ == '__main__':
+    logger.info("=== Decorator Pattern — Instrumentation Overhead Benchmark ===")
+    # LoggingDecorator logs at INFO as it would in production, but into /dev/null
+    # so terminal speed doesn't skew the numbers
+    decorator_logger = logging.getLogger("src.example.logging_decorator")
+    decorator_logger.propagate = False
+    decorator_logger.addHandler(logging.StreamHandler(open(os.devnull, "w")))
+    logging.getLogger("src.example.instrumentation_decorator").setLevel(logging.WARNING)
+
+    setups = {
+        "bare": lambda: UppercaseDecorator(FileDataSource()),
+        "logging": lambda: LoggingDecorator(UppercaseDecorator(FileDataSource())),
+        "instrumented": lambda: InstrumentationDecorator(UppercaseDecorator(FileDataSource())),
+        "instr. disabled": lambda: InstrumentationDecorator(UppercaseDecorator(FileDataSource()), enabled=False),
+    }
+    baseline = None
+    for name, build in setups.items():
+        chain = build()
+        ns = timeit.timeit(chain.fetch_data, number=CALLS) / CALLS * 1e9
+        baseline = baseline or ns
+        logger.info("%-16s | %6.0f ns/call | overhead %+6.0f ns", name, ns, ns - baseline)
+
+    logger.info("--- Per-layer report ---")
+    top, instruments = instrument_chain(UppercaseDecorator(UppercaseDecorator(SlowDataSource())), sample_every=0)
+    for _ in range(200):
+        top.fetch_data()
+    for line in format_report(instruments):
+        logger.info(line)
@@ -0,0 +1,65 @@
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.example.file_data_source import FileDataSource
+from src.example.logging_decorator import LoggingDecorator
+from src.example.uppercase_decorator import UppercaseDecorator
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+FILE_SIZE_MB = 64
+CHUNK_SIZE = 256 * 1024
+
+
+# Writes a synthetic text file of roughly `size_mb` megabytes
+def make_file(path: str, size_mb: int):
+    line = "the quick brown fox jumps over the lazy dog — ünïcödé\n"
+    block = line * (1024 * 1024 // len(line.encode("utf-8")))
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(size_mb):
+            f.write(block)
+
+
+# Runs `fn`, returning (seconds, peak traced bytes)
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == '__main__':
+    logger.info("=== Decorator Pattern — Streaming vs Whole-String Benchmark ===")
+    # Silence the per-call chain logging so it doesn't skew timings
+    logging.getLogger("src.example.logging_decorator").setLevel(logging.WARNING)
+
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        make_file(path, FILE_SIZE_MB)
+        size = os.path.getsize(path)
+        chain = LoggingDecorator(UppercaseDecorator(FileDataSource(path)))
+
+        def whole():
+            return len(chain.fetch_data())
+
+        def streamed():
+            return sum(len(c) for c in chain.iter_chunks(CHUNK_SIZE))
+
+        for name, fn in (("whole-string", whole), ("streamed", streamed)):
+            elapsed, peak = measure(fn)
+            logger.info("%-12s | %6.1f MB/s | peak memory %8.1f MB",
+                        name, size / elapsed / 1e6, peak / 1e6)
+    finally:
+        os.remove(path)
@@ -0,0 +1,52 @@
+import logging
+import os
+import tempfile
+import time
+
+from src.example.buffered_write_decorator import FSYNC_CLOSE, BufferedWriteDecorator
+from src.example.file_data_source import FileDataSource
+from src.example.uppercase_decorator import UppercaseDecorator
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+RECORDS = 200_000
+
+
+def records():
+    return (f"record {i}: status=ok latency_ms={i % 97}\n" for i in range(RECORDS))
+
+
+if __name__ == '__main__':
+    logger.info("=== Decorator Pattern — Buffered Write Benchmark ===")
+
+    fd, path = tempfile.mkstemp(suffix=".log")
+    os.close(fd)
+    try:
+        setups = {
+            "unbuffered": lambda: UppercaseDecorator(FileDataSource(path)),
+            "buffered 64 KiB": lambda: BufferedWriteDecorator(UppercaseDecorator(FileDataSource(path)),
+                                                              max_bytes=64 * 1024),
+            "buffered 1 MiB": lambda: BufferedWriteDecorator(UppercaseDecorator(FileDataSource(path)),
+                                                             max_bytes=1024 * 1024, fsync=FSYNC_CLOSE),
+        }
+        expected = None
+        for name, build in setups.items():
+            open(path, "w").close()
+            start = time.perf_counter()
+            with build() as sink:
+                for record in records():
+                    sink.write_data(record)
+            elapsed = time.perf_counter() - start
+
+            written = FileDataSource(path).fetch_data()
+            expected = expected or written
+            assert written == expected
+            flushes = getattr(sink, "flush_count", RECORDS)
+            logger.info("%-16s | %8.0f records/s | %6d write call(s)", name, RECORDS / elapsed, flushes)
+    finally:
+        os.remove(path)
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Iterator, List, Optional, Sequence
+
+from src.example.base_decorator import DataSourceDecorator
+from src.example.data_source import DEFAULT_CHUNK_SIZE, DataSource
+
+logger = logging.getLogger(__name__)
+
+# When buffered data is fsync'ed
+FSYNC_NEVER = "never"       # leave it to the OS
+FSYNC_FLUSH = "flush"       # after every flush — durable, slower
+FSYNC_CLOSE = "close"       # once, on close
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_FLUSH, FSYNC_CLOSE)
+
+
+# --- Concrete Decorator F ---
+# Coalesces small writes into batches — one write_many (a single writev for files)
+# per flush instead of a syscall per record.
+# A flush happens when the buffer reaches `max_bytes`, when the oldest buffered write
+# is `max_delay` seconds old, or on an explicit flush()/close().
+# Reads flush first, so callers always see their own writes.
+# A failed flush keeps its batch buffered for the next attempt; a failure on the timer
+# thread is re-raised by the next write_data/write_many/flush.
+class BufferedWriteDecorator(DataSourceDecorator):
+
+    def __init__(self, decorated_datasource: DataSource, max_bytes: int = 1024 * 1024,
+                 max_delay: Optional[float] = 1.0, fsync: str = FSYNC_NEVER):
+        super().__init__(decorated_datasource)
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"unknown fsync policy '{fsync}', expected one of {FSYNC_POLICIES}")
+        self.max_bytes = max_bytes              # size threshold, counted in characters
+        self.max_delay = max_delay              # time threshold in seconds, None = size-only
+        self.fsync = fsync
+        self.flush_count = 0
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._timer: Optional[threading.Timer] = None
+        self._error: Optional[BaseException] = None    # raised by a timer flush, not yet reported
+        self._lock = threading.RLock()
+
+    def write_data(self, data: str):
+        with self._lock:
+            self._raise_timer_error()
+            self._pending.append(data)
+            self._pending_size += len(data)
+            self._after_append()
+
+    def write_many(self, chunks: Sequence[str]):
+        with self._lock:
+            self._raise_timer_error()
+            self._pending.extend(chunks)
+            self._pending_size += sum(map(len, chunks))
+            self._after_append()
+
+    # Writes out everything buffered as one batch
+    def flush(self, fsync: bool = False):
+        with self._lock:
+            self._raise_timer_error()
+            self._flush_pending()
+            self.decorated_datasource.flush(fsync or self.fsync == FSYNC_FLUSH)
+
+    # The wrapped source is closed even if the final flush (or an unreported timer flush) failed
+    def close(self):
+        try:
+            with self._lock:
+                self._raise_timer_error()
+                self._flush_pending()
+                self.decorated_datasource.flush(self.fsync != FSYNC_NEVER)
+        finally:
+            super().close()
+
+    # Read-your-writes: push pending data down before reading
+    def fetch_data(self):
+        self.flush()
+        return self.decorated_datasource.fetch_data()
+
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        self.flush()
+        return super().iter_chunks(size)
+
+    # flush() blocks on the decorated source's write, so it runs on the loop's executor
+    async def afetch_data(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+        return await self.decorated_datasource.afetch_data()
+
+    # Fusion: reads must flush first, so this layer stays a real call
+    def fusion_hooks(self):
+        return None
+
+    # Caller must hold the lock
+    def _after_append(self):
+        if self._pending_size >= self.max_bytes:
+            self.flush()
+        elif self.max_delay is not None and self._timer is None:
+            # First write into an empty buffer starts the clock
+            self._timer = threading.Timer(self.max_delay, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    # Runs on the timer thread; a timer cancelled while it waited for the lock does nothing
+    def _on_timer(self):
+        with self._lock:
+            if self._timer is not threading.current_thread():
+                return
+            self._timer = None
+            try:
+                self.flush()
+            except Exception as e:
+                # Nobody is waiting on this thread — keep the error for the next caller
+                logger.error("Timed flush failed, %d write(s) still buffered: %s", len(self._pending), e)
+                self._error = e
+
+    # Caller must hold the lock
+    def _raise_timer_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    # Caller must hold the lock
+    def _flush_pending(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        start = time.perf_counter()
+        # Cleared only once written — if the write raises, the batch stays buffered
+        self.decorated_datasource.write_many(self._pending)
+        count = len(self._pending)
+        self._pending, self._pending_size = [], 0
+        self.flush_count += 1
+        logger.debug("Flushed %d write(s) in %.2f ms", count, (time.perf_counter() - start) * 1e3)
@@ -0,0 +1,154 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from src.example.base_decorator import DataSourceDecorator
+from src.example.data_source import DataSource
+
+logger = logging.getLogger(__name__)
+
+
+# Hit/miss/eviction counters exposed by the cache
+@dataclass
+class CacheStats():
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0          # underlying fetches — lower than misses when loads were shared
+    evictions: int = 0      # dropped to respect max_entries
+    expirations: int = 0    # dropped because the TTL ran out
+
+
+# --- Cache Store ---
+# Thread-safe LRU cache with optional TTL and single-flight loading.
+# Concurrent misses on the same key share one loader call instead of stampeding the source.
+# Each load is tagged with a generation number; invalidate()/clear() detach in-flight loads,
+# so a load that started before the invalidation never stores its (possibly stale) result.
+class LRUCache():
+
+    def __init__(self, max_entries: int = 128, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl                                                  # seconds, None = never expire
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()  # key -> (value, expires_at)
+        self._in_flight: Dict[Hashable, Tuple[Future, int]] = {}        # key -> (pending load, generation)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    # Returns the cached value for `key`, calling `loader` at most once across threads on a miss
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+                del self._entries[key]
+                self.stats.expirations += 1
+
+            self.stats.misses += 1
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                self._generation += 1
+                generation = self._generation
+                pending = Future()
+                self._in_flight[key] = (pending, generation)
+                self.stats.loads += 1
+            else:
+                pending, generation = in_flight[0], None
+
+        # Another thread is already loading this key — wait for its result
+        if generation is None:
+            return pending.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._finish(key, generation)
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            # Invalidated mid-load — hand the value to this load's waiters but don't cache it
+            if self._finish(key, generation):
+                self._store(key, value)
+        pending.set_result(value)
+        return value
+
+    # Drops one key (e.g. after the underlying file changed)
+    # An in-flight load is detached: the next get_or_load starts a fresh one
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._in_flight.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._in_flight.clear()
+
+    # Ends a load; False if it was detached by an invalidation (caller must hold the lock)
+    def _finish(self, key: Hashable, generation: int) -> bool:
+        in_flight = self._in_flight.get(key)
+        if in_flight is None or in_flight[1] != generation:
+            return False
+        del self._in_flight[key]
+        return True
+
+    # Caller must hold the lock
+    def _store(self, key: Hashable, value: Any):
+        expires_at = float("inf") if self.ttl is None else self.clock() + self.ttl
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+# --- Concrete Decorator C ---
+# Adds caching behavior — repeated fetches are served from memory instead of the wrapped chain.
+# Several decorators can share one LRUCache, each under its own key, so the size bound
+# applies across all of them.
+# Streaming (iter_chunks) is passed through uncached — streams may be larger than memory.
+class CachingDecorator(DataSourceDecorator):
+
+    def __init__(self, decorated_datasource: DataSource, cache: Optional[LRUCache] = None,
+                 key: Optional[Hashable] = None):
+        super().__init__(decorated_datasource)
+        self.cache = cache if cache is not None else LRUCache()
+        # Default key is unique to this decorator
+        self.key = key if key is not None else object()
+
+    # Serve from cache, loading through the wrapped source on a miss
+    def fetch_data(self):
+        return self.cache.get_or_load(self.key, self.decorated_datasource.fetch_data)
+
+    # Writes go through to the wrapped source and drop the now-stale entry
+    def write_data(self, data: str):
+        self.decorated_datasource.write_data(data)
+        self.invalidate()
+
+    def write_many(self, chunks: Sequence[str]):
+        self.decorated_datasource.write_many(chunks)
+        self.invalidate()
+
+    # Fusion: a cache lookup short-circuits the inner chain, so this layer stays a real call
+    def fusion_hooks(self):
+        return None
+
+    # Forces the next fetch to go down the chain again
+    def invalidate(self):
+        self.cache.invalidate(self.key)
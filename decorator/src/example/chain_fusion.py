@@ -0,0 +1,110 @@
+import logging
+from typing import Callable, Iterator, List, Sequence
+
+from src.example.base_decorator import DataSourceDecorator
+from src.example.data_source import DEFAULT_CHUNK_SIZE, DataSource
+
+logger = logging.getLogger(__name__)
+
+
+# Finds the class in `cls`'s MRO that defines attribute `name`
+def _defining_class(cls: type, name: str) -> type:
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+    raise AttributeError(name)
+
+
+# A layer is fusible only if its fusion_hooks were written alongside its fetch_data —
+# a subclass that overrides fetch_data but not fusion_hooks is kept as a real call.
+def _hooks_for(layer: DataSourceDecorator):
+    cls = type(layer)
+    if _defining_class(cls, "fetch_data") is not _defining_class(cls, "fusion_hooks"):
+        return None
+    return layer.fusion_hooks()
+
+
+# Freezes a decorator chain into a single callable.
+# Walks the chain once, collecting each layer's (before, after) hooks, then returns a closure
+# that runs the befores top-down, calls the innermost source, and applies the afters bottom-up.
+# Walking stops at the first layer that can't be fused; that layer is called as-is and
+# handles everything beneath it.
+# The chain is snapshotted — re-fuse after rewiring any decorated_datasource.
+def fuse_chain(datasource: DataSource) -> Callable[[], str]:
+    befores: List[Callable[[], None]] = []
+    afters: List[Callable[[str], str]] = []
+    fused_layers = 0
+
+    node = datasource
+    while isinstance(node, DataSourceDecorator):
+        hooks = _hooks_for(node)
+        if hooks is None:
+            break
+        before, after = hooks
+        if before is not None:
+            befores.append(before)
+        if after is not None:
+            afters.append(after)
+        fused_layers += 1
+        node = node.decorated_datasource
+
+    leaf = node.fetch_data
+    afters.reverse()                                                    # innermost transform first
+    logger.info("Fused %d layer(s) over %s", fused_layers, type(node).__name__)
+
+    # Specialize on what's present so the common cases skip empty loops
+    if not befores and not afters:
+        return leaf
+
+    before_steps = tuple(befores)
+    after_steps = tuple(afters)
+
+    if not before_steps:
+        if len(after_steps) == 1:
+            only = after_steps[0]
+            return lambda: only(leaf())
+
+        def fused_transforms() -> str:
+            data = leaf()
+            for step in after_steps:
+                data = step(data)
+            return data
+        return fused_transforms
+
+    def fused() -> str:
+        for step in before_steps:
+            step()
+        data = leaf()
+        for step in after_steps:
+            data = step(data)
+        return data
+    return fused
+
+
+# --- Fused Component ---
+# A DataSource backed by a fused chain — drop-in replacement for the original stack.
+class FusedDataSource(DataSource):
+
+    def __init__(self, datasource: DataSource):
+        # Keep the original chain for streaming, which still goes layer by layer
+        self.datasource = datasource
+        self._fused = fuse_chain(datasource)
+
+    def fetch_data(self) -> str:
+        return self._fused()
+
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        return self.datasource.iter_chunks(size)
+
+    # Writes aren't fused — they go through the original chain
+    def write_data(self, data: str):
+        self.datasource.write_data(data)
+
+    def write_many(self, chunks: Sequence[str]):
+        self.datasource.write_many(chunks)
+
+    def flush(self, fsync: bool = False):
+        self.datasource.flush(fsync)
+
+    def close(self):
+        self.datasource.close()
@@ -0,0 +1,310 @@
+import codecs
+import logging
+import lzma
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.example.base_decorator import DataSourceDecorator
+from src.example.data_source import DEFAULT_CHUNK_SIZE, DataSource
+
+logger = logging.getLogger(__name__)
+
+# DataSource speaks str, so compressed containers travel as latin-1 text:
+# every byte maps to exactly one code point, losslessly and without inflation.
+BINARY_TEXT = "latin-1"
+TEXT_ENCODING = "utf-8"
+
+# Container layout — frames are compressed independently, the index sits at the end
+# so containers can be written in one streaming pass:
+#   header  | frame 0 | frame 1 | ... | index (u32 compressed length per frame) | trailer
+_MAGIC = b"DSFZ"
+_HEADER = struct.Struct("<4sBBI")      # magic, version, codec id, frame size
+_TRAILER = struct.Struct("<QI4s")      # uncompressed size, frame count, magic
+_VERSION = 1
+_MAX_FRAME_SIZE = 0xFFFFFFFF           # frame size is stored as a u32
+
+# codec name -> (id, compress, decompress)
+CODECS: Dict[str, Tuple[int, Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (1, zlib.compress, zlib.decompress),
+    "lzma": (2, lzma.compress, lzma.decompress),
+}
+_CODEC_BY_ID = {codec_id: name for name, (codec_id, _, _) in CODECS.items()}
+
+
+# Worker entry points — module-level so the process pool can pickle them
+def _compress_frame(codec: str, frame: bytes) -> bytes:
+    return CODECS[codec][1](frame)
+
+
+def _decompress_frame(codec: str, frame: bytes) -> bytes:
+    return CODECS[codec][2](frame)
+
+
+# Parsed index of one container — where each frame lives, compressed and uncompressed.
+# Offsets are absolute within the bytes that were parsed, so several containers written
+# back to back (appends through write_data) can be indexed in place.
+@dataclass
+class FrameIndex():
+    codec: str
+    frame_size: int                 # uncompressed bytes per frame (last may be shorter)
+    total_size: int                 # uncompressed bytes overall
+    offsets: List[int]              # compressed start of each frame, plus end sentinel
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.offsets) - 1
+
+    # Start of this container's header
+    @property
+    def start(self) -> int:
+        return self.offsets[0] - _HEADER.size
+
+    # Parses the container that ends at byte `end`; malformed input raises ValueError
+    @classmethod
+    def parse(cls, data: bytes, end: int) -> "FrameIndex":
+        try:
+            return cls._parse(data, end)
+        except struct.error as e:
+            raise ValueError(f"corrupt frame container: {e}") from e
+
+    @classmethod
+    def _parse(cls, data: bytes, end: int) -> "FrameIndex":
+        if end < _HEADER.size + _TRAILER.size:
+            raise ValueError("not a compressed frame container")
+        total_size, count, tail_magic = _TRAILER.unpack_from(data, end - _TRAILER.size)
+        index_start = end - _TRAILER.size - 4 * count
+        if tail_magic != _MAGIC or index_start < _HEADER.size:
+            raise ValueError("not a compressed frame container")
+
+        lengths = struct.unpack_from(f"<{count}I", data, index_start)
+        start = index_start - sum(lengths) - _HEADER.size
+        if start < 0:
+            raise ValueError("corrupt frame index")
+        magic, version, codec_id, frame_size = _HEADER.unpack_from(data, start)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not a compressed frame container")
+        if codec_id not in _CODEC_BY_ID:
+            raise ValueError(f"unknown codec id {codec_id}")
+        if frame_size == 0:
+            raise ValueError("corrupt frame container: frame size 0")
+
+        offsets = [start + _HEADER.size]
+        for length in lengths:
+            offsets.append(offsets[-1] + length)
+        return cls(_CODEC_BY_ID[codec_id], frame_size, total_size, offsets)
+
+    # Indexes every container in `data`, first to last. Empty data holds no containers.
+    @classmethod
+    def parse_all(cls, data: bytes) -> List["FrameIndex"]:
+        indexes = []
+        end = len(data)
+        while end > 0:
+            index = cls.parse(data, end)
+            indexes.append(index)
+            end = index.start
+        indexes.reverse()
+        return indexes
+
+
+# Shared plumbing for both directions: frame (de)compression on a process pool.
+# Compression reads compress and writes decompress; decompression does the opposite,
+# so each needs both halves.
+class _FrameCodecMixin():
+
+    def _init_codec(self, codec: str, frame_size: int, executor: Optional[Executor],
+                    max_workers: Optional[int]):
+        if codec not in CODECS:
+            raise ValueError(f"unknown codec '{codec}', expected one of {sorted(CODECS)}")
+        if not 0 < frame_size <= _MAX_FRAME_SIZE:
+            raise ValueError(f"frame_size must be between 1 and {_MAX_FRAME_SIZE}, got {frame_size}")
+        self.codec = codec
+        self.frame_size = frame_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    # Runs fn(codec, frame) over frames, in order, with at most 2×workers frames in flight.
+    # A single frame is handled inline — not worth a round-trip to another process.
+    def _map_frames(self, fn, codec: str, frames: Iterable[bytes]) -> Iterator[bytes]:
+        frames = iter(frames)
+        first = next(frames, None)
+        if first is None:
+            return
+        second = next(frames, None)
+        if second is None:
+            yield fn(codec, first)
+            return
+
+        executor = self._get_executor()
+        window = 2 * self.max_workers
+        pending = deque([executor.submit(fn, codec, first), executor.submit(fn, codec, second)])
+        for frame in frames:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, codec, frame))
+        while pending:
+            yield pending.popleft().result()
+
+    # Compresses one whole payload into a container
+    def compress(self, data: str) -> str:
+        return b"".join(self._container_parts([data.encode(TEXT_ENCODING)])).decode(BINARY_TEXT)
+
+    # Decompresses one or more back-to-back containers into text
+    def decompress(self, container_text: str) -> str:
+        data = container_text.encode(BINARY_TEXT)
+        return b"".join(self._all_frames(data, FrameIndex.parse_all(data))).decode(TEXT_ENCODING)
+
+    # Yields header, compressed frames, then index + trailer
+    def _container_parts(self, raw_chunks: Iterable[bytes]) -> Iterator[bytes]:
+        codec_id = CODECS[self.codec][0]
+        yield _HEADER.pack(_MAGIC, _VERSION, codec_id, self.frame_size)
+
+        total = 0
+        lengths: List[int] = []
+
+        def frames() -> Iterator[bytes]:
+            nonlocal total
+            buffer = bytearray()
+            for chunk in raw_chunks:
+                total += len(chunk)
+                buffer += chunk
+                while len(buffer) >= self.frame_size:
+                    yield bytes(buffer[:self.frame_size])
+                    del buffer[:self.frame_size]
+            if buffer:
+                yield bytes(buffer)
+
+        for compressed in self._map_frames(_compress_frame, self.codec, frames()):
+            lengths.append(len(compressed))
+            yield compressed
+
+        logger.info("Compressed %d byte(s) into %d %s frame(s)", total, len(lengths), self.codec)
+        yield struct.pack(f"<{len(lengths)}I", *lengths)
+        yield _TRAILER.pack(total, len(lengths), _MAGIC)
+
+    # Decompresses frames [first, last) of one container
+    def _frames(self, data: bytes, index: FrameIndex, first: int, last: int) -> Iterator[bytes]:
+        offsets = index.offsets
+        frames = (data[offsets[i]:offsets[i + 1]] for i in range(first, last))
+        return self._map_frames(_decompress_frame, index.codec, frames)
+
+    def _all_frames(self, data: bytes, indexes: List[FrameIndex]) -> Iterator[bytes]:
+        for index in indexes:
+            yield from self._frames(data, index, 0, index.frame_count)
+
+    # Shuts down the pool if this decorator created it, then closes the wrapped source
+    def close(self):
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        super().close()
+
+
+# --- Concrete Decorator D ---
+# Compresses the wrapped source's data into independently compressed frames,
+# spread over a process pool. Output is a frame container carried as latin-1 text.
+# Writes go the other way: containers written here are stored decompressed.
+class CompressionDecorator(_FrameCodecMixin, DataSourceDecorator):
+
+    def __init__(self, decorated_datasource: DataSource, codec: str = "zlib",
+                 frame_size: int = 1024 * 1024, executor: Optional[Executor] = None,
+                 max_workers: Optional[int] = None):
+        super().__init__(decorated_datasource)
+        self._init_codec(codec, frame_size, executor, max_workers)
+
+    def fetch_data(self) -> str:
+        return self.compress(self.decorated_datasource.fetch_data())
+
+    # Streams the container: frames are compressed as soon as enough input has arrived,
+    # so memory stays at a few frames regardless of input size
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        raw = (chunk.encode(TEXT_ENCODING) for chunk in self.decorated_datasource.iter_chunks(size))
+        for part in self._container_parts(raw):
+            yield part.decode(BINARY_TEXT)
+
+    def write_data(self, data: str):
+        self.decorated_datasource.write_data(self.decompress(data))
+
+    def write_many(self, chunks: Sequence[str]):
+        self.decorated_datasource.write_many([self.decompress(chunk) for chunk in chunks])
+
+    # Fusion: compression is a pure transform of the inner result
+    def fusion_hooks(self):
+        return None, self.compress
+
+
+# --- Concrete Decorator E ---
+# Reverses CompressionDecorator — decompresses frames in parallel on a process pool.
+# The frame index makes partial reads cheaper on CPU: read_range() only decompresses the frames
+# it touches. It does not save I/O — the wrapped source has no ranged read, so the whole
+# container is still fetched (and, under a CompressionDecorator, compressed) first.
+# Writes are compressed, each into its own container; reads handle back-to-back containers.
+class DecompressionDecorator(_FrameCodecMixin, DataSourceDecorator):
+
+    def __init__(self, decorated_datasource: DataSource, codec: str = "zlib",
+                 frame_size: int = 1024 * 1024, executor: Optional[Executor] = None,
+                 max_workers: Optional[int] = None):
+        super().__init__(decorated_datasource)
+        # codec/frame_size apply to writes — reads take them from each container's header
+        self._init_codec(codec, frame_size, executor, max_workers)
+
+    def fetch_data(self) -> str:
+        return self.decompress(self.decorated_datasource.fetch_data())
+
+    # Streams decompressed text frame by frame.
+    # The index is at the end of the container, so the (compressed) container is fetched whole.
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        data = self.decorated_datasource.fetch_data().encode(BINARY_TEXT)
+        decoder = codecs.getincrementaldecoder(TEXT_ENCODING)()
+        for frame in self._all_frames(data, FrameIndex.parse_all(data)):
+            text = decoder.decode(frame)
+            for start in range(0, len(text), size):
+                yield text[start:start + size]
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    # Returns uncompressed bytes [start, start + length), decompressing only the frames covering them.
+    # The compressed container is fetched whole through the chain — only decompression is skipped.
+    def read_range(self, start: int, length: int) -> bytes:
+        if start < 0 or length < 0:
+            raise ValueError("start and length must be non-negative")
+        data = self.decorated_datasource.fetch_data().encode(BINARY_TEXT)
+        end = start + length
+        parts = []
+
+        # Walk containers, tracking where each one starts in the uncompressed stream
+        base = 0
+        for index in FrameIndex.parse_all(data):
+            lo = max(start, base)
+            hi = min(end, base + index.total_size)
+            if lo < hi:
+                first = (lo - base) // index.frame_size
+                last = (hi - base - 1) // index.frame_size + 1
+                chunk = b"".join(self._frames(data, index, first, last))
+                offset = base + first * index.frame_size
+                parts.append(chunk[lo - offset:hi - offset])
+            base += index.total_size
+            if base >= end:
+                break
+        return b"".join(parts)
+
+    def write_data(self, data: str):
+        self.decorated_datasource.write_data(self.compress(data))
+
+    def write_many(self, chunks: Sequence[str]):
+        self.decorated_datasource.write_many([self.compress(chunk) for chunk in chunks])
+
+    # Fusion: decompression is a pure transform of the inner result
+    def fusion_hooks(self):
+        return None, self.decompress
@@ -1,4 +1,15 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Iterator, Sequence
+
+# Default chunk size for streaming reads (64 KiB)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+# A chunk size below 1 would stream nothing (or never advance) instead of the data
+def check_chunk_size(size: int):
+    if size <= 0:
+        raise ValueError("chunk size must be positive")
 
 
 # --- Component Interface ---
@@ -9,3 +20,42 @@ class DataSource(ABC):
     @abstractmethod
     def fetch_data(self) -> str:
         pass
+
+    # Streams the data in chunks of at most `size` characters.
+    # Default: slice the fully fetched payload — sources that can stream override this.
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        check_chunk_size(size)
+        data = self.fetch_data()
+        for start in range(0, len(data), size):
+            yield data[start:start + size]
+
+    # Async variant of fetch_data.
+    # Default: run the blocking fetch on the loop's executor so it can't stall other tasks —
+    # sources with real async I/O override this.
+    async def afetch_data(self) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.fetch_data)
+
+    # Writes one piece of data (appended). Read-only sources keep this default.
+    def write_data(self, data: str):
+        raise NotImplementedError(f"{type(self).__name__} does not support writes")
+
+    # Writes several pieces in order.
+    # Default: one write_data per piece — sinks that can batch (e.g. writev) override this.
+    def write_many(self, chunks: Sequence[str]):
+        for chunk in chunks:
+            self.write_data(chunk)
+
+    # Pushes any buffered writes down; with fsync=True also asks the OS to persist them
+    def flush(self, fsync: bool = False):
+        pass
+
+    # Releases resources (open files, worker pools)
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,46 @@
+import asyncio
+import logging
+from typing import List, Sequence
+
+from src.example.data_source import DataSource
+
+logger = logging.getLogger(__name__)
+
+
+# --- Composite Component ---
+# Fans in many data sources (each possibly a decorator chain) into one.
+# The async path fetches them concurrently, at most `max_concurrency` at a time,
+# and keeps results in input order. Decorators stack on top like any other source.
+class FanInDataSource(DataSource):
+
+    def __init__(self, sources: Sequence[DataSource], max_concurrency: int = 16, separator: str = "\n"):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.sources = list(sources)
+        self.max_concurrency = max_concurrency
+        self.separator = separator              # joins results for fetch_data/afetch_data
+
+    # Sync path — one source after another
+    def fetch_data(self) -> str:
+        return self.separator.join(source.fetch_data() for source in self.sources)
+
+    async def afetch_data(self) -> str:
+        return self.separator.join(await self.afetch_all())
+
+    # Fetches every source concurrently; results come back in input order.
+    # The first failure propagates and cancels the remaining fetches.
+    async def afetch_all(self) -> List[str]:
+        logger.info("Fetching %d source(s), up to %d at a time", len(self.sources), self.max_concurrency)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(source: DataSource) -> str:
+            async with semaphore:
+                return await source.afetch_data()
+
+        tasks = [asyncio.ensure_future(fetch_one(source)) for source in self.sources]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
@@ -1,4 +1,20 @@
-from src.example.data_source import DataSource
+import codecs
+import os
+from typing import Iterator, Optional, Sequence
+
+from src.example.data_source import DEFAULT_CHUNK_SIZE, DataSource, check_chunk_size
+
+
+# Most buffers one writev() takes. sysconf reports -1 when the limit is unknown or there is none.
+def _iov_max() -> int:
+    try:
+        iov_max = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        return 1024
+    return iov_max if iov_max > 0 else 1024
+
+
+_IOV_MAX = _iov_max()
 
 
 # --- Concrete Component ---
@@ -6,6 +22,93 @@ from src.example.data_source import DataSource
 # Returns raw data without any modifications.
 class FileDataSource(DataSource):
 
-    # Simulates reading data from a file
+    def __init__(self, path: Optional[str] = None, encoding: str = "utf-8"):
+        # No path → simulated file (keeps the demo self-contained)
+        self.path = path
+        self.encoding = encoding
+        self._write_fd: Optional[int] = None     # opened on first write, kept for later ones
+
+    # Reads the whole file (or simulates it when no path is given)
     def fetch_data(self) -> str:
-        return "fetching data"
+        if self.path is None:
+            return "fetching data"
+        # newline="" keeps the bytes exact — the same text iter_chunks() yields
+        with open(self.path, "r", encoding=self.encoding, newline="") as f:
+            return f.read()
+
+    # Async: the simulated file needs no I/O; real files are read on the executor
+    async def afetch_data(self) -> str:
+        if self.path is None:
+            return "fetching data"
+        return await super().afetch_data()
+
+    # Streams the file through one reused buffer — memory stays at `size` bytes
+    # no matter how large the file is.
+    # The incremental decoder carries multi-byte characters split across reads.
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        # Checked here, not in the generator, so a bad size fails at the call
+        check_chunk_size(size)
+        if self.path is None:
+            return super().iter_chunks(size)
+        return self._read_chunks(size)
+
+    def _read_chunks(self, size: int) -> Iterator[str]:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        with open(self.path, "rb", buffering=0) as f:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                text = decoder.decode(view[:n])
+                if text:
+                    yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    # Appends to the file — one write syscall per call
+    def write_data(self, data: str):
+        self._write_all(data.encode(self.encoding))
+
+    # Appends several pieces with a single writev() where the OS supports it
+    def write_many(self, chunks: Sequence[str]):
+        if not chunks:
+            return
+        buffers = [chunk.encode(self.encoding) for chunk in chunks]
+        if not hasattr(os, "writev"):
+            self._write_all(b"".join(buffers))
+            return
+
+        fd = self._fd()
+        for start in range(0, len(buffers), _IOV_MAX):
+            batch = buffers[start:start + _IOV_MAX]
+            expected = sum(map(len, batch))
+            written = os.writev(fd, batch)
+            # Short write — finish the remainder the slow way
+            if written < expected:
+                self._write_all(b"".join(batch)[written:])
+
+    # fsync=True forces written data to disk before returning
+    def flush(self, fsync: bool = False):
+        if fsync and self._write_fd is not None:
+            os.fsync(self._write_fd)
+
+    def close(self):
+        if self._write_fd is not None:
+            os.close(self._write_fd)
+            self._write_fd = None
+
+    def _fd(self) -> int:
+        if self.path is None:
+            raise ValueError("FileDataSource without a path is read-only")
+        if self._write_fd is None:
+            self._write_fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._write_fd
+
+    def _write_all(self, payload: bytes):
+        fd = self._fd()
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
@@ -0,0 +1,197 @@
+import logging
+import time
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from src.example.base_decorator import DataSourceDecorator
+from src.example.data_source import DEFAULT_CHUNK_SIZE, DataSource
+
+logger = logging.getLogger(__name__)
+
+_perf_counter_ns = time.perf_counter_ns
+
+
+# Latency histogram with power-of-two nanosecond buckets: bucket i holds [2^(i-1), 2^i) ns.
+# Recording is one bit_length() and one list increment; percentiles are bucket upper bounds.
+class LatencyHistogram():
+
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns: int):
+        self.buckets[ns.bit_length()] += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    # Derived rather than kept, to save a write per call
+    @property
+    def count(self) -> int:
+        return sum(self.buckets)
+
+    @property
+    def mean_ns(self) -> float:
+        count = self.count
+        return self.total_ns / count if count else 0.0
+
+    # Upper bound (ns) of the bucket holding the p-th percentile, 0 < p <= 100
+    def percentile(self, p: float) -> int:
+        count = self.count
+        if not count:
+            return 0
+        rank = count * p / 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(1 << i, self.max_ns)
+        return self.max_ns
+
+
+OPERATIONS = ("fetch", "afetch", "stream", "write")
+
+
+# Per-operation counters for one instrumented layer
+class OperationStats():
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.calls = 0
+        self.chars = 0              # payload size moved through this operation
+        self.errors = 0
+
+
+# --- Concrete Decorator G ---
+# Low-overhead instrumentation — a hot-path alternative to LoggingDecorator.
+# Times every call with perf_counter_ns into a histogram and counts payload size, but only
+# logs every `sample_every`-th call plus calls slower than `slow_ms`, and never the payload.
+# When disabled it's a plain pass-through, and chain fusion drops it entirely.
+# Counters aren't locked: under heavy multi-threaded use they're approximate.
+class InstrumentationDecorator(DataSourceDecorator):
+
+    def __init__(self, decorated_datasource: DataSource, name: Optional[str] = None,
+                 sample_every: int = 1000, slow_ms: Optional[float] = 100.0, enabled: bool = True):
+        super().__init__(decorated_datasource)
+        self.name = name or type(decorated_datasource).__name__
+        self.sample_every = sample_every                # 0 = never sample
+        self.slow_ns = None if slow_ms is None else int(slow_ms * 1e6)
+        self.enabled = enabled
+        self.stats: Dict[str, OperationStats] = {op: OperationStats() for op in OPERATIONS}
+
+    def fetch_data(self):
+        if not self.enabled:
+            return self.decorated_datasource.fetch_data()
+        start = _perf_counter_ns()
+        try:
+            data = self.decorated_datasource.fetch_data()
+        except Exception:
+            self.stats["fetch"].errors += 1
+            raise
+        self._record("fetch", _perf_counter_ns() - start, len(data))
+        return data
+
+    async def afetch_data(self):
+        if not self.enabled:
+            return await self.decorated_datasource.afetch_data()
+        start = _perf_counter_ns()
+        try:
+            data = await self.decorated_datasource.afetch_data()
+        except Exception:
+            self.stats["afetch"].errors += 1
+            raise
+        self._record("afetch", _perf_counter_ns() - start, len(data))
+        return data
+
+    # Times the whole stream, from first pull to exhaustion
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        if not self.enabled:
+            yield from self.decorated_datasource.iter_chunks(size)
+            return
+        start = _perf_counter_ns()
+        chars = 0
+        for chunk in self.decorated_datasource.iter_chunks(size):
+            chars += len(chunk)
+            yield chunk
+        self._record("stream", _perf_counter_ns() - start, chars)
+
+    def write_data(self, data: str):
+        if not self.enabled:
+            self.decorated_datasource.write_data(data)
+            return
+        start = _perf_counter_ns()
+        try:
+            self.decorated_datasource.write_data(data)
+        except Exception:
+            self.stats["write"].errors += 1
+            raise
+        self._record("write", _perf_counter_ns() - start, len(data))
+
+    def write_many(self, chunks: Sequence[str]):
+        if not self.enabled:
+            self.decorated_datasource.write_many(chunks)
+            return
+        start = _perf_counter_ns()
+        try:
+            self.decorated_datasource.write_many(chunks)
+        except Exception:
+            self.stats["write"].errors += 1
+            raise
+        self._record("write", _perf_counter_ns() - start, sum(map(len, chunks)))
+
+    # Fusion: disabled instruments vanish; enabled ones must time the real call
+    def fusion_hooks(self):
+        return (None, None) if not self.enabled else None
+
+    def _record(self, operation: str, ns: int, chars: int):
+        stats = self.stats[operation]
+        stats.latency.record(ns)
+        stats.calls += 1
+        stats.chars += chars
+        if self.slow_ns is not None and ns >= self.slow_ns:
+            logger.warning("[%s] slow %s: %.2f ms, %d char(s)", self.name, operation, ns / 1e6, chars)
+        elif self.sample_every and stats.calls % self.sample_every == 0:
+            logger.info("[%s] sampled %s #%d: %.3f ms, %d char(s)",
+                        self.name, operation, stats.calls, ns / 1e6, chars)
+
+
+# Inserts an InstrumentationDecorator above every layer of a chain, in place.
+# Returns the new top of the chain and the instruments, outermost first —
+# pass the instruments to format_report() to see which layer is slow.
+def instrument_chain(datasource: DataSource, **options):
+    instruments: List[InstrumentationDecorator] = []
+    depth = 0
+    node = datasource
+    top = None
+    parent: Optional[DataSourceDecorator] = None
+    while True:
+        instrument = InstrumentationDecorator(node, name=f"{depth}:{type(node).__name__}", **options)
+        instruments.append(instrument)
+        if parent is None:
+            top = instrument
+        else:
+            parent.decorated_datasource = instrument
+        if not isinstance(node, DataSourceDecorator):
+            break
+        parent = node
+        node = node.decorated_datasource
+        depth += 1
+    return top, instruments
+
+
+# Per-layer report lines. Self time is a layer's time minus the time of the layer below it.
+def format_report(instruments: Sequence[InstrumentationDecorator], operation: str = "fetch") -> List[str]:
+    lines = []
+    for i, instrument in enumerate(instruments):
+        stats = instrument.stats[operation]
+        if not stats.calls:
+            continue
+        below = instruments[i + 1].stats[operation] if i + 1 < len(instruments) else None
+        self_ns = stats.latency.total_ns - (below.latency.total_ns if below else 0)
+        latency = stats.latency
+        lines.append(
+            f"{instrument.name:<28} calls {stats.calls:>8} | mean {latency.mean_ns / 1e3:9.2f} us | "
+            f"p99 <= {latency.percentile(99) / 1e3:9.2f} us | self {self_ns / stats.calls / 1e3:9.2f} us | "
+            f"{stats.chars} char(s) | {stats.errors} error(s)"
+        )
+    return lines
@@ -1,6 +1,8 @@
 import logging
+from typing import Iterator, Sequence
 
 from src.example.base_decorator import DataSourceDecorator
+from src.example.data_source import DEFAULT_CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -14,4 +16,45 @@ class LoggingDecorator(DataSourceDecorator):
         logger.info("Logging Fetch Action")
         data = self.decorated_datasource.fetch_data()
         logger.info("Data fetched: %s", data)
-        return data
\ No newline at end of file
+        return data
+
+    # Async: same log lines around the awaited fetch
+    async def afetch_data(self):
+        logger.info("Logging Fetch Action")
+        data = await self.decorated_datasource.afetch_data()
+        logger.info("Data fetched: %s", data)
+        return data
+
+    # Streaming logs a summary instead of the payload — chunks may add up to gigabytes
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        logger.info("Logging Stream Action (chunk size %d)", size)
+        chunks = 0
+        chars = 0
+        for chunk in self.decorated_datasource.iter_chunks(size):
+            chunks += 1
+            chars += len(chunk)
+            yield chunk
+        logger.info("Data streamed: %d chunk(s), %d char(s)", chunks, chars)
+
+    # Writes are logged like fetches
+    def write_data(self, data: str):
+        logger.info("Logging Write Action")
+        self.decorated_datasource.write_data(data)
+        logger.info("Data written: %s", data)
+
+    # Batches log a summary — one line per batch, not per piece
+    def write_many(self, chunks: Sequence[str]):
+        logger.info("Logging Batch Write Action (%d piece(s))", len(chunks))
+        self.decorated_datasource.write_many(chunks)
+        logger.info("Data written: %d piece(s), %d char(s)", len(chunks), sum(map(len, chunks)))
+
+    # Fusion: same two log lines around the inner fetch
+    def fusion_hooks(self):
+        def before():
+            logger.info("Logging Fetch Action")
+
+        def after(data):
+            logger.info("Data fetched: %s", data)
+            return data
+
+        return before, after
@@ -0,0 +1,96 @@
+import glob
+import logging
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, Sequence, Tuple, Union
+
+from src.example.data_source import DEFAULT_CHUNK_SIZE, DataSource, check_chunk_size
+from src.example.file_data_source import FileDataSource
+
+logger = logging.getLogger(__name__)
+
+ORDER_INPUT = "input"             # results follow the order of `paths`
+ORDER_COMPLETION = "completion"   # results come as soon as each file is read
+
+
+# --- Composite Component ---
+# Reads many files (a glob pattern or a list of paths) on a bounded thread pool.
+# At most `max_buffered_bytes` of file data is held at once — counting files being read
+# and files read but not yet consumed — so thousands of shards don't pile up in memory.
+# A single file larger than the cap is still read, on its own.
+# Decorators stack on top like any other source.
+class MultiFileDataSource(DataSource):
+
+    def __init__(self, paths: Union[str, Sequence[str]], max_workers: int = 8,
+                 order: str = ORDER_INPUT, max_buffered_bytes: int = 64 * 1024 * 1024,
+                 encoding: str = "utf-8", separator: str = ""):
+        if order not in (ORDER_INPUT, ORDER_COMPLETION):
+            raise ValueError(f"unknown order '{order}', expected '{ORDER_INPUT}' or '{ORDER_COMPLETION}'")
+        # A string is a glob pattern; sorted so input order is deterministic
+        self.paths = sorted(glob.glob(paths, recursive=True)) if isinstance(paths, str) else list(paths)
+        self.max_workers = max_workers
+        self.order = order
+        self.max_buffered_bytes = max_buffered_bytes
+        self.encoding = encoding
+        self.separator = separator          # joins file contents in fetch_data
+
+    # Materializes every file — prefer iter_files()/iter_chunks() for large sets
+    def fetch_data(self) -> str:
+        return self.separator.join(data for _, data in self.iter_files())
+
+    # Streams file contents in the configured order, cut into chunks of at most `size`
+    def iter_chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        check_chunk_size(size)
+        first = True
+        for _, data in self.iter_files():
+            if self.separator and not first:
+                yield self.separator
+            first = False
+            for start in range(0, len(data), size):
+                yield data[start:start + size]
+
+    # Yields (path, content) pairs, reading ahead on the thread pool within the memory cap
+    def iter_files(self) -> Iterator[Tuple[str, str]]:
+        logger.info("Reading %d file(s) with %d worker(s), %s order",
+                    len(self.paths), self.max_workers, self.order)
+        pending = deque(enumerate(self.paths))
+        in_flight: Dict = {}                        # future -> (seq, path, size)
+        ready: Dict[int, Tuple[str, str, int]] = {} # seq -> (path, data, size), input order only
+        next_seq = 0
+        held = 0                                    # bytes in flight or waiting to be consumed
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            try:
+                while pending or in_flight:
+                    # Top up the pool without going over the memory cap
+                    while pending and len(in_flight) < self.max_workers:
+                        seq, path = pending[0]
+                        size = os.path.getsize(path)
+                        if held and held + size > self.max_buffered_bytes:
+                            break
+                        pending.popleft()
+                        held += size
+                        future = pool.submit(FileDataSource(path, self.encoding).fetch_data)
+                        in_flight[future] = (seq, path, size)
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        seq, path, size = in_flight.pop(future)
+                        data = future.result()
+                        if self.order == ORDER_COMPLETION:
+                            held -= size
+                            yield path, data
+                        else:
+                            ready[seq] = (path, data, size)
+
+                    # Release the in-order prefix that's now complete
+                    while next_seq in ready:
+                        path, data, size = ready.pop(next_seq)
+                        next_seq += 1
+                        held -= size
+                        yield path, data
+            finally:
+                # Stopped early or failed — don't start reads nobody will consume
+                for future in in_flight:
+                    future.cancel()
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from src.example.base_decorator import DataSourceDecorator
 
 
@@ -8,3 +10,22 @@ class UppercaseDecorator(DataSourceDecorator):
     # Fetch from wrapped source, then transform to uppercase
     def fetch_data(self):
         return self.decorated_datasource.fetch_data().upper()
+
+    # Async: await the wrapped source, then transform
+    async def afetch_data(self):
+        return (await self.decorated_datasource.afetch_data()).upper()
+
+    # Uppercasing is character-local, so each chunk can be transformed on its own
+    def transform_chunk(self, chunk: str) -> str:
+        return chunk.upper()
+
+    # Writes are uppercased on the way down too
+    def write_data(self, data: str):
+        self.decorated_datasource.write_data(data.upper())
+
+    def write_many(self, chunks: Sequence[str]):
+        self.decorated_datasource.write_many([chunk.upper() for chunk in chunks])
+
+    # Fusion: no pre-step, uppercase the inner result
+    def fusion_hooks(self):
+        return None, str.upper